@@ -0,0 +1,338 @@
+"""Сквозные бенчмарки клиента против локальной заглушки API.
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.e2e
+    python -m benchmarks.e2e --products 20000 --moves 1000 --latency 0.02 --rate-limit 45
+    python -m benchmarks.e2e --scenarios get_variants,get_moves --json results.json
+
+Для каждого сценария измеряются запросы в секунду, строки в секунду и пик
+памяти (tracemalloc, отдельным прогоном, чтобы трассировка не искажала время).
+Пик памяти включает буферы заглушки, которая работает в том же процессе.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta, timezone
+from typing import Any, Awaitable, Callable
+from uuid import UUID, uuid4
+
+os.environ.setdefault("MOY_SKLAD_ACCESS_TOKEN", "benchmark")
+os.environ.setdefault("MOY_SKLAD_REQUEST_ATTEMPTS", "5")
+os.environ.setdefault("MOY_SKLAD_ATTEMPT_TIMEOUT", "1")
+
+from moy_sklad_api import (  # noqa: E402
+    DemandDTO,
+    ExpandStrategy,
+    InventoryDTO,
+    MoveDTO,
+    MoySkladAPIClient,
+    ProductType,
+    RateLimiter,
+    RetryPolicy,
+)
+from moy_sklad_api.dtos import DemandPositionDTO, InventoryPositionDTO, MovePositionDTO  # noqa: E402
+
+from benchmarks.fake_server import FakeMoySklad, FakeServerConfig  # noqa: E402
+
+PROJECT_TZ = timezone(timedelta(hours=3))
+PERIOD_FROM = datetime(2024, 1, 1, tzinfo=PROJECT_TZ)
+PERIOD_TO = datetime(2024, 1, 31, 23, 59, 59, tzinfo=PROJECT_TZ)
+
+Scenario = Callable[[MoySkladAPIClient, "ScenarioInput"], Awaitable[int]]
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioInput:
+    warehouse_id: UUID
+    moves: list[MoveDTO]
+    inventories: list[InventoryDTO]
+    demands: list[DemandDTO]
+
+
+@dataclass(frozen=True, slots=True)
+class ScenarioResult:
+    name: str
+    seconds: float
+    requests: int
+    throttled: int
+    rows: int
+    response_bytes: int
+    peak_memory: int | None
+
+    @property
+    def requests_per_second(self) -> float:
+        return self.requests / self.seconds if self.seconds else 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.seconds if self.seconds else 0.0
+
+
+async def _get_variants(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return len(await client.get_variants())
+
+
+async def _get_moves(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return len(await client.get_moves(from_date=PERIOD_FROM, to_date=PERIOD_TO))
+
+
+async def _get_moves_compact(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return len(await client.get_moves(from_date=PERIOD_FROM, to_date=PERIOD_TO, compact=True))
+
+
+async def _get_moves_references(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return len(await client.get_moves(from_date=PERIOD_FROM, to_date=PERIOD_TO, expand=ExpandStrategy.REFERENCES))
+
+
+async def _get_moves_resolve(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return len(await client.get_moves(from_date=PERIOD_FROM, to_date=PERIOD_TO, expand=ExpandStrategy.RESOLVE))
+
+
+async def _get_inventories(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return len(await client.get_inventories(from_date=PERIOD_FROM, to_date=PERIOD_TO))
+
+
+async def _stocks_with_moment(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return len(await client.get_warehouse_stocks_with_moment())
+
+
+async def _current_stocks(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return len(await client.get_warehouse_current_stocks(data.warehouse_id))
+
+
+async def _create_moves(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return sum(result.ok for result in await client.create_moves(data.moves))
+
+
+async def _create_inventories(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return sum(result.ok for result in await client.create_inventories(data.inventories))
+
+
+async def _create_demands(client: MoySkladAPIClient, data: ScenarioInput) -> int:
+    return sum(result.ok for result in await client.create_demands(data.demands))
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "get_variants": _get_variants,
+    "get_moves": _get_moves,
+    "get_moves_compact": _get_moves_compact,
+    "get_moves_references": _get_moves_references,
+    "get_moves_resolve": _get_moves_resolve,
+    "get_inventories": _get_inventories,
+    "stocks_with_moment": _stocks_with_moment,
+    "current_stocks": _current_stocks,
+    "create_moves": _create_moves,
+    "create_inventories": _create_inventories,
+    "create_demands": _create_demands,
+}
+
+
+def build_input(documents: int, positions: int) -> ScenarioInput:
+    """Документы для сценариев создания: по ``positions`` позиций в каждом."""
+    organization_id, project_id, agent_id, channel_id = uuid4(), uuid4(), uuid4(), uuid4()
+    warehouses = [uuid4() for _ in range(5)]
+    products = [uuid4() for _ in range(max(positions, 1) * 4)]
+    moment = datetime(2024, 1, 15, 12, tzinfo=PROJECT_TZ)
+
+    def product(index: int, number: int) -> UUID:
+        return products[(index + number) % len(products)]
+
+    return ScenarioInput(
+        warehouse_id=warehouses[0],
+        moves=[
+            MoveDTO(
+                source_store_id=warehouses[index % 5],
+                target_store_id=warehouses[(index + 1) % 5],
+                positions=[
+                    MovePositionDTO(product_id=product(index, number), product_type=ProductType.SINGLE_PRODUCT, quantity=1)
+                    for number in range(positions)
+                ],
+                moment=moment,
+                organization_id=organization_id,
+                project_id=project_id,
+            )
+            for index in range(documents)
+        ],
+        inventories=[
+            InventoryDTO(
+                organization_id=organization_id,
+                warehouse_id=warehouses[index % 5],
+                positions=[
+                    InventoryPositionDTO(product_id=product(index, number), product_type=ProductType.SINGLE_PRODUCT, quantity=2)
+                    for number in range(positions)
+                ],
+                moment=moment,
+            )
+            for index in range(documents)
+        ],
+        demands=[
+            DemandDTO(
+                warehouse_id=warehouses[index % 5],
+                positions=[
+                    DemandPositionDTO(
+                        product_id=product(index, number),
+                        product_type=ProductType.SINGLE_PRODUCT,
+                        quantity=1,
+                        price=10000,
+                    )
+                    for number in range(positions)
+                ],
+                moment=moment,
+                organization_id=organization_id,
+                agent_id=agent_id,
+                project_id=project_id,
+                sales_channel_id=channel_id,
+            )
+            for index in range(documents)
+        ],
+    )
+
+
+def create_client(server: FakeMoySklad, **client_options: Any) -> MoySkladAPIClient:
+    config = server.config
+
+    # Без лимита на заглушке ограничитель клиента не должен быть узким местом.
+    rate_limiter = RateLimiter(limit=1_000_000, interval=1.0, max_parallel=20) if config.rate_limit is None else None
+    return MoySkladAPIClient(
+        base_url=server.base_url,
+        rate_limiter=rate_limiter,
+        retry_policy=RetryPolicy(attempts=10, base_delay=0.05, max_delay=config.rate_interval),
+        shared_session=False,
+        **client_options,
+    )
+
+
+async def _run_once(server: FakeMoySklad, scenario: Scenario, data: ScenarioInput) -> tuple[int, float]:
+    async with create_client(server) as client:
+        started_at = time.perf_counter()
+        rows = await scenario(client, data)
+        return rows, time.perf_counter() - started_at
+
+
+def run_scenario(
+        server: FakeMoySklad,
+        name: str,
+        data: ScenarioInput,
+        *,
+        repeat: int = 3,
+        memory: bool = True,
+) -> ScenarioResult:
+    """Лучшее из ``repeat`` времён и, если нужно, пик памяти отдельным прогоном."""
+    scenario = SCENARIOS[name]
+    best: tuple[float, int, int, int, int] | None = None
+
+    for _ in range(repeat):
+        gc.collect()
+        server.reset_stats()
+        rows, seconds = asyncio.run(_run_once(server, scenario, data))
+        stats = server.stats
+
+        if best is None or seconds < best[0]:
+            best = (seconds, rows, stats.requests, stats.throttled, stats.response_bytes)
+
+    peak_memory = None
+
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+
+        try:
+            asyncio.run(_run_once(server, scenario, data))
+            peak_memory = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    seconds, rows, requests, throttled, response_bytes = best
+    return ScenarioResult(name, seconds, requests, throttled, rows, response_bytes, peak_memory)
+
+
+def format_results(results: list[ScenarioResult]) -> str:
+    header = f"{'сценарий':<22}{'время, с':>10}{'запросов':>10}{'429':>6}{'строк':>10}{'запр/с':>10}{'строк/с':>12}{'пик, МБ':>10}"
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        peak = "-" if result.peak_memory is None else f"{result.peak_memory / 2 ** 20:.1f}"
+        lines.append(
+            f"{result.name:<22}{result.seconds:>10.3f}{result.requests:>10}{result.throttled:>6}{result.rows:>10}"
+            f"{result.requests_per_second:>10.1f}{result.rows_per_second:>12.0f}{peak:>10}"
+        )
+
+    return "\n".join(lines)
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    defaults = FakeServerConfig()
+    parser = argparse.ArgumentParser(description="Сквозные бенчмарки клиента МойСклад на локальной заглушке.")
+    parser.add_argument("--scenarios", default=",".join(SCENARIOS), help="сценарии через запятую")
+    parser.add_argument("--products", type=int, default=defaults.products)
+    parser.add_argument("--variants-per-product", type=int, default=defaults.variants_per_product)
+    parser.add_argument("--moves", type=int, default=defaults.moves)
+    parser.add_argument("--inventories", type=int, default=defaults.inventories)
+    parser.add_argument("--positions", type=int, default=defaults.positions_per_document)
+    parser.add_argument("--create-documents", type=int, default=500, help="документов в сценариях create_*")
+    parser.add_argument("--latency", type=float, default=defaults.latency, help="задержка ответа, с")
+    parser.add_argument("--no-gzip", action="store_true")
+    parser.add_argument("--rate-limit", type=int, default=None, help="запросов за --rate-interval, иначе без лимита")
+    parser.add_argument("--rate-interval", type=float, default=defaults.rate_interval)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--no-memory", action="store_true", help="не измерять пик памяти")
+    parser.add_argument("--json", dest="json_path", help="сохранить результаты в JSON")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    names = [name.strip() for name in args.scenarios.split(",") if name.strip()]
+    unknown = [name for name in names if name not in SCENARIOS]
+
+    if unknown:
+        print(f"Неизвестные сценарии: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    config = FakeServerConfig(
+        products=args.products,
+        variants_per_product=args.variants_per_product,
+        moves=args.moves,
+        inventories=args.inventories,
+        positions_per_document=args.positions,
+        latency=args.latency,
+        gzip=not args.no_gzip,
+        rate_limit=args.rate_limit,
+        rate_interval=args.rate_interval,
+    )
+    data = build_input(args.create_documents, args.positions)
+
+    with FakeMoySklad(config) as server:
+        results = [
+            run_scenario(server, name, data, repeat=args.repeat, memory=not args.no_memory)
+            for name in names
+        ]
+
+    print(format_results(results))
+
+    if args.json_path:
+        with open(args.json_path, "w", encoding="utf-8") as file:
+            payload = {
+                "config": asdict(config),
+                "results": [
+                    {**asdict(result), "requests_per_second": result.requests_per_second, "rows_per_second": result.rows_per_second}
+                    for result in results
+                ],
+            }
+            json.dump(payload, file, ensure_ascii=False, indent=2)
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
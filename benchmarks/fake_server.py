@@ -0,0 +1,503 @@
+"""Локальная заглушка API МойСклад для бенчмарков.
+
+Сервер отвечает на ``/entity/*`` и ``/report/*`` синтетическими данными в формате
+API: offset-пагинация с ``meta.size``, ``expand`` вложенных сущностей и позиций
+(не больше 100 позиций в списке, остальные — через ``/positions``), gzip,
+искусственная задержка и лимит запросов с ответами 429.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any
+
+from aiohttp import web
+
+API_PREFIX = "/api/remap/1.2"
+MAX_PAGE_SIZE = 1000
+MAX_EXPANDED_PAGE_SIZE = 100
+MAX_INLINE_POSITIONS = 100
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class FakeServerConfig:
+    products: int = 2000
+    variants_per_product: int = 2
+    warehouses: int = 5
+    moves: int = 300
+    inventories: int = 100
+    bundles: int = 200
+    components_per_bundle: int = 5
+    positions_per_document: int = 40
+    # Каждый N-й документ получает больше позиций, чем помещается в список.
+    large_document_every: int = 10
+    large_document_positions: int = 250
+    latency: float = 0.0
+    gzip: bool = True
+    # Лимит МойСклад: 45 запросов за 3 секунды; None — без лимита.
+    rate_limit: int | None = None
+    rate_interval: float = 3.0
+
+
+@dataclass(slots=True)
+class FakeServerStats:
+    requests: int = 0
+    throttled: int = 0
+    response_bytes: int = 0
+    by_endpoint: dict[str, int] = field(default_factory=dict)
+
+
+def _id(kind: int, index: int) -> str:
+    return str(uuid.UUID(int=(kind << 96) | index))
+
+
+class FakeMoySklad:
+    def __init__(self, config: FakeServerConfig = FakeServerConfig()) -> None:
+        self.config = config
+        self.stats = FakeServerStats()
+        self.base_url = ""
+
+        self._origin = "https://api.moysklad.ru"
+        self._window_started_at = time.monotonic()
+        self._window_requests = 0
+        self._data: dict[str, list[dict[str, Any]]] = {}
+        self._documents: dict[str, dict[str, Any]] = {}
+
+        self._runner: web.AppRunner | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+
+    # --- синтетические данные -------------------------------------------------
+
+    def _meta(self, entity_type: str, entity_id: str, **extra: Any) -> dict[str, Any]:
+        return {
+            "href": f"{self._origin}{API_PREFIX}/entity/{entity_type}/{entity_id}",
+            "metadataHref": f"{self._origin}{API_PREFIX}/entity/{entity_type}/metadata",
+            "type": entity_type,
+            "mediaType": "application/json",
+            **extra,
+        }
+
+    def _product(self, index: int) -> dict[str, Any]:
+        product_id = _id(1, index)
+        return {
+            "meta": self._meta("product", product_id),
+            "id": product_id,
+            "accountId": _id(0, 1),
+            "updated": f"2024-01-{index % 28 + 1:02d} 12:00:00.000",
+            "name": f"Товар {index}",
+            "code": f"P{index:06d}",
+            "externalCode": f"ext-{index}",
+            "archived": index % 50 == 0,
+            "pathName": f"Каталог/Группа {index % 20}",
+            "paymentItemType": "GOOD",
+            "vat": 20,
+            "volume": 1,
+            "weight": 0.5,
+            "salePrices": [{"value": 10000 + index, "currency": {"meta": self._meta("currency", _id(9, 1))}}],
+        }
+
+    def build(self) -> None:
+        """Сгенерировать данные; ``start`` вызывает его сам после привязки порта."""
+        config = self.config
+        products = [self._product(index) for index in range(config.products)]
+        warehouses = [
+            {"meta": self._meta("store", _id(2, index)), "id": _id(2, index), "name": f"Склад {index}", "pathName": ""}
+            for index in range(config.warehouses)
+        ]
+        variants = [
+            {
+                "meta": self._meta("variant", _id(3, index * 10 + number)),
+                "id": _id(3, index * 10 + number),
+                "name": f"{product['name']} ({number})",
+                "code": f"V{index:06d}-{number}",
+                "externalCode": f"vext-{index}-{number}",
+                "archived": False,
+                "characteristics": [{"name": "Размер", "value": str(number)}],
+                "product": product,
+            }
+            for index, product in enumerate(products)
+            for number in range(config.variants_per_product)
+        ]
+
+        self._data = {
+            "product": products,
+            "variant": variants,
+            "store": warehouses,
+            "move": [self._move(index, products, warehouses) for index in range(config.moves)],
+            "inventory": [self._inventory(index, products, warehouses) for index in range(config.inventories)],
+            "bundle": [self._bundle(index, products) for index in range(config.bundles)],
+        }
+        self._documents = {
+            document["id"]: document
+            for entity_type in ("move", "inventory")
+            for document in self._data[entity_type]
+        }
+
+    def _bundle(self, index: int, products: list[dict]) -> dict[str, Any]:
+        bundle_id = _id(8, index)
+        return {
+            "meta": self._meta("bundle", bundle_id),
+            "id": bundle_id,
+            "name": f"Комплект {index}",
+            "code": f"B{index:06d}",
+            "externalCode": f"bext-{index}",
+            "archived": False,
+            "pathName": "Комплекты",
+            "volume": 2,
+            "components": [
+                {
+                    "meta": self._meta("bundle", bundle_id),
+                    "id": _id(10, index * 100 + number),
+                    "quantity": number + 1,
+                    "assortment": products[(index * 7 + number) % len(products)],
+                }
+                for number in range(self.config.components_per_bundle)
+            ],
+        }
+
+    def _positions_count(self, index: int) -> int:
+        config = self.config
+
+        if config.large_document_every and index % config.large_document_every == 0:
+            return config.large_document_positions
+
+        return config.positions_per_document
+
+    def _move(self, index: int, products: list[dict], warehouses: list[dict]) -> dict[str, Any]:
+        move_id = _id(4, index)
+        positions = [
+            {
+                "meta": self._meta("move", move_id),
+                "id": _id(5, index * 1000 + number),
+                "quantity": number % 7 + 1,
+                "price": 0,
+                "assortment": products[(index + number) % len(products)],
+            }
+            for number in range(self._positions_count(index))
+        ]
+        return {
+            "meta": self._meta("move", move_id),
+            "id": move_id,
+            "name": f"{index:05d}",
+            "updated": "2024-02-01 12:00:00.000",
+            "moment": f"2024-01-{index % 28 + 1:02d} 10:00:00.000",
+            "applicable": True,
+            "sum": 0,
+            "sourceStore": {"meta": warehouses[index % len(warehouses)]["meta"]},
+            "targetStore": {"meta": warehouses[(index + 1) % len(warehouses)]["meta"]},
+            "positions": positions,
+        }
+
+    def _inventory(self, index: int, products: list[dict], warehouses: list[dict]) -> dict[str, Any]:
+        inventory_id = _id(6, index)
+        positions = [
+            {
+                "meta": self._meta("inventory", inventory_id),
+                "id": _id(7, index * 1000 + number),
+                "quantity": number % 5,
+                "calculatedQuantity": number % 5 + 1,
+                "correctionAmount": -1,
+                "price": 10000,
+                "correctionSum": -10000,
+                "assortment": products[(index * 3 + number) % len(products)],
+            }
+            for number in range(self._positions_count(index))
+        ]
+        return {
+            "meta": self._meta("inventory", inventory_id),
+            "id": inventory_id,
+            "name": f"{index:05d}",
+            "externalCode": f"inv-{index}",
+            "updated": "2024-02-01 12:00:00.000",
+            "moment": f"2024-01-{index % 28 + 1:02d} 18:00:00.000",
+            "sum": -10000 * len(positions),
+            "store": {"meta": warehouses[index % len(warehouses)]["meta"]},
+            "positions": positions,
+        }
+
+    # --- представление ответов ------------------------------------------------
+
+    def _render_document(self, document: dict[str, Any], expand: str) -> dict[str, Any]:
+        positions = document["positions"]
+        rendered = {**document}
+        positions_meta = {
+            "href": f"{document['meta']['href']}/positions",
+            "type": "position",
+            "mediaType": "application/json",
+            "size": len(positions),
+            "limit": MAX_INLINE_POSITIONS,
+            "offset": 0,
+        }
+
+        if "positions" in expand.split(",") or expand.startswith("positions"):
+            expand_assortment = "positions.assortment" in expand
+            rendered["positions"] = {
+                "meta": positions_meta,
+                "rows": [
+                    self._render_position(position, expand_assortment)
+                    for position in positions[:MAX_INLINE_POSITIONS]
+                ],
+            }
+        else:
+            rendered["positions"] = {"meta": positions_meta}
+
+        return rendered
+
+    @staticmethod
+    def _render_position(position: dict[str, Any], expand_assortment: bool) -> dict[str, Any]:
+        if expand_assortment:
+            return position
+
+        return {**position, "assortment": {"meta": position["assortment"]["meta"]}}
+
+    def render(self, entity_type: str, *, expand: str = "", limit: int | None = None) -> list[dict[str, Any]]:
+        """Строки списка ``entity_type`` в том виде, в каком их вернул бы API с ``expand``."""
+        rows = self._data[entity_type] if limit is None else self._data[entity_type][:limit]
+        return [self._render_row(entity_type, row, expand) for row in rows]
+
+    def _render_row(self, entity_type: str, row: dict[str, Any], expand: str) -> dict[str, Any]:
+        if entity_type in ("move", "inventory"):
+            return self._render_document(row, expand)
+
+        if entity_type == "bundle":
+            components = row["components"]
+            components_meta = {"href": f"{row['meta']['href']}/components", "type": "bundlecomponent", "size": len(components)}
+
+            if expand.startswith("components"):
+                expand_assortment = "components.assortment" in expand
+                rows = [self._render_position(component, expand_assortment) for component in components]
+                return {**row, "components": {"meta": components_meta, "rows": rows}}
+
+            return {**row, "components": {"meta": components_meta}}
+
+        if entity_type == "variant" and "product" not in expand:
+            return {**row, "product": {"meta": row["product"]["meta"]}}
+
+        return row
+
+    # --- обработчики ----------------------------------------------------------
+
+    @web.middleware
+    async def _middleware(self, request: web.Request, handler: Any) -> web.StreamResponse:
+        self.stats.requests += 1
+        endpoint = request.match_info.route.resource.canonical if request.match_info.route.resource else request.path
+        self.stats.by_endpoint[endpoint] = self.stats.by_endpoint.get(endpoint, 0) + 1
+
+        if self.config.latency:
+            await asyncio.sleep(self.config.latency)
+
+        throttled = self._throttle()
+
+        if throttled is not None:
+            self.stats.throttled += 1
+            return throttled
+
+        response = await handler(request)
+
+        if self.config.rate_limit is not None:
+            response.headers["X-RateLimit-Limit"] = str(self.config.rate_limit)
+            response.headers["X-RateLimit-Remaining"] = str(max(self.config.rate_limit - self._window_requests, 0))
+            response.headers["X-Lognex-Retry-TimeInterval"] = str(int(self.config.rate_interval * 1000))
+
+        if self.config.gzip and "gzip" in request.headers.get("Accept-Encoding", ""):
+            response.enable_compression(web.ContentCoding.gzip)
+
+        return response
+
+    def _throttle(self) -> web.Response | None:
+        limit = self.config.rate_limit
+
+        if limit is None:
+            return None
+
+        now = time.monotonic()
+
+        if now - self._window_started_at >= self.config.rate_interval:
+            self._window_started_at = now
+            self._window_requests = 0
+
+        self._window_requests += 1
+
+        if self._window_requests <= limit:
+            return None
+
+        retry_after_ms = int((self._window_started_at + self.config.rate_interval - now) * 1000) + 1
+        return self._json(
+            {"errors": [{"error": "Превышено ограничение на количество запросов", "code": 1049}]},
+            status=429,
+            headers={
+                "X-Lognex-Retry-After": str(retry_after_ms),
+                "X-RateLimit-Limit": str(limit),
+                "X-RateLimit-Remaining": "0",
+            },
+        )
+
+    def _json(self, payload: Any, *, status: int = 200, headers: dict[str, str] | None = None) -> web.Response:
+        body = json.dumps(payload, ensure_ascii=False, separators=(",", ":")).encode()
+        self.stats.response_bytes += len(body)
+        return web.Response(body=body, status=status, content_type="application/json", headers=headers)
+
+    @staticmethod
+    def _page_params(request: web.Request) -> tuple[int, int, str]:
+        expand = request.query.get("expand", "")
+        max_limit = MAX_EXPANDED_PAGE_SIZE if expand else MAX_PAGE_SIZE
+        limit = min(int(request.query.get("limit", max_limit)), max_limit)
+        return limit, int(request.query.get("offset", 0)), expand
+
+    @staticmethod
+    def _id_filter(expression: str) -> set[str] | None:
+        """Значения ``id=...`` из фильтра; прочие условия заглушка не применяет."""
+        ids = {part[3:].lower() for part in expression.split(";") if part.startswith("id=")}
+        return ids or None
+
+    async def _list(self, request: web.Request) -> web.Response:
+        entity_type = request.match_info["entity_type"]
+        rows = self._data.get(entity_type)
+
+        if rows is None:
+            return self._json({"errors": [{"error": f"Неизвестный тип {entity_type}", "code": 1002}]}, status=404)
+
+        ids = self._id_filter(request.query.get("filter", ""))
+
+        if ids is not None:
+            rows = [row for row in rows if row["id"] in ids]
+
+        limit, offset, expand = self._page_params(request)
+        page = [self._render_row(entity_type, row, expand) for row in rows[offset:offset + limit]]
+
+        return self._json({
+            "context": {"employee": {"meta": self._meta("employee", _id(0, 2))}},
+            "meta": {"href": str(request.url), "type": entity_type, "size": len(rows), "limit": limit, "offset": offset},
+            "rows": page,
+        })
+
+    async def _positions(self, request: web.Request) -> web.Response:
+        document = self._documents.get(request.match_info["document_id"])
+
+        if document is None:
+            return self._json({"errors": [{"error": "Документ не найден", "code": 1021}]}, status=404)
+
+        limit, offset, expand = self._page_params(request)
+        expand_assortment = expand.startswith("assortment")
+        positions = document["positions"]
+
+        return self._json({
+            "meta": {"href": str(request.url), "type": "position", "size": len(positions), "limit": limit, "offset": offset},
+            "rows": [self._render_position(position, expand_assortment) for position in positions[offset:offset + limit]],
+        })
+
+    async def _create(self, request: web.Request) -> web.Response:
+        entity_type = request.match_info["entity_type"]
+        payload = await request.json()
+        items = payload if isinstance(payload, list) else [payload]
+
+        created = [
+            {**item, "meta": self._meta(entity_type, entity_id), "id": entity_id}
+            for item in items
+            for entity_id in [str(uuid.uuid4())]
+        ]
+
+        return self._json(created if isinstance(payload, list) else created[0])
+
+    async def _stock_all(self, request: web.Request) -> web.Response:
+        rows = [
+            {
+                "meta": {**product["meta"], "href": f"{product['meta']['href']}?expand=supplier"},
+                "name": product["name"],
+                "code": product["code"],
+                "stock": index % 17,
+                "reserve": 0,
+                "inTransit": 0,
+                "quantity": index % 17,
+                "price": 10000,
+                "salePrice": 15000,
+            }
+            for index, product in enumerate(self._data["product"])
+        ]
+
+        return self._json({"context": {}, "meta": {"size": len(rows), "limit": len(rows), "offset": 0}, "rows": rows})
+
+    async def _stock_current(self, request: web.Request) -> web.Response:
+        return self._json([
+            {"assortmentId": product["id"], "storeId": _id(2, 0), "stock": index % 17}
+            for index, product in enumerate(self._data["product"])
+        ])
+
+    def create_app(self) -> web.Application:
+        app = web.Application(middlewares=[self._middleware], client_max_size=64 * 1024 * 1024)
+        app.router.add_get(f"{API_PREFIX}/report/stock/all", self._stock_all)
+        app.router.add_get(f"{API_PREFIX}/report/stock/bystore/current", self._stock_current)
+        app.router.add_get(f"{API_PREFIX}/entity/{{entity_type}}", self._list)
+        app.router.add_post(f"{API_PREFIX}/entity/{{entity_type}}", self._create)
+        app.router.add_get(f"{API_PREFIX}/entity/{{entity_type}}/{{document_id}}/positions", self._positions)
+        return app
+
+    # --- запуск в отдельном потоке ---------------------------------------------
+
+    def start(self, host: str = "127.0.0.1", port: int = 0) -> str:
+        """Запустить сервер в фоновом потоке со своим event loop и вернуть base_url.
+
+        Отдельный поток не даёт работе сервера искажать замеры клиента по CPU.
+        """
+        started = threading.Event()
+        errors: list[BaseException] = []
+
+        def run() -> None:
+            loop = asyncio.new_event_loop()
+            self._loop = loop
+
+            try:
+                loop.run_until_complete(self._start(host, port))
+            except BaseException as ex:
+                errors.append(ex)
+                started.set()
+                return
+
+            started.set()
+            loop.run_forever()
+            loop.run_until_complete(self._runner.cleanup())
+            loop.close()
+
+        self._thread = threading.Thread(target=run, name="fake-moysklad", daemon=True)
+        self._thread.start()
+        started.wait()
+
+        if errors:
+            raise errors[0]
+
+        return self.base_url
+
+    async def _start(self, host: str, port: int) -> None:
+        self._runner = web.AppRunner(self.create_app(), access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+
+        sockets = site._server.sockets  # type: ignore[union-attr]
+        bound_port = sockets[0].getsockname()[1]
+
+        self._origin = f"http://{host}:{bound_port}"
+        self.base_url = f"{self._origin}{API_PREFIX}"
+        self.build()
+
+    def stop(self) -> None:
+        if self._loop is not None and self._thread is not None:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop = self._thread = None
+
+    def reset_stats(self) -> None:
+        self.stats = FakeServerStats()
+
+    def __enter__(self) -> FakeMoySklad:
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
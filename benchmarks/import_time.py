@@ -0,0 +1,182 @@
+"""Бенчмарк холодного импорта пакета.
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.import_time                    # сравнить с сохранённым baseline
+    python -m benchmarks.import_time --update-baseline  # перезаписать baseline
+    python -m benchmarks.import_time --top 15           # самые медленные модули (-X importtime)
+
+Каждый случай выполняется в отдельном интерпретаторе, чтобы импорт был
+холодным (байткод при этом уже скомпилирован первым, прогревочным запуском).
+Берётся медиана по ``--repeat`` запускам. Если медиана хуже baseline больше чем
+на ``--tolerance``, скрипт печатает регрессии и завершается с кодом 1.
+Baseline зависит от машины: обновляйте его на той же машине, где сравниваете.
+
+``client_class`` не тянет aiohttp (он загружается при первом запросе). Основная
+оставшаяся часть — beartype и проверяемые DTO (``moy_sklad_api.validation``,
+около трети), затем asyncio и pydantic; ``--top`` покажет разбивку.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+from dataclasses import dataclass
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent.parent
+BASELINE_PATH = Path(__file__).parent / "baselines" / "import_time.json"
+
+# Код случая выполняется после замера старта; время — от начала до конца кода.
+CASES: dict[str, str] = {
+    "package": "import moy_sklad_api",
+    "client_class": "from moy_sklad_api import MoySkladAPIClient",
+    "client_instance": "from moy_sklad_api import MoySkladAPIClient; MoySkladAPIClient()",
+    "first_validation": (
+        "from moy_sklad_api.models import MoveModel\n"
+        "from moy_sklad_api.utils import validate_rows\n"
+        "validate_rows(MoveModel, [])"
+    ),
+}
+
+_RUNNER = """
+import time
+started_at = time.perf_counter()
+exec(compile({code!r}, "<case>", "exec"))
+print(time.perf_counter() - started_at)
+"""
+
+
+@dataclass(frozen=True, slots=True)
+class CaseResult:
+    name: str
+    ms: float
+    runs: list[float]
+
+
+def _environment() -> dict[str, str]:
+    environment = dict(os.environ)
+    environment["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), environment.get("PYTHONPATH")]))
+    environment.setdefault("MOY_SKLAD_ACCESS_TOKEN", "benchmark")
+    environment.setdefault("MOY_SKLAD_REQUEST_ATTEMPTS", "5")
+    environment.setdefault("MOY_SKLAD_ATTEMPT_TIMEOUT", "1")
+    return environment
+
+
+def run_once(code: str, *, importtime: bool = False) -> subprocess.CompletedProcess[str]:
+    command = [sys.executable, *(["-X", "importtime"] if importtime else []), "-c", _RUNNER.format(code=code)]
+    return subprocess.run(command, capture_output=True, text=True, check=True, cwd=ROOT, env=_environment())
+
+
+def measure(name: str, code: str, *, repeat: int = 7) -> CaseResult:
+    run_once(code)  # прогрев: компиляция .pyc, файловый кэш ОС
+    runs = [float(run_once(code).stdout.strip().splitlines()[-1]) * 1000 for _ in range(repeat)]
+    return CaseResult(name, statistics.median(runs), runs)
+
+
+def slowest_modules(code: str, top: int) -> list[tuple[int, int, str]]:
+    """Модули с наибольшим собственным временем импорта, мкс: (self, cumulative, имя)."""
+    modules = []
+
+    for line in run_once(code, importtime=True).stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+
+        own, cumulative, module = line.removeprefix("import time:").split("|")
+        modules.append((int(own), int(cumulative), module.strip()))
+
+    return sorted(modules, reverse=True)[:top]
+
+
+def compare(results: list[CaseResult], baseline: dict[str, float], *, tolerance: float) -> list[str]:
+    regressions: list[str] = []
+
+    for result in results:
+        expected = baseline.get(result.name)
+
+        if expected is not None and result.ms > expected * (1 + tolerance):
+            regressions.append(f"{result.name}: {result.ms:.1f} мс при baseline {expected:.1f} (допуск {tolerance:.0%})")
+
+    return regressions
+
+
+def format_results(results: list[CaseResult], baseline: dict[str, float]) -> str:
+    header = f"{'случай':<20}{'медиана, мс':>13}{'мин, мс':>10}{'baseline':>10}"
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        expected = baseline.get(result.name)
+        expected_text = "-" if expected is None else f"{expected:.1f}"
+        lines.append(f"{result.name:<20}{result.ms:>13.1f}{min(result.runs):>10.1f}{expected_text:>10}")
+
+    return "\n".join(lines)
+
+
+def load_baseline(path: Path) -> dict[str, float]:
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(path: Path, results: list[CaseResult], previous: dict[str, float]) -> None:
+    baseline = {**previous, **{result.name: round(result.ms, 1) for result in results}}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Время холодного импорта пакета.")
+    parser.add_argument("--cases", help="случаи через запятую (по умолчанию все)")
+    parser.add_argument("--repeat", type=int, default=7)
+    parser.add_argument("--top", type=int, default=0, help="показать N самых медленных модулей для client_class")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--tolerance", type=float, default=0.5, help="допустимое замедление, доля")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    names = [name.strip() for name in args.cases.split(",")] if args.cases else list(CASES)
+    unknown = [name for name in names if name not in CASES]
+
+    if unknown:
+        print(f"Неизвестные случаи: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    results = [measure(name, CASES[name], repeat=args.repeat) for name in names]
+    baseline = load_baseline(args.baseline)
+
+    print(format_results(results, baseline))
+
+    if args.top:
+        print(f"\n{'собственное, мс':>16}{'всего, мс':>12}  модуль")
+
+        for own, cumulative, module in slowest_modules(CASES["client_class"], args.top):
+            print(f"{own / 1000:>16.1f}{cumulative / 1000:>12.1f}  {module}")
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results, baseline)
+        print(f"\nBaseline сохранён: {args.baseline}")
+        return 0
+
+    regressions = compare(results, baseline, tolerance=args.tolerance)
+
+    if regressions:
+        print("\nРЕГРЕССИИ:", file=sys.stderr)
+
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
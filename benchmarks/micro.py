@@ -0,0 +1,311 @@
+"""Микробенчмарки разбора и сериализации с бюджетами по времени и памяти.
+
+Запуск из корня репозитория::
+
+    python -m benchmarks.micro                    # сравнить с сохранённым baseline
+    python -m benchmarks.micro --update-baseline  # перезаписать baseline
+    python -m benchmarks.micro --cases validate_moves,query_string
+
+Для каждого случая измеряется время на строку (лучшее из нескольких повторов)
+и пик выделенной памяти на строку (tracemalloc, отдельным прогоном). Если время
+хуже baseline больше чем на ``--time-tolerance`` или память — больше чем на
+``--memory-tolerance``, скрипт печатает регрессии и завершается с кодом 1.
+Baseline зависит от машины: обновляйте его на той же машине, где сравниваете.
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import json
+import os
+import sys
+import time
+import tracemalloc
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Callable
+from uuid import uuid4
+
+os.environ.setdefault("MOY_SKLAD_ACCESS_TOKEN", "benchmark")
+os.environ.setdefault("MOY_SKLAD_REQUEST_ATTEMPTS", "5")
+os.environ.setdefault("MOY_SKLAD_ATTEMPT_TIMEOUT", "1")
+
+from moy_sklad_api import Filter, MoySkladAPIClient, ProductType, ValidationLevel, set_validation_level  # noqa: E402
+from moy_sklad_api.dtos import InventoryPositionDTO  # noqa: E402
+from moy_sklad_api.models import BundleModel, InventoryModel, MoveModel, VariantModel  # noqa: E402
+from moy_sklad_api.models.compact import move_row  # noqa: E402
+from moy_sklad_api.utils import validate_rows  # noqa: E402
+from moy_sklad_api.validation import check_batch  # noqa: E402
+
+from benchmarks.fake_server import FakeMoySklad, FakeServerConfig  # noqa: E402
+
+BASELINE_PATH = Path(__file__).parent / "baselines" / "micro.json"
+
+PROJECT_TZ = timezone(timedelta(hours=3))
+
+
+@dataclass(frozen=True, slots=True)
+class Case:
+    """Вызов ``run`` обрабатывает ``rows`` строк (моделей, фильтров, позиций)."""
+
+    run: Callable[[], Any]
+    rows: int
+
+
+@dataclass(frozen=True, slots=True)
+class CaseResult:
+    name: str
+    rows: int
+    us_per_row: float
+    peak_bytes_per_row: float
+
+
+def build_cases(scale: int = 1) -> dict[str, Case]:
+    """Случаи на синтетических ответах размера реальной страницы API."""
+    fixtures = FakeMoySklad(FakeServerConfig(
+        products=1000 * scale,
+        variants_per_product=1,
+        moves=100 * scale,
+        inventories=100 * scale,
+        bundles=100 * scale,
+        positions_per_document=40,
+        large_document_every=0,
+    ))
+    fixtures.build()
+
+    moves = fixtures.render("move", expand="positions.assortment.product")
+    inventories = fixtures.render("inventory", expand="positions.assortment.product")
+    bundles = fixtures.render("bundle", expand="components.assortment.product")
+    variants = fixtures.render("variant", expand="product")
+
+    moment = datetime(2024, 1, 15, 12, tzinfo=PROJECT_TZ)
+    filters = [
+        Filter("moment", moment),
+        Filter("store", "https://api.moysklad.ru/api/remap/1.2/entity/store/" + str(uuid4())),
+        Filter("archived", False),
+        Filter("productid", [uuid4() for _ in range(50)]),
+    ]
+    format_values = [moment, uuid4(), "https://api.moysklad.ru/api/remap/1.2/entity/product/x", True, 42] * 200 * scale
+    inventory_positions = [
+        InventoryPositionDTO(product_id=uuid4(), product_type=ProductType.SINGLE_PRODUCT, quantity=index % 9)
+        for index in range(1000 * scale)
+    ]
+    organization_id, warehouse_id = uuid4(), uuid4()
+
+    position_ids = [uuid4() for _ in range(1000 * scale)]
+
+    def build_positions(level: ValidationLevel) -> Callable[[], Any]:
+        # Позиции создаются и проверяются так, как это делает create_* на данном уровне.
+        def run() -> None:
+            set_validation_level(level)
+
+            try:
+                positions = [
+                    InventoryPositionDTO(product_id=product_id, product_type=ProductType.SINGLE_PRODUCT, quantity=1)
+                    for product_id in position_ids
+                ]
+                check_batch(positions, InventoryPositionDTO)
+            finally:
+                set_validation_level(ValidationLevel.STRICT)
+
+        return run
+
+    def positions_count(documents: list[dict]) -> int:
+        return sum(len(document["positions"]["rows"]) for document in documents)
+
+    return {
+        "validate_moves": Case(lambda: validate_rows(MoveModel, moves), positions_count(moves)),
+        "validate_inventories": Case(lambda: validate_rows(InventoryModel, inventories), positions_count(inventories)),
+        "validate_bundles": Case(
+            lambda: validate_rows(BundleModel, bundles),
+            sum(len(bundle["components"]["rows"]) for bundle in bundles),
+        ),
+        "validate_variants": Case(lambda: validate_rows(VariantModel, variants), len(variants)),
+        "compact_moves": Case(lambda: [move_row(move) for move in moves], positions_count(moves)),
+        "query_string": Case(
+            lambda: [
+                MoySkladAPIClient._build_query_string(filters=filters, order="moment,desc", limit=100)
+                for _ in range(100 * scale)
+            ],
+            100 * scale,
+        ),
+        "filter_format_value": Case(lambda: [Filter.format_value(value) for value in format_values], len(format_values)),
+        "inventory_payload": Case(
+            lambda: MoySkladAPIClient._inventory_payload(
+                organization_id=organization_id,
+                warehouse_id=warehouse_id,
+                positions=inventory_positions,
+                moment=moment,
+            ),
+            len(inventory_positions),
+        ),
+        "dto_strict": Case(build_positions(ValidationLevel.STRICT), len(position_ids)),
+        "dto_boundary": Case(build_positions(ValidationLevel.BOUNDARY), len(position_ids)),
+        "dto_off": Case(build_positions(ValidationLevel.OFF), len(position_ids)),
+    }
+
+
+def measure(name: str, case: Case, *, repeat: int = 5, min_time: float = 0.2) -> CaseResult:
+    case.run()  # прогрев: ленивые схемы pydantic, кэши
+
+    loops = 1
+    elapsed = _timed(case.run, loops)
+
+    while elapsed < min_time / repeat:
+        loops *= 2
+        elapsed = _timed(case.run, loops)
+
+    best = min(_timed(case.run, loops) for _ in range(repeat)) / loops
+
+    gc.collect()
+    tracemalloc.start()
+
+    try:
+        case.run()
+        peak = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    return CaseResult(name, case.rows, best / case.rows * 1e6, peak / case.rows)
+
+
+def _timed(run: Callable[[], Any], loops: int) -> float:
+    gc.collect()
+    gc.disable()
+
+    try:
+        started_at = time.perf_counter()
+
+        for _ in range(loops):
+            run()
+
+        return time.perf_counter() - started_at
+    finally:
+        gc.enable()
+
+
+def compare(
+        results: list[CaseResult],
+        baseline: dict[str, dict[str, float]],
+        *,
+        time_tolerance: float,
+        memory_tolerance: float,
+) -> list[str]:
+    regressions: list[str] = []
+
+    for result in results:
+        expected = baseline.get(result.name)
+
+        if expected is None:
+            continue
+
+        time_limit = expected["us_per_row"] * (1 + time_tolerance)
+        memory_limit = expected["peak_bytes_per_row"] * (1 + memory_tolerance)
+
+        if result.us_per_row > time_limit:
+            regressions.append(
+                f"{result.name}: {result.us_per_row:.3f} мкс/строку при baseline "
+                f"{expected['us_per_row']:.3f} (допуск {time_tolerance:.0%})"
+            )
+
+        if result.peak_bytes_per_row > memory_limit:
+            regressions.append(
+                f"{result.name}: {result.peak_bytes_per_row:.0f} байт/строку при baseline "
+                f"{expected['peak_bytes_per_row']:.0f} (допуск {memory_tolerance:.0%})"
+            )
+
+    return regressions
+
+
+def format_results(results: list[CaseResult], baseline: dict[str, dict[str, float]]) -> str:
+    header = f"{'случай':<24}{'строк':>8}{'мкс/строку':>12}{'baseline':>10}{'байт/строку':>13}{'baseline':>10}"
+    lines = [header, "-" * len(header)]
+
+    for result in results:
+        expected = baseline.get(result.name, {})
+        expected_time = f"{expected['us_per_row']:.3f}" if expected else "-"
+        expected_memory = f"{expected['peak_bytes_per_row']:.0f}" if expected else "-"
+        lines.append(
+            f"{result.name:<24}{result.rows:>8}{result.us_per_row:>12.3f}{expected_time:>10}"
+            f"{result.peak_bytes_per_row:>13.0f}{expected_memory:>10}"
+        )
+
+    return "\n".join(lines)
+
+
+def load_baseline(path: Path) -> dict[str, dict[str, float]]:
+    if not path.exists():
+        return {}
+
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def save_baseline(path: Path, results: list[CaseResult], previous: dict[str, dict[str, float]]) -> None:
+    baseline = {
+        **previous,
+        **{
+            result.name: {
+                "us_per_row": round(result.us_per_row, 4),
+                "peak_bytes_per_row": round(result.peak_bytes_per_row, 1),
+            }
+            for result in results
+        },
+    }
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, ensure_ascii=False, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+
+
+def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Микробенчмарки разбора и сериализации.")
+    parser.add_argument("--cases", help="случаи через запятую (по умолчанию все)")
+    parser.add_argument("--scale", type=int, default=1, help="множитель размера фикстур")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument("--time-tolerance", type=float, default=0.5, help="допустимое замедление, доля")
+    parser.add_argument("--memory-tolerance", type=float, default=0.1, help="допустимый рост памяти, доля")
+    return parser.parse_args(argv)
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = parse_args(argv)
+    cases = build_cases(args.scale)
+    names = [name.strip() for name in args.cases.split(",")] if args.cases else list(cases)
+    unknown = [name for name in names if name not in cases]
+
+    if unknown:
+        print(f"Неизвестные случаи: {', '.join(unknown)}", file=sys.stderr)
+        return 2
+
+    results = [measure(name, cases[name], repeat=args.repeat) for name in names]
+    baseline = load_baseline(args.baseline)
+
+    print(format_results(results, baseline))
+
+    if args.update_baseline:
+        save_baseline(args.baseline, results, baseline)
+        print(f"\nBaseline сохранён: {args.baseline}")
+        return 0
+
+    regressions = compare(
+        results,
+        baseline,
+        time_tolerance=args.time_tolerance,
+        memory_tolerance=args.memory_tolerance,
+    )
+
+    if regressions:
+        print("\nРЕГРЕССИИ:", file=sys.stderr)
+
+        for regression in regressions:
+            print(f"  {regression}", file=sys.stderr)
+
+        return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
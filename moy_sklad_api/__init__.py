@@ -1,44 +1,133 @@
-from dotenv import load_dotenv
-
-from moy_sklad_api.client import MoySkladAPIClient
-from moy_sklad_api.filter import Filter
-from moy_sklad_api.models import (
-    PositionModel,
-    BundleModel,
-    DemandModel,
-    InventoryModel,
-    InventoryPosition,
-    MoveModel,
-    MetaModel,
-    ProductExpandStocksModel,
-    ProductModel,
-    ProductStocksModel,
-    VariantModel,
-    WarehouseModel,
-)
-from moy_sklad_api.enums import EntityType, ProductType
-from .dtos import *
-
-load_dotenv()
-
-__all__ = [
-    "Filter",
-    "MoySkladAPIClient",
-    "PositionModel",
-    "BundleModel",
-    "DemandModel",
-    "InventoryModel",
-    "InventoryPosition",
-    "MoveModel",
-    "MetaModel",
-    "ProductExpandStocksModel",
-    "ProductModel",
-    "ProductStocksModel",
-    "VariantModel",
-    "WarehouseModel",
-    "EntityType",
-    "ProductType",
-    "InventoryPositionDTO",
-    'MovePositionDTO',
-    'DemandPositionDTO',
-]
+"""Асинхронный клиент API МойСклад.
+
+Имена пакета загружаются лениво: ``import moy_sklad_api`` не тянет aiohttp,
+pydantic и модели, пока не понадобится соответствующий атрибут. Переменные
+окружения и ``.env`` читаются при создании клиента.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from pkgutil import iter_modules
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from moy_sklad_api.batching import EntityLoader
+    from moy_sklad_api.bulk import BulkItemResult
+    from moy_sklad_api.cache import CacheStats, ReferenceCache
+    from moy_sklad_api.client import MoySkladAPIClient
+    from moy_sklad_api.codec import JSONCodec, get_codec
+    from moy_sklad_api.filter import Filter
+    from moy_sklad_api.metrics import (
+        CallbackObserver,
+        HistogramObserver,
+        LoggingObserver,
+        MetricsObserver,
+        RequestMetrics,
+        ValidationMetrics,
+    )
+    from moy_sklad_api.models import (
+        AssortmentRefModel,
+        PositionModel,
+        BundleModel,
+        DemandModel,
+        InventoryModel,
+        InventoryPosition,
+        MoveModel,
+        MetaModel,
+        ProductExpandStocksModel,
+        ProductModel,
+        ProductStocksModel,
+        VariantModel,
+        WarehouseModel,
+    )
+    from moy_sklad_api.enums import EntityType, ExpandStrategy, ProductType
+    from moy_sklad_api.rate_limit import RateLimiter
+    from moy_sklad_api.retry import RetryPolicy
+    from moy_sklad_api.storage import CatalogMirror, DocumentStore
+    from moy_sklad_api.transport import TransportConfig, close_shared_sessions
+    from moy_sklad_api.validation import ValidationLevel, get_validation_level, set_validation_level
+    from moy_sklad_api.dtos import (
+        InventoryPositionDTO,
+        MovePositionDTO,
+        DemandPositionDTO,
+        BundlePositionDTO,
+        DemandDTO,
+        MoveDTO,
+        InventoryDTO,
+    )
+
+# Имя -> модуль, из которого оно загружается при первом обращении.
+_EXPORTS: dict[str, str] = {
+    "Filter": "moy_sklad_api.filter",
+    "MoySkladAPIClient": "moy_sklad_api.client",
+    "BulkItemResult": "moy_sklad_api.bulk",
+    "EntityLoader": "moy_sklad_api.batching",
+    "CacheStats": "moy_sklad_api.cache",
+    "ReferenceCache": "moy_sklad_api.cache",
+    "JSONCodec": "moy_sklad_api.codec",
+    "get_codec": "moy_sklad_api.codec",
+    "AssortmentRefModel": "moy_sklad_api.models",
+    "PositionModel": "moy_sklad_api.models",
+    "BundleModel": "moy_sklad_api.models",
+    "DemandModel": "moy_sklad_api.models",
+    "InventoryModel": "moy_sklad_api.models",
+    "InventoryPosition": "moy_sklad_api.models",
+    "MoveModel": "moy_sklad_api.models",
+    "MetaModel": "moy_sklad_api.models",
+    "ProductExpandStocksModel": "moy_sklad_api.models",
+    "ProductModel": "moy_sklad_api.models",
+    "ProductStocksModel": "moy_sklad_api.models",
+    "VariantModel": "moy_sklad_api.models",
+    "WarehouseModel": "moy_sklad_api.models",
+    "EntityType": "moy_sklad_api.enums",
+    "ExpandStrategy": "moy_sklad_api.enums",
+    "ProductType": "moy_sklad_api.enums",
+    "RateLimiter": "moy_sklad_api.rate_limit",
+    "MetricsObserver": "moy_sklad_api.metrics",
+    "RequestMetrics": "moy_sklad_api.metrics",
+    "ValidationMetrics": "moy_sklad_api.metrics",
+    "CallbackObserver": "moy_sklad_api.metrics",
+    "LoggingObserver": "moy_sklad_api.metrics",
+    "HistogramObserver": "moy_sklad_api.metrics",
+    "RetryPolicy": "moy_sklad_api.retry",
+    "TransportConfig": "moy_sklad_api.transport",
+    "CatalogMirror": "moy_sklad_api.storage",
+    "DocumentStore": "moy_sklad_api.storage",
+    "close_shared_sessions": "moy_sklad_api.transport",
+    "ValidationLevel": "moy_sklad_api.validation",
+    "get_validation_level": "moy_sklad_api.validation",
+    "set_validation_level": "moy_sklad_api.validation",
+    "InventoryPositionDTO": "moy_sklad_api.dtos",
+    "MovePositionDTO": "moy_sklad_api.dtos",
+    "DemandPositionDTO": "moy_sklad_api.dtos",
+    "BundlePositionDTO": "moy_sklad_api.dtos",
+    "DemandDTO": "moy_sklad_api.dtos",
+    "MoveDTO": "moy_sklad_api.dtos",
+    "InventoryDTO": "moy_sklad_api.dtos",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+
+    if module_name is not None:
+        value = getattr(import_module(module_name), name)
+        globals()[name] = value
+        return value
+
+    # Раньше пакет импортировал все модули сразу: moy_sklad_api.client и т.п.
+    # должны находиться и без явного import.
+    try:
+        return import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS, *(module.name for module in iter_modules(__path__))})
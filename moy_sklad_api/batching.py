@@ -0,0 +1,106 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, Hashable, Iterable, TypeVar
+from uuid import UUID
+
+from moy_sklad_api.cache import entity_key
+from moy_sklad_api.filter import Filter
+
+T = TypeVar("T")
+
+# Запас под limit/offset/expand, которые добавляются к URL при пагинации.
+PAGINATION_PARAMS_RESERVE = 200
+
+# Консервативная длина URL: длиннее прокси и сервер могут ответить 414.
+MAX_URL_LENGTH = 4000
+
+
+def chunk_filter_values(field: str, values: Iterable[Any], *, budget: int) -> list[list[str]]:
+    """Разбить значения фильтра ``field=v1;field=v2;...`` на куски не длиннее ``budget`` символов.
+
+    Значения форматируются как в ``Filter`` и дедуплицируются с сохранением порядка.
+    Значение, которое одно длиннее ``budget``, попадает в отдельный кусок.
+    """
+    chunks: list[list[str]] = []
+    chunk: list[str] = []
+    length = 0
+
+    for value in dict.fromkeys(Filter.format_value(value) for value in values):
+        part_length = len(field) + 1 + len(value) + (1 if chunk else 0)
+
+        if chunk and length + part_length > budget:
+            chunks.append(chunk)
+            chunk, length = [], 0
+            part_length -= 1
+
+        chunk.append(value)
+        length += part_length
+
+    if chunk:
+        chunks.append(chunk)
+
+    return chunks
+
+
+def filter_expression(field: str, values: Iterable[str]) -> str:
+    return ";".join(f"{field}={value}" for value in values)
+
+
+class EntityLoader(Generic[T]):
+    """Загрузчик сущностей по id в стиле DataLoader.
+
+    Все ``load`` за один проход event loop собираются в один вызов ``fetch`` со
+    списком уникальных id; каждый вызывающий получает свою сущность или ``None``,
+    если её нет. Ошибка ``fetch`` достаётся всем вызывающим из пачки.
+    """
+
+    def __init__(
+            self,
+            fetch: Callable[[list[str]], Awaitable[Iterable[T]]],
+            *,
+            key: Callable[[T], Hashable] = lambda entity: str(entity.id),
+    ) -> None:
+        self._fetch = fetch
+        self._key = key
+        self._pending: dict[str, asyncio.Future[T | None]] = {}
+
+    async def load(self, entity_id: UUID | str) -> T | None:
+        key = entity_key(entity_id)
+        future = self._pending.get(key)
+
+        if future is None:
+            loop = asyncio.get_running_loop()
+
+            if not self._pending:
+                loop.call_soon(self._dispatch)
+
+            future = self._pending[key] = loop.create_future()
+
+        return await asyncio.shield(future)
+
+    async def load_many(self, entity_ids: Iterable[UUID | str]) -> list[T | None]:
+        return list(await asyncio.gather(*(self.load(entity_id) for entity_id in entity_ids)))
+
+    def _dispatch(self) -> None:
+        batch, self._pending = self._pending, {}
+        task = asyncio.ensure_future(self._fetch(list(batch)))
+        task.add_done_callback(lambda done: self._resolve(batch, done))
+
+    def _resolve(self, batch: dict[str, asyncio.Future[T | None]], task: asyncio.Future) -> None:
+        if task.cancelled():
+            for future in batch.values():
+                future.cancel()
+            return
+
+        error = task.exception()
+
+        if error is not None:
+            for future in batch.values():
+                future.set_exception(error)
+            return
+
+        found = {self._key(entity): entity for entity in task.result()}
+
+        for key, future in batch.items():
+            future.set_result(found.get(key))
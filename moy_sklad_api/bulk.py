@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Iterator, Sequence, TypeVar
+
+from moy_sklad_api.exceptions import MoySkladAPIException, MoySkladHTTPError, MoySkladRequestError
+
+# МойСклад принимает не более 1000 сущностей в одном массовом запросе.
+MAX_BULK_SIZE = 1000
+
+# Статус для ошибки отдельного элемента в успешном массовом ответе.
+_ITEM_ERROR_STATUS = 400
+
+ItemT = TypeVar("ItemT")
+
+
+@dataclass(frozen=True, slots=True)
+class BulkItemResult:
+    """Результат одного элемента массовой операции.
+
+    ``index`` — позиция элемента во входном списке; заполнено либо ``data``
+    (ответ API по сущности), либо ``error``.
+    """
+
+    index: int
+    data: dict[str, Any] | None = None
+    error: MoySkladAPIException | None = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+def chunked(items: Sequence[ItemT], size: int) -> Iterator[tuple[int, Sequence[ItemT]]]:
+    """Разбить ``items`` на куски по ``size`` и вернуть пары (смещение, кусок)."""
+    for start in range(0, len(items), size):
+        yield start, items[start:start + size]
+
+
+def chunk_results(
+        start: int,
+        count: int,
+        response: Any,
+        *,
+        status: int = _ITEM_ERROR_STATUS,
+) -> list[BulkItemResult]:
+    """Сопоставить ответ API на массовый запрос элементам куска в исходном порядке."""
+    if not isinstance(response, list) or len(response) != count:
+        error = MoySkladAPIException(f"Неожиданный ответ на массовый запрос: {response}")
+        return chunk_error(start, count, error)
+
+    results: list[BulkItemResult] = []
+
+    for offset, item in enumerate(response):
+        if isinstance(item, dict) and isinstance(item.get("errors"), list):
+            results.append(BulkItemResult(start + offset, error=MoySkladRequestError(status, item)))
+        else:
+            results.append(BulkItemResult(start + offset, data=item))
+
+    return results
+
+
+def chunk_error(start: int, count: int, error: MoySkladAPIException) -> list[BulkItemResult]:
+    """Результаты для куска, запрос которого целиком завершился ошибкой.
+
+    Если в теле ошибки есть поэлементный массив, ошибки раскладываются по элементам.
+    """
+    if isinstance(error, MoySkladHTTPError):
+        items = error.payload.get("error")
+
+        if isinstance(items, list) and len(items) == count:
+            return chunk_results(start, count, items, status=error.status)
+
+    return [BulkItemResult(start + offset, error=error) for offset in range(count)]
@@ -0,0 +1,183 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping, TypeVar
+from uuid import UUID
+
+from moy_sklad_api.enums import EntityType
+from moy_sklad_api.exceptions import MoySkladValidationError
+
+T = TypeVar("T")
+
+# Справочники меняются редко, склады и проекты — реже товаров.
+DEFAULT_TTLS: dict[str, float] = {
+    EntityType.STORE: 3600.0,
+    EntityType.PROJECT: 3600.0,
+    EntityType.PRODUCT: 300.0,
+    EntityType.MODIFICATION: 300.0,
+    EntityType.BUNDLE: 300.0,
+}
+
+_MISSING = object()
+
+
+def entity_key(entity_id: UUID | str) -> str:
+    """Ключ сущности в кэше: id в каноническом виде (``str(UUID(...))``).
+
+    ``"ABC..."``, ``"abc..."`` и ``UUID("abc...")`` дают одну запись.
+    """
+    try:
+        return str(entity_id if isinstance(entity_id, UUID) else UUID(entity_id))
+    except ValueError:
+        raise MoySkladValidationError(f"Некорректный id сущности: '{entity_id}'.") from None
+
+
+@dataclass(frozen=True, slots=True)
+class ListKey:
+    """Ключ закэшированного списка сущностей, например URL запроса с фильтрами.
+
+    Список может содержать любую сущность своего типа, поэтому ``invalidate``
+    одной сущности сбрасывает и списки этого типа.
+    """
+
+    query: str
+
+
+@dataclass(slots=True)
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class ReferenceCache:
+    """LRU-кэш справочных данных с TTL по типу сущности.
+
+    Ключ записи — пара (тип сущности, ключ): id сущности (``UUID`` или строка в
+    любом регистре, приводится через ``entity_key``) или ``ListKey(url)`` для
+    списка. Размер ограничен ``maxsize`` записями всех типов; при переполнении
+    вытесняются давно не использованные. Возвращаемые модели общие для всех вызывающих —
+    не изменяйте их.
+    """
+
+    def __init__(
+            self,
+            *,
+            maxsize: int = 10_000,
+            ttls: Mapping[str, float] | None = None,
+            default_ttl: float = 300.0,
+    ) -> None:
+        if maxsize < 1:
+            raise MoySkladValidationError("maxsize кэша должен быть положительным.")
+
+        self._maxsize = maxsize
+        self._ttls = {**DEFAULT_TTLS, **dict(ttls or {})}
+        self._default_ttl = default_ttl
+        self._entries: OrderedDict[tuple[str, str | ListKey], tuple[float, Any]] = OrderedDict()
+        self._stats: dict[str, CacheStats] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def stats(self) -> dict[str, CacheStats]:
+        """Статистика попаданий по типам сущностей."""
+        return self._stats
+
+    def total_stats(self) -> CacheStats:
+        total = CacheStats()
+
+        for stats in self._stats.values():
+            total.hits += stats.hits
+            total.misses += stats.misses
+            total.evictions += stats.evictions
+
+        return total
+
+    def ttl_for(self, kind: str) -> float:
+        return self._ttls.get(kind, self._default_ttl)
+
+    def get(self, kind: str, key: UUID | str | ListKey, default: Any = None) -> Any:
+        value = self._lookup(kind, key)
+        return default if value is _MISSING else value
+
+    def set(self, kind: str, key: UUID | str | ListKey, value: Any) -> None:
+        ttl = self.ttl_for(kind)
+
+        if ttl <= 0:
+            return
+
+        entry_key = _entry_key(kind, key)
+        self._entries[entry_key] = (time.monotonic() + ttl, value)
+        self._entries.move_to_end(entry_key)
+
+        while len(self._entries) > self._maxsize:
+            (evicted_kind, _), _ = self._entries.popitem(last=False)
+            self._stats_for(evicted_kind).evictions += 1
+
+    def invalidate(self, kind: str | None = None, key: UUID | str | ListKey | None = None) -> None:
+        """Сбросить одну запись (и списки её типа), все записи типа ``kind`` или весь кэш."""
+        if kind is None:
+            self._entries.clear()
+            return
+
+        if key is not None:
+            self._entries.pop(_entry_key(kind, key), None)
+
+        stale = [
+            entry_key
+            for entry_key in self._entries
+            if entry_key[0] == kind and (key is None or isinstance(entry_key[1], ListKey))
+        ]
+
+        for entry_key in stale:
+            del self._entries[entry_key]
+
+    async def get_or_load(self, kind: str, key: UUID | str | ListKey, loader: Callable[[], Awaitable[T]]) -> T:
+        value = self._lookup(kind, key)
+
+        if value is not _MISSING:
+            return value
+
+        value = await loader()
+        self.set(kind, key, value)
+        return value
+
+    def _lookup(self, kind: str, key: UUID | str | ListKey) -> Any:
+        entry_key = _entry_key(kind, key)
+        entry = self._entries.get(entry_key)
+        stats = self._stats_for(kind)
+
+        if entry is None:
+            stats.misses += 1
+            return _MISSING
+
+        expires_at, value = entry
+
+        if expires_at <= time.monotonic():
+            del self._entries[entry_key]
+            stats.misses += 1
+            return _MISSING
+
+        self._entries.move_to_end(entry_key)
+        stats.hits += 1
+        return value
+
+    def _stats_for(self, kind: str) -> CacheStats:
+        stats = self._stats.get(kind)
+
+        if stats is None:
+            stats = self._stats[kind] = CacheStats()
+
+        return stats
+
+
+def _entry_key(kind: str, key: UUID | str | ListKey) -> tuple[str, str | ListKey]:
+    return kind, key if isinstance(key, ListKey) else entity_key(key)
@@ -1,27 +1,47 @@
-import json
-from collections import defaultdict
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import defaultdict, deque
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Mapping
+from contextlib import aclosing
+from copy import deepcopy
+from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Literal, Mapping, Iterable
+from itertools import count, islice
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 from urllib.parse import quote
 from uuid import UUID
 
-import aiohttp
-from beartype import beartype
-from dotenv import load_dotenv
+from pydantic import BaseModel
 
 from moy_sklad_api.dtos.bundle_position import BundlePositionDTO
+from moy_sklad_api.dtos.demand import DemandDTO
 from moy_sklad_api.dtos.demand_position import DemandPositionDTO
+from moy_sklad_api.dtos.inventory import InventoryDTO
 from moy_sklad_api.dtos.inventory_position import InventoryPositionDTO
+from moy_sklad_api.dtos.move import MoveDTO
 from moy_sklad_api.dtos.move_position import MovePositionDTO
 
+from moy_sklad_api.cache import ListKey, ReferenceCache, entity_key
+from moy_sklad_api.batching import (
+    MAX_URL_LENGTH,
+    PAGINATION_PARAMS_RESERVE,
+    EntityLoader,
+    chunk_filter_values,
+    filter_expression,
+)
+from moy_sklad_api.bulk import MAX_BULK_SIZE, BulkItemResult, chunk_error, chunk_results, chunked
+from moy_sklad_api.codec import CodecName, JSONCodec, get_codec
 from moy_sklad_api.exceptions import (
     MoySkladAPIException,
     MoySkladConnectionError,
+    MoySkladHTTPError,
     MoySkladRequestError,
     MoySkladValidationError,
 )
 from moy_sklad_api.filter import Filter
-from moy_sklad_api.enums import EntityType, ProductType, ErrorCode, CREATED_AUTOMATICALLY
+from moy_sklad_api.enums import EntityType, ExpandStrategy, ProductType, ErrorCode, CREATED_AUTOMATICALLY
 from moy_sklad_api.models import (
     MoveModel,
     ProductModel,
@@ -30,13 +50,56 @@ from moy_sklad_api.models import (
     ProductExpandStocksModel,
     VariantModel, LossModel, TurnoverReportByStoreRowModel
 )
+from moy_sklad_api.models.compact import (
+    InventoryRow,
+    LossRow,
+    MoveRow,
+    StockRow,
+    inventory_row,
+    loss_row,
+    move_row,
+    stock_row_from_current,
+    stock_row_from_report,
+)
 from moy_sklad_api.models.metadata import MetaModel
+from moy_sklad_api.models.position import AssortmentRefModel
 from moy_sklad_api.models.bundle import BundleModel
 from moy_sklad_api.models.demand import DemandModel
 from moy_sklad_api.models.inventory import InventoryModel
-from moy_sklad_api.utils import convert_to_project_timezone, tries, get_required_env
+from moy_sklad_api.payload import meta_ref, position_rows, ref
+from moy_sklad_api.metrics import (
+    CallbackObserver,
+    MetricsObserver,
+    RequestMetrics,
+    RequestTimer,
+    ValidationMetrics,
+    endpoint_template,
+)
+from moy_sklad_api.rate_limit import RATE_LIMIT_REMAINING_HEADER, RateLimiter, _int_header, get_shared_rate_limiter
+from moy_sklad_api.retry import RetryPolicy, parse_retry_after
+from moy_sklad_api.streaming import iter_json_array
+from moy_sklad_api.transport import DEFAULT_TRANSPORT, TransportConfig, get_shared_session, preconnect_session
+from moy_sklad_api.utils import convert_to_project_timezone, get_required_env, load_env, validate_rows
+from moy_sklad_api.validation import check_batch, get_validation_level, runtime_checked
+
+# aiohttp — самая долгая часть импорта клиента, поэтому он загружается при первом
+# запросе: методы импортируют его локально (повторно это лишь поиск в sys.modules).
+if TYPE_CHECKING:
+    import aiohttp
 
-load_dotenv()
+ModelT = TypeVar("ModelT", bound=BaseModel)
+RowT = TypeVar("RowT")
+ResultT = TypeVar("ResultT")
+
+# Разбор строки ответа: pydantic-модель либо фабрика компактной строки.
+RowParser = type[RowT] | Callable[[Mapping], RowT]
+
+
+# Типы assortment, которые стратегия RESOLVE догружает по id.
+_RESOLVABLE_TYPES: dict[str, EntityType] = {
+    "product": EntityType.PRODUCT,
+    "variant": EntityType.MODIFICATION,
+}
 
 
 def _is_moysklad_errors_body(payload: dict[str, Any]) -> bool:
@@ -44,64 +107,173 @@ def _is_moysklad_errors_body(payload: dict[str, Any]) -> bool:
     return isinstance(errors, list)
 
 
-request_attempts = int(get_required_env("MOY_SKLAD_REQUEST_ATTEMPTS"))
-attempt_timeout = int(get_required_env("MOY_SKLAD_ATTEMPT_TIMEOUT"))
+@dataclass(slots=True)
+class _InflightGet:
+    """Выполняющийся GET и число вызывающих, которые ждут его результата."""
+
+    task: asyncio.Future
+    waiters: int = 0
+
+
+def default_retry_policy() -> RetryPolicy:
+    """Политика повторов из ``MOY_SKLAD_REQUEST_ATTEMPTS`` и ``MOY_SKLAD_ATTEMPT_TIMEOUT``.
+
+    Переменные читаются при создании клиента, а не при импорте модуля.
+    """
+    load_env()
+    request_attempts = int(get_required_env("MOY_SKLAD_REQUEST_ATTEMPTS"))
+    attempt_timeout = int(get_required_env("MOY_SKLAD_ATTEMPT_TIMEOUT"))
+    return RetryPolicy(attempts=request_attempts, base_delay=attempt_timeout)
+
+
+def __getattr__(name: str) -> Any:
+    # Совместимость: раньше политика по умолчанию строилась при импорте.
+    if name == "DEFAULT_RETRY_POLICY":
+        return default_retry_policy()
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
-@tries(times=request_attempts, timeout=attempt_timeout)
 class MoySkladAPIClient:
     _BASE_URL = "https://api.moysklad.ru/api/remap/1.2"
 
-    def __init__(self, session: aiohttp.ClientSession | None = None):
-        self._base_url = self._BASE_URL
+    # Максимальный limit для списков: 1000 без expand, 100 если expand задан.
+    _MAX_PAGE_SIZE = 1000
+    _MAX_EXPANDED_PAGE_SIZE = 100
+    _PAGINATION_CONCURRENCY = 5
+    _STREAM_CHUNK_SIZE = 64 * 1024
+
+    # expand документов и комплектов для каждой стратегии загрузки assortment.
+    _POSITIONS_EXPANDS: dict[ExpandStrategy, str] = {
+        ExpandStrategy.FULL: "positions.assortment.product",
+        ExpandStrategy.REFERENCES: "positions",
+        ExpandStrategy.RESOLVE: "positions",
+    }
+    _COMPONENTS_EXPANDS: dict[ExpandStrategy, str] = {
+        ExpandStrategy.FULL: "components.assortment.product",
+        ExpandStrategy.REFERENCES: "components",
+        ExpandStrategy.RESOLVE: "components",
+    }
+
+    # Модель и expand для загрузки по id — как у соответствующих iter_* методов.
+    _BY_IDS_EXPANDS: dict[EntityType, tuple[type[BaseModel], str | None]] = {
+        EntityType.PRODUCT: (ProductModel, None),
+        EntityType.MODIFICATION: (VariantModel, "product"),
+        EntityType.BUNDLE: (BundleModel, "components.assortment.product"),
+    }
+
+    def __init__(
+            self,
+            session: aiohttp.ClientSession | None = None,
+            *,
+            pagination_concurrency: int = _PAGINATION_CONCURRENCY,
+            rate_limiter: RateLimiter | None = None,
+            retry_policy: RetryPolicy | None = None,
+            transport: TransportConfig = DEFAULT_TRANSPORT,
+            shared_session: bool = False,
+            codec: JSONCodec | CodecName = "auto",
+            cache: ReferenceCache | None = None,
+            coalesce_requests: bool = True,
+            metrics: MetricsObserver | Callable[[RequestMetrics | ValidationMetrics], None] | None = None,
+            base_url: str = _BASE_URL,
+    ):
+        if pagination_concurrency < 1:
+            raise MoySkladValidationError("pagination_concurrency должен быть положительным.")
 
+        # base_url меняется для локальных заглушек API (бенчмарки, отладка).
+        self._base_url = base_url.rstrip("/")
+        self._pagination_concurrency = pagination_concurrency
+
+        # .env и переменные окружения читаются здесь, чтобы импорт пакета был без побочных эффектов.
+        load_env()
         access_token = get_required_env("MOY_SKLAD_ACCESS_TOKEN")
 
+        # Уровень проверки типов общий для процесса; MOY_SKLAD_VALIDATION учитывается один раз.
+        get_validation_level()
+
+        self._access_token = access_token
         self._headers = {
             "Authorization": f"Bearer {access_token}",
             "Accept-Encoding": "gzip"
         }
 
-        if session is None:
-            self._session = aiohttp.ClientSession()
-            self._own_session = True
+        # Если ограничитель не передан, берётся общий для токена при первом запросе.
+        self._rate_limiter = rate_limiter
+        self._retry_policy = retry_policy if retry_policy is not None else default_retry_policy()
+        self._codec = get_codec(codec) if isinstance(codec, str) else codec
 
-        else:
-            self._session = session
-            self._own_session = False
+        # Без явной сессии клиент, как и раньше, создаёт собственную и закрывает её
+        # в close(). С shared_session=True он берёт общую сессию event loop: её не
+        # закрывает close(), она живёт до остановки loop или close_shared_sessions().
+        self._transport = transport
+        self._session = session
+        self._own_session = session is None and not shared_session
+
+        # Кэш справочников (склады, проекты, товары) включается явно.
+        self._cache = cache
 
+        self._coalesce_requests = coalesce_requests
+        self._inflight: dict[tuple[str, tuple[tuple[str, str], ...]], _InflightGet] = {}
+        self._loaders: dict[EntityType, EntityLoader] = {}
+
+        # Наблюдатель метрик: длительности фаз каждой попытки запроса и разбора строк.
+        if metrics is not None and not hasattr(metrics, "on_request"):
+            metrics = CallbackObserver(metrics)
+
+        self._metrics: MetricsObserver | None = metrics
+
+    @property
+    def cache(self) -> ReferenceCache | None:
+        return self._cache
+
+    async def _cached(self, kind: EntityType, key: str | ListKey, load: Callable[[], Awaitable[ResultT]]) -> ResultT:
+        """Загрузить справочник через кэш, если он включён. Кэшируется уже разобранный результат."""
+        if self._cache is None:
+            return await load()
+
+        return await self._cache.get_or_load(kind, key, load)
+
+    @runtime_checked
     @staticmethod
-    @beartype
-    async def get_token(login: str, password: str) -> str:
+    async def get_token(login: str, password: str, *, session: aiohttp.ClientSession | None = None) -> str:
+        """Получить токен по логину и паролю.
+
+        Без ``session`` запрос идёт через общую сессию event loop, как у клиентов
+        с ``shared_session=True``: повторные вызовы не открывают новых соединений.
+        """
         if not login or not password:
             raise MoySkladValidationError("Логин и пароль обязательны для получения токена.")
 
+        import aiohttp
+
         url = f"{MoySkladAPIClient._BASE_URL}/security/token"
         auth = aiohttp.BasicAuth(login, password)
 
-        async with aiohttp.ClientSession() as session:
-            try:
-                async with session.post(
-                        url,
-                        auth=auth,
-                        headers={"Accept-Encoding": "gzip"},
-                ) as response:
-                    response_data = await response.json()
+        if session is None:
+            session = get_shared_session()
 
-                    if response.status >= 400:
-                        error_info = response_data if isinstance(response_data, dict) else {"error": str(response_data)}
-                        raise Exception(f"Ошибка получения токена (HTTP {response.status}): {error_info}")
+        try:
+            async with session.post(
+                    url,
+                    auth=auth,
+                    headers={"Accept-Encoding": "gzip"},
+            ) as response:
+                response_data = await response.json()
+
+                if response.status >= 400:
+                    error_info = response_data if isinstance(response_data, dict) else {"error": str(response_data)}
+                    raise Exception(f"Ошибка получения токена (HTTP {response.status}): {error_info}")
 
-                    access_token = response_data.get("access_token")
-                    if not access_token:
-                        raise Exception(f"Токен не найден в ответе API: {response_data}")
+                access_token = response_data.get("access_token")
+                if not access_token:
+                    raise Exception(f"Токен не найден в ответе API: {response_data}")
 
-                    return access_token
+                return access_token
 
-            except aiohttp.ClientError as e:
-                raise Exception(f"Ошибка сети при получении токена: {e}")
+        except aiohttp.ClientError as e:
+            raise Exception(f"Ошибка сети при получении токена: {e}")
 
-    @beartype
+    @runtime_checked
     async def get_warehouses(
             self, *,
             filters: dict[str, Any] | list[Filter] | None = None,
@@ -112,27 +284,32 @@ class MoySkladAPIClient:
         query_string = self._build_query_string(filters=filters, order=order, limit=limit)
         url = f"{self._base_url}/entity/store{query_string}"
 
-        response = await self._async_get(url)
+        async def load() -> list[WarehouseModel]:
+            response = await self._async_get(url)
+            return self._parse_rows(WarehouseModel, response["rows"])
 
-        return [WarehouseModel.model_validate(item) for item in response["rows"]]
+        # Копия списка, чтобы вызывающий не изменил закэшированный.
+        return list(await self._cached(EntityType.STORE, ListKey(url), load))
 
-    @beartype
+    @runtime_checked
     async def _get_projects(self) -> Mapping:
 
         url = f"{self._base_url}/entity/project"
 
-        return await self._async_get(url)
+        return await self._cached(EntityType.PROJECT, ListKey(url), lambda: self._async_get(url))
 
-    @beartype
+    @runtime_checked
     async def get_warehouse_by_id(self, warehouse_id: str | UUID) -> WarehouseModel | None:
 
-        url = f"{self._base_url}/entity/store/{str(warehouse_id)}"
-        response = await self._async_get(url)
+        warehouse_key = entity_key(warehouse_id)
+        url = f"{self._base_url}/entity/store/{warehouse_key}"
+        async def load() -> WarehouseModel:
+            return WarehouseModel.model_validate(await self._async_get(url))
 
-        return WarehouseModel.model_validate(response)
+        return await self._cached(EntityType.STORE, warehouse_key, load)
 
+    @runtime_checked
     @staticmethod
-    @beartype
     def _build_query_string(
             filters: list[Filter] | None = None,
             order: str | None = None,
@@ -184,7 +361,7 @@ class MoySkladAPIClient:
 
         return f"?{'&'.join(query_parts)}"
 
-    @beartype
+    @runtime_checked
     async def get_products(
             self, *,
             filters: list[Filter] | None = None,
@@ -197,178 +374,234 @@ class MoySkladAPIClient:
 
         response = await self._async_get(url)
 
-        return [ProductModel.model_validate(item) for item in response["rows"]]
+        return self._parse_rows(ProductModel, response["rows"])
 
-    @beartype
-    async def get_products_by_path_name(
+    @runtime_checked
+    def iter_products_by_path_name(
             self,
             path_name: str,
             recursive: bool=False,
-    ) -> list[ProductModel]:
+    ) -> AsyncIterator[ProductModel]:
         filter_operator = "~=" if recursive else "="
         filter_expression = f"pathName{filter_operator}{Filter.format_value(path_name)}"
 
-        all_items: list[Mapping] = []
-        entity_per_request: int = 100
-        pagination_page = 0
-
-        while True:
-            offset = pagination_page * entity_per_request
-            query_string = (
-                f"?filter={quote(filter_expression, safe='=~/')}"
-                f"&expand=uom&limit={entity_per_request}&offset={offset}"
-            )
-            url = f"{self._base_url}/entity/product{query_string}"
+        url = f"{self._base_url}/entity/product?filter={quote(filter_expression, safe='=~/')}"
+        return self._iter_validated(url, ProductModel, expand="uom")
 
-            response = await self._async_get(url)
-
-            items: list[Mapping] = response["rows"]
-            all_items.extend(items)
-            pagination_page += 1
-
-            if len(items) < entity_per_request:
-                break
+    @runtime_checked
+    async def get_products_by_path_name(
+            self,
+            path_name: str,
+            recursive: bool=False,
+    ) -> list[ProductModel]:
+        return [item async for item in self.iter_products_by_path_name(path_name, recursive)]
 
-        return [ProductModel.model_validate(item) for item in all_items]
+    @runtime_checked
+    def iter_variants(
+            self, *,
+            filters: list[Filter] | None = None,
+            order: str | None = None,
+    ) -> AsyncIterator[VariantModel]:
+        query_string = self._build_query_string(filters=filters, order=order)
+        url = f"{self._base_url}/entity/variant{query_string}"
+        return self._iter_validated(url, VariantModel, expand="product")
 
-    @beartype
+    @runtime_checked
     async def get_variants(
             self, *,
             filters: list[Filter] | None = None,
             order: str | None = None,
             limit: int | None = None,
     ) -> list[VariantModel]:
+        return [item async for item in self.iter_variants(filters=filters, order=order)]
 
-        all_items: list[Mapping] = []
-
-        entity_per_request: int = 100
-        pagination_page = 0
-
-        while True:
-            query_string = self._build_query_string(
-                filters=filters,
-                order=order,
-                limit=entity_per_request,
-                offset=pagination_page * entity_per_request,
-                expand="product"
-            )
-
-            url = f"{self._base_url}/entity/variant{query_string}"
-
-            response = await self._async_get(url)
-
-            items: list[Mapping] = response["rows"]
-
-            all_items.extend(items)
-            pagination_page += 1
+    @runtime_checked
+    def iter_variants_by_product_ids(
+            self,
+            product_ids: list[UUID | str],
+            *,
+            order: str | None = None,
+    ) -> AsyncIterator[VariantModel]:
+        """Модификации товаров; длинный список id делится на несколько запросов.
 
-            if len(items) < entity_per_request:
-                break
+        При нескольких запросах ``order`` соблюдается только внутри каждого из них.
+        """
+        url = f"{self._base_url}/entity/variant"
+        query = f"order={order}" if order else ""
 
-        return [VariantModel.model_validate(item) for item in all_items]
+        return self._iter_validated_chunked(
+            url, "productid", product_ids, VariantModel, query=query, expand="product.uom",
+        )
 
-    @beartype
+    @runtime_checked
     async def get_variants_by_product_ids(
             self,
             product_ids: list[UUID | str],
             *,
             order: str | None = None,
     ) -> list[VariantModel]:
-        all_items: list[Mapping] = []
-        entity_per_request: int = 100
-        pagination_page = 0
-
-        filters = [Filter(field="productid", value=product_ids)]
-
-        while True:
-            offset = pagination_page * entity_per_request
-            query_string = self._build_query_string(
-                filters=filters,
-                order=order,
-                limit=entity_per_request,
-                offset=offset,
-                expand="product.uom",
-            )
-
-            url = f"{self._base_url}/entity/variant{query_string}"
-            response = await self._async_get(url)
-
-            items: list[Mapping] = response["rows"]
-            all_items.extend(items)
-            pagination_page += 1
-
-            if len(items) < entity_per_request:
-                break
+        return [item async for item in self.iter_variants_by_product_ids(product_ids, order=order)]
 
-        return [VariantModel.model_validate(item) for item in all_items]
-
-    @beartype
+    @runtime_checked
+    def iter_bundles(
+            self, *,
+            filters: list[Filter] | None = None,
+            order: str | None = None,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
+    ) -> AsyncIterator[BundleModel]:
+        """Комплекты; ``expand`` задаёт загрузку assortment компонентов, см. ``ExpandStrategy``."""
+        query_string = self._build_query_string(filters=filters, order=order)
+        url = f"{self._base_url}/entity/bundle{query_string}"
+        return self._iter_bundles(url, expand)
+
+    @runtime_checked
     async def get_bundles(
             self, *,
             filters: list[Filter] | None = None,
             order: str | None = None,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
     ) -> list[BundleModel]:
-        all_items: list[Mapping] = []
-
-        entity_per_request: int = 100
-        pagination_page = 0
-
-        while True:
-            query_string = self._build_query_string(
-                filters=filters,
-                order=order,
-                limit=entity_per_request,
-                offset=pagination_page * entity_per_request,
-                expand="components.assortment.product"
-            )
-
-            url = f"{self._base_url}/entity/bundle{query_string}"
-
-            response = await self._async_get(url)
-
-            items: list[Mapping] = response["rows"]
+        return [item async for item in self.iter_bundles(filters=filters, order=order, expand=expand)]
 
-            all_items.extend(items)
-            pagination_page += 1
-
-            if len(items) < entity_per_request:
-                break
+    @runtime_checked
+    def iter_bundles_by_path_name(
+            self,
+            path_name: str,
+            recursive: bool=False,
+            *,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
+    ) -> AsyncIterator[BundleModel]:
+        filter_operator = "~=" if recursive else "="
+        filter_expression = f"pathName{filter_operator}{Filter.format_value(path_name)}"
 
-        return [BundleModel.model_validate(item) for item in all_items]
+        url = f"{self._base_url}/entity/bundle?filter={quote(filter_expression, safe='=~/')}"
+        return self._iter_bundles(url, expand)
 
-    @beartype
+    @runtime_checked
     async def get_bundles_by_path_name(
             self,
             path_name: str,
             recursive: bool=False,
+            *,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
     ) -> list[BundleModel]:
-        filter_operator = "~=" if recursive else "="
-        filter_expression = f"pathName{filter_operator}{Filter.format_value(path_name)}"
+        return [item async for item in self.iter_bundles_by_path_name(path_name, recursive, expand=expand)]
+
+    def _iter_bundles(self, url: str, expand: ExpandStrategy | str) -> AsyncIterator[BundleModel]:
+        strategy = self._expand_strategy(expand)
+        resolve = "components" if strategy is ExpandStrategy.RESOLVE else None
+        return self._iter_validated(url, BundleModel, expand=self._COMPONENTS_EXPANDS[strategy], resolve=resolve)
+
+    @runtime_checked
+    async def get_products_by_ids(self, product_ids: Iterable[UUID | str]) -> list[ProductModel]:
+        """Товары по списку id несколькими запросами ``filter=id=...;id=...``.
+
+        Порядок не гарантируется; отсутствующие id пропускаются.
+        """
+        return await self._get_entities_by_ids(EntityType.PRODUCT, product_ids)
 
-        all_items: list[Mapping] = []
-        entity_per_request: int = 100
-        pagination_page = 0
+    @runtime_checked
+    async def get_variants_by_ids(self, variant_ids: Iterable[UUID | str]) -> list[VariantModel]:
+        return await self._get_entities_by_ids(EntityType.MODIFICATION, variant_ids)
 
-        while True:
-            offset = pagination_page * entity_per_request
-            query_string = (
-                f"?filter={quote(filter_expression, safe='=~/')}"
-                f"&expand=components.assortment.product&limit={entity_per_request}&offset={offset}"
+    @runtime_checked
+    async def get_bundles_by_ids(self, bundle_ids: Iterable[UUID | str]) -> list[BundleModel]:
+        return await self._get_entities_by_ids(EntityType.BUNDLE, bundle_ids)
+
+    @runtime_checked
+    def loader(self, entity_type: EntityType) -> EntityLoader:
+        """Загрузчик товаров, модификаций или комплектов по id.
+
+        ``await client.loader(EntityType.PRODUCT).load(product_id)`` из многих
+        корутин в одном проходе event loop превращается в один списочный запрос.
+        """
+        if entity_type not in self._BY_IDS_EXPANDS:
+            raise MoySkladValidationError(f"Загрузка по id не поддерживается для '{entity_type}'.")
+
+        entity_loader = self._loaders.get(entity_type)
+
+        if entity_loader is None:
+            entity_loader = self._loaders[entity_type] = EntityLoader(
+                lambda entity_ids: self._get_entities_by_ids(entity_type, entity_ids),
             )
-            url = f"{self._base_url}/entity/bundle{query_string}"
 
-            response = await self._async_get(url)
+        return entity_loader
+
+    async def _get_entities_by_ids(self, entity_type: EntityType, entity_ids: Iterable[UUID | str]) -> list[Any]:
+        model, expand = self._BY_IDS_EXPANDS[entity_type]
+        entity_ids = list(dict.fromkeys(entity_key(entity_id) for entity_id in entity_ids))
+        found: list[Any] = []
+
+        if self._cache is not None:
+            missing: list[str] = []
+
+            for entity_id in entity_ids:
+                cached = self._cache.get(entity_type, entity_id)
+
+                if cached is None:
+                    missing.append(entity_id)
+                else:
+                    found.append(cached)
+
+            entity_ids = missing
+
+        url = f"{self._base_url}/entity/{entity_type}"
+
+        async with aclosing(self._iter_validated_chunked(url, "id", entity_ids, model, expand=expand)) as entities:
+            async for entity in entities:
+                if self._cache is not None:
+                    self._cache.set(entity_type, entity_key(entity.id), entity)
+
+                found.append(entity)
+
+        return found
+
+    @runtime_checked
+    def iter_changed_pages(
+            self,
+            entity_type: EntityType,
+            *,
+            updated_since: datetime | None = None,
+            expand: str | None = None,
+    ) -> AsyncIterator[list[Mapping]]:
+        """Постранично выгрузить сырые строки сущностей, включая архивные.
+
+        Если задан ``updated_since``, отдаются только сущности с ``updated`` не
+        раньше этого момента (с точностью до секунды, как в фильтрах API).
+        """
+        filter_expression = "archived=true;archived=false"
+
+        if updated_since is not None:
+            filter_expression += f";updated>={Filter.format_value(updated_since)}"
 
-            items: list[Mapping] = response["rows"]
-            all_items.extend(items)
-            pagination_page += 1
+        url = f"{self._base_url}/entity/{entity_type}?filter={quote(filter_expression, safe='=;')}"
+        return self._iter_pages(url, expand=expand)
 
-            if len(items) < entity_per_request:
-                break
+    @runtime_checked
+    def iter_changed_documents(
+            self,
+            entity_type: EntityType,
+            *,
+            from_date: datetime,
+            to_date: datetime,
+            updated_since: datetime | None = None,
+            expand: str = "positions.assortment.product",
+    ) -> AsyncIterator[list[Mapping]]:
+        """Постранично выгрузить сырые документы с ``moment`` в периоде и полными позициями.
+
+        Если задан ``updated_since``, отдаются только документы, изменённые не раньше него.
+        """
+        filter_expression = (
+            f"moment>={Filter.format_value(from_date)};moment<={Filter.format_value(to_date)}"
+        )
+
+        if updated_since is not None:
+            filter_expression += f";updated>={Filter.format_value(updated_since)}"
 
-        return [BundleModel.model_validate(item) for item in all_items]
+        url = f"{self._base_url}/entity/{entity_type}?filter={quote(filter_expression, safe='=;')}"
+        return self._iter_document_pages(url, expand=expand)
 
-    @beartype
+    @runtime_checked
     async def create_bundle(
             self,
             name: str,
@@ -376,6 +609,8 @@ class MoySkladAPIClient:
             components: list[BundlePositionDTO],
             path_name: str | None = None,
     ) -> UUID:
+        check_batch(components, BundlePositionDTO, name="components")
+
         url = f"{self._base_url}/entity/bundle"
 
         data = {
@@ -383,9 +618,7 @@ class MoySkladAPIClient:
             "code": code,
             "components": [
                 {
-                    "assortment": {
-                        "meta": MetaModel.for_entity(component.product_id, component.product_type).to_api_dict()
-                    },
+                    "assortment": ref(component.product_type, component.product_id),
                     "quantity": component.quantity,
                 }
                 for component in components
@@ -399,7 +632,7 @@ class MoySkladAPIClient:
 
         return UUID(response["id"])
 
-    @beartype
+    @runtime_checked
     async def archive_bundle(self, bundle_id: UUID):
         url = f"{self._base_url}/entity/bundle/{bundle_id}"
         data = {
@@ -410,7 +643,54 @@ class MoySkladAPIClient:
 
         return UUID(response["id"])
 
-    @beartype
+    @runtime_checked
+    async def archive_bundles(
+            self,
+            bundle_ids: list[UUID],
+            *,
+            archived: bool = True,
+    ) -> list[BulkItemResult]:
+        """Архивировать (или вернуть из архива) комплекты массовыми запросами."""
+        changes = {bundle_id: {"archived": archived} for bundle_id in bundle_ids}
+        return await self.update_entities(EntityType.BUNDLE, changes)
+
+    @runtime_checked
+    async def archive_products(
+            self,
+            product_ids: list[UUID],
+            *,
+            archived: bool = True,
+    ) -> list[BulkItemResult]:
+        """Архивировать (или вернуть из архива) товары массовыми запросами."""
+        changes = {product_id: {"archived": archived} for product_id in product_ids}
+        return await self.update_entities(EntityType.PRODUCT, changes)
+
+    @runtime_checked
+    async def update_entities(
+            self,
+            entity_type: EntityType | ProductType,
+            changes: Mapping[UUID, Mapping[str, Any]],
+            *,
+            chunk_size: int = MAX_BULK_SIZE,
+    ) -> list[BulkItemResult]:
+        """Массово изменить поля существующих сущностей.
+
+        ``changes`` сопоставляет id сущности с изменяемыми полями в формате API
+        (например ``{"archived": True}``). Каждое изменение отправляется как элемент
+        массива ``{"meta": ..., **поля}`` в POST ``/entity/<type>``; куски по
+        ``chunk_size`` выполняются параллельно. Результаты — в порядке ``changes``.
+        """
+        payloads = [
+            {
+                "meta": meta_ref(entity_type, entity_id),
+                **fields,
+            }
+            for entity_id, fields in changes.items()
+        ]
+
+        return await self._bulk_post(entity_type, payloads, chunk_size=chunk_size)
+
+    @runtime_checked
     async def get_demands(
             self, *,
             filters: list[Filter] | None = None,
@@ -423,17 +703,23 @@ class MoySkladAPIClient:
 
         response = await self._async_get(url)
 
-        return [DemandModel.model_validate(item) for item in response["rows"]]
+        return self._parse_rows(DemandModel, response["rows"])
 
-    @beartype
-    async def get_moves(
+    @runtime_checked
+    def iter_moves(
             self,
             *,
             from_date: datetime,
             to_date: datetime,
             order: str | None = None,
-    ) -> list[MoveModel]:
-
+            compact: bool = False,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
+    ) -> AsyncIterator[MoveModel] | AsyncIterator[MoveRow]:
+        """Перемещения за период.
+
+        ``expand`` задаёт загрузку assortment позиций (см. ``ExpandStrategy``);
+        компактные строки всегда читаются со ссылками, в них только id.
+        """
         from_date = convert_to_project_timezone(from_date)
         to_date = convert_to_project_timezone(to_date)
 
@@ -444,43 +730,41 @@ class MoySkladAPIClient:
             f"moment>={from_dt.isoformat(sep=' ')};moment<={to_dt.isoformat(sep=' ')}"
         )
 
-        page_size = 100
-        offset = 0
-        all_items: list[Mapping] = []
-
-        while True:
-            query_parts: list[str] = [f"filter={filter_expr}"]
-
-            if order:
-                query_parts.append(f"order={order}")
-
-            query_parts.append("expand=positions.assortment.product")
-            query_parts.append(f"limit={page_size}")
-            query_parts.append(f"offset={offset}")
-
-            query_string = f"?{'&'.join(query_parts)}"
-            url = f"{self._base_url}/entity/move{query_string}"
-            response = await self._async_get(url)
-
-            rows: list[Mapping] = response.get("rows", [])
-            all_items.extend(rows)
+        query_parts: list[str] = [f"filter={filter_expr}"]
 
-            if len(rows) < page_size:
-                break
+        if order:
+            query_parts.append(f"order={order}")
 
-            offset += page_size
+        url = f"{self._base_url}/entity/move?{'&'.join(query_parts)}"
+        if compact:
+            return self._iter_documents(url, move_row, expand="positions")
 
-        return [MoveModel.model_validate(item) for item in all_items]
+        return self._iter_documents_by_strategy(url, MoveModel, expand)
 
-    @beartype
-    async def get_inventories(
+    @runtime_checked
+    async def get_moves(
             self,
             *,
             from_date: datetime,
             to_date: datetime,
             order: str | None = None,
-    ) -> list[InventoryModel]:
-
+            compact: bool = False,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
+    ) -> list[MoveModel] | list[MoveRow]:
+        iterator = self.iter_moves(from_date=from_date, to_date=to_date, order=order, compact=compact, expand=expand)
+        return [item async for item in iterator]
+
+    @runtime_checked
+    def iter_inventories(
+            self,
+            *,
+            from_date: datetime,
+            to_date: datetime,
+            order: str | None = None,
+            compact: bool = False,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
+    ) -> AsyncIterator[InventoryModel] | AsyncIterator[InventoryRow]:
+        """Инвентаризации за период; ``expand`` и ``compact`` — как в ``iter_moves``."""
         from_date = convert_to_project_timezone(from_date)
         to_date = convert_to_project_timezone(to_date)
 
@@ -491,33 +775,31 @@ class MoySkladAPIClient:
             f"moment>={from_dt.isoformat(sep=' ')};moment<={to_dt.isoformat(sep=' ')};"
         )
 
-        page_size = 100
-        offset = 0
-        all_items: list[Mapping] = []
-
-        while True:
-            query_parts: list[str] = [f"filter={filter_expr}"]
-
-            if order:
-                query_parts.append(f"order={order}")
+        query_parts: list[str] = [f"filter={filter_expr}"]
 
-            query_parts.append(f"limit={page_size}")
-            query_parts.append(f"offset={offset}")
-            query_parts.append(f"expand=positions.assortment.product")
-
-            query_string = f"?{'&'.join(query_parts)}"
-            url = f"{self._base_url}/entity/inventory{query_string}"
-            response = await self._async_get(url)
-
-            rows: list[Mapping] = response.get("rows", [])
-            all_items.extend(rows)
+        if order:
+            query_parts.append(f"order={order}")
 
-            if len(rows) < page_size:
-                break
+        url = f"{self._base_url}/entity/inventory?{'&'.join(query_parts)}"
+        if compact:
+            return self._iter_documents(url, inventory_row, expand="positions")
 
-            offset += page_size
+        return self._iter_documents_by_strategy(url, InventoryModel, expand)
 
-        return [InventoryModel.model_validate(item) for item in all_items]
+    @runtime_checked
+    async def get_inventories(
+            self,
+            *,
+            from_date: datetime,
+            to_date: datetime,
+            order: str | None = None,
+            compact: bool = False,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
+    ) -> list[InventoryModel] | list[InventoryRow]:
+        iterator = self.iter_inventories(
+            from_date=from_date, to_date=to_date, order=order, compact=compact, expand=expand,
+        )
+        return [item async for item in iterator]
 
     async def create_demand(
             self,
@@ -529,40 +811,54 @@ class MoySkladAPIClient:
             project_id: UUID,
             sales_channel_id: UUID,
     ) -> DemandModel:
+        check_batch(positions, DemandPositionDTO, name="positions")
 
         url = f"{self._base_url}/entity/demand"
 
-        moment = convert_to_project_timezone(moment)
-
-        store_metadata = {"meta": MetaModel.for_entity(warehouse_id, EntityType.STORE).to_api_dict()}
-        organization_metadata = {"meta": MetaModel.for_entity(organization_id, EntityType.ORGANIZATION).to_api_dict()}
-        agent_metadata = {"meta": MetaModel.for_entity(agent_id, EntityType.AGENT).to_api_dict()}
-        project_metadata = {"meta": MetaModel.for_entity(project_id, EntityType.PROJECT).to_api_dict()}
-        sales_channel_metadata = {
-            "meta": MetaModel.for_entity(sales_channel_id, EntityType.SALES_CHANNEL).to_api_dict()}
-
-        data = {
-            "moment": moment.replace(tzinfo=None, microsecond=0).isoformat(sep=" "),
-            "organization": organization_metadata,
-            "store": store_metadata,
-            "agent": agent_metadata,
-            "project": project_metadata,
-            "salesChannel": sales_channel_metadata,
-            "description": CREATED_AUTOMATICALLY,
-            "positions": [
-                {
-                    "quantity": position.quantity,
-                    "price": position.price,
-                    "assortment": {
-                        "meta": MetaModel.for_entity(position.product_id, position.product_type).to_api_dict()
-                    }
-                } for position in positions],
-        }
+        data = self._demand_payload(
+            warehouse_id=warehouse_id,
+            positions=positions,
+            moment=moment,
+            organization_id=organization_id,
+            agent_id=agent_id,
+            project_id=project_id,
+            sales_channel_id=sales_channel_id,
+        )
 
         response = await self._async_post(url, data)
 
         return DemandModel.model_validate(response)
 
+    @runtime_checked
+    async def create_demands(
+            self,
+            documents: list[DemandDTO],
+            *,
+            chunk_size: int = MAX_BULK_SIZE,
+    ) -> list[BulkItemResult]:
+        """Создать отгрузки массовыми запросами (массив сущностей в одном POST).
+
+        Документы отправляются кусками по ``chunk_size`` (не больше лимита API),
+        куски — параллельно в пределах ограничений клиента. Результат содержит по
+        одному ``BulkItemResult`` на документ в порядке входного списка.
+        """
+        check_batch(documents, DemandDTO, name="documents")
+
+        payloads = [
+            self._demand_payload(
+                warehouse_id=document.warehouse_id,
+                positions=document.positions,
+                moment=document.moment,
+                organization_id=document.organization_id,
+                agent_id=document.agent_id,
+                project_id=document.project_id,
+                sales_channel_id=document.sales_channel_id,
+            )
+            for document in documents
+        ]
+
+        return await self._bulk_post(EntityType.DEMAND, payloads, chunk_size=chunk_size)
+
     # @staticmethod
     # def _inventory_position_row(position: InventoryPosition) -> dict[str, object]:
     #     row: dict[str, object] = {
@@ -576,7 +872,7 @@ class MoySkladAPIClient:
     #     }
     #     return row
 
-    @beartype
+    @runtime_checked
     async def create_inventory(
             self,
             *,
@@ -585,49 +881,55 @@ class MoySkladAPIClient:
             positions: list[InventoryPositionDTO],
             moment: datetime,
     ) -> Mapping:
-        url = f"{self._base_url}/entity/inventory"
+        check_batch(positions, InventoryPositionDTO, name="positions")
 
-        moment = convert_to_project_timezone(moment)
+        url = f"{self._base_url}/entity/inventory"
 
-        data = {
-            "moment": moment.replace(tzinfo=None, microsecond=0).isoformat(sep=" "),
-            "description": CREATED_AUTOMATICALLY,
-            "organization": {
-                "meta": MetaModel.for_entity(organization_id, EntityType.ORGANIZATION).to_api_dict()
-            },
-            "store": {
-                "meta": MetaModel.for_entity(warehouse_id, EntityType.STORE).to_api_dict()
-            },
-            "positions": {
-                "rows": [
-                    {
-                        "quantity": position.quantity,
-                        "assortment": {
-                            "meta": MetaModel.for_entity(
-                                position.product_id,
-                                position.product_type,
-                            ).to_api_dict()
-                        },
-                    }
-                    for position in positions
-                ],
-            },
-        }
+        data = self._inventory_payload(
+            organization_id=organization_id,
+            warehouse_id=warehouse_id,
+            positions=positions,
+            moment=moment,
+        )
 
         return await self._async_post(url, data)
 
-    @beartype
+    @runtime_checked
+    async def create_inventories(
+            self,
+            documents: list[InventoryDTO],
+            *,
+            chunk_size: int = MAX_BULK_SIZE,
+    ) -> list[BulkItemResult]:
+        """Создать инвентаризации массовыми запросами, см. ``create_demands``."""
+        check_batch(documents, InventoryDTO, name="documents")
+
+        payloads = [
+            self._inventory_payload(
+                organization_id=document.organization_id,
+                warehouse_id=document.warehouse_id,
+                positions=document.positions,
+                moment=document.moment,
+            )
+            for document in documents
+        ]
+
+        return await self._bulk_post(EntityType.INVENTORY, payloads, chunk_size=chunk_size)
+
+    @runtime_checked
     async def recalculate_inventory_quantity(self, inventory_id: str | UUID) -> dict[str, Any]:
         url = f"{self._base_url}/rpc/inventory/{str(inventory_id)}/recalcCalculatedQuantity"
         return await self._async_request("PUT", url)
 
     async def get_product_by_id(self, product_id: UUID | str) -> ProductModel:
 
-        url = f"{self._base_url}/entity/product/{str(product_id)}"
+        product_key = entity_key(product_id)
+        url = f"{self._base_url}/entity/product/{product_key}"
 
-        response = await self._async_get(url)
+        async def load() -> ProductModel:
+            return ProductModel.model_validate(await self._async_get(url))
 
-        return ProductModel.model_validate(response)
+        return await self._cached(EntityType.PRODUCT, product_key, load)
 
     async def get_profit(self, filters: list[Filter] | None = None, ):
         query_string = self._build_query_string(filters=filters)
@@ -646,107 +948,136 @@ class MoySkladAPIClient:
             organization_id: UUID,
             project_id: UUID,
     ) -> Mapping:
+        check_batch(positions, MovePositionDTO, name="positions")
 
         url = f"{self._base_url}/entity/move"
 
-        moment = convert_to_project_timezone(moment)
-
-        data = {
-            "moment": moment.replace(tzinfo=None, microsecond=0).isoformat(sep=" "),
-            "description": CREATED_AUTOMATICALLY,
-            "organization": {
-                "meta": MetaModel.for_entity(organization_id, EntityType.ORGANIZATION).to_api_dict()
-            },
-            "project": {
-                "meta": MetaModel.for_entity(project_id, EntityType.PROJECT).to_api_dict()
-            },
-            "sourceStore": {
-                "meta": MetaModel.for_entity(source_store_id, EntityType.STORE).to_api_dict()
-            },
-            "targetStore": {
-                "meta": MetaModel.for_entity(target_store_id, EntityType.STORE).to_api_dict()
-            },
-            "positions": [
-                {
-                    "quantity": position.quantity,
-                    "assortment": {
-                        "meta": MetaModel.for_entity(position.product_id, position.product_type).to_api_dict()
-                    }
-                } for position in positions]
-        }
+        data = self._move_payload(
+            target_store_id=target_store_id,
+            positions=positions,
+            source_store_id=source_store_id,
+            moment=moment,
+            organization_id=organization_id,
+            project_id=project_id,
+        )
 
         response = await self._async_post(url, data)
 
         return response
 
-    async def get_warehouse_current_stocks(self, warehouse_id: UUID) -> list[ProductStocksModel]:
+    @runtime_checked
+    async def create_moves(
+            self,
+            documents: list[MoveDTO],
+            *,
+            chunk_size: int = MAX_BULK_SIZE,
+    ) -> list[BulkItemResult]:
+        """Создать перемещения массовыми запросами, см. ``create_demands``."""
+        check_batch(documents, MoveDTO, name="documents")
+
+        payloads = [
+            self._move_payload(
+                target_store_id=document.target_store_id,
+                positions=document.positions,
+                source_store_id=document.source_store_id,
+                moment=document.moment,
+                organization_id=document.organization_id,
+                project_id=document.project_id,
+            )
+            for document in documents
+        ]
+
+        return await self._bulk_post(EntityType.MOVE, payloads, chunk_size=chunk_size)
+
+    def iter_warehouse_current_stocks(
+            self,
+            warehouse_id: UUID,
+            *,
+            compact: bool = False,
+    ) -> AsyncIterator[ProductStocksModel] | AsyncIterator[StockRow]:
+        """Потоково отдавать остатки склада по мере чтения ответа, не загружая его целиком.
+
+        ``compact=True`` отдаёт ``StockRow`` вместо pydantic-моделей.
+        """
         query_string = f"?filter=storeId={warehouse_id}"
         url = f"{self._base_url}/report/stock/bystore/current{query_string}"
 
-        response = await self._async_get(url)
+        return self._iter_stream_validated(url, stock_row_from_current if compact else ProductStocksModel)
 
-        return [ProductStocksModel.model_validate(item) for item in response]
+    async def get_warehouse_current_stocks(
+            self,
+            warehouse_id: UUID,
+            *,
+            compact: bool = False,
+    ) -> list[ProductStocksModel] | list[StockRow]:
+        return [item async for item in self.iter_warehouse_current_stocks(warehouse_id, compact=compact)]
 
-    async def get_warehouse_stocks_with_moment(
+    def iter_warehouse_stocks_with_moment(
             self,
             filters: list[Filter] | None = None,
             expand: str | None = "meta",
-    ) -> list[ProductExpandStocksModel]:
-
+            *,
+            compact: bool = False,
+    ) -> AsyncIterator[ProductExpandStocksModel] | AsyncIterator[StockRow]:
+        """Потоково отдавать строки ``/report/stock/all`` по мере чтения ответа."""
         query_string = self._build_query_string(filters=filters, expand=expand)
         url = f"{self._base_url}/report/stock/all{query_string}"
 
-        response = await self._async_get(url)
+        parser = stock_row_from_report if compact else ProductExpandStocksModel
+        return self._iter_stream_validated(url, parser, key="rows")
 
-        return [ProductExpandStocksModel.model_validate(item) for item in response["rows"]]
+    async def get_warehouse_stocks_with_moment(
+            self,
+            filters: list[Filter] | None = None,
+            expand: str | None = "meta",
+            *,
+            compact: bool = False,
+    ) -> list[ProductExpandStocksModel] | list[StockRow]:
+        return [item async for item in self.iter_warehouse_stocks_with_moment(filters, expand, compact=compact)]
 
-    async def get_losses(
+    def iter_losses(
             self,
             from_date: datetime,
             to_date: datetime | None,
-            project_id: UUID | None
-    ) -> list[LossModel]:
-
+            project_id: UUID | None,
+            *,
+            compact: bool = False,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
+    ) -> AsyncIterator[LossModel] | AsyncIterator[LossRow]:
+        """Списания за период; ``expand`` и ``compact`` — как в ``iter_moves``."""
         from_date = convert_to_project_timezone(from_date)
         to_date = convert_to_project_timezone(to_date)
 
         from_dt = from_date.replace(tzinfo=None, microsecond=0)
         to_dt = to_date.replace(tzinfo=None, microsecond=0)
 
-        page_size = 100
-        offset = 0
-        all_items: list[Mapping] = []
-
-        while True:
+        query_parts = [
+            f"filter=moment>={from_dt.isoformat(sep=' ')}"
+        ]
 
-            query_parts = [
-                f"filter=moment>={from_dt.isoformat(sep=' ')}"
-            ]
+        if to_date is not None:
+            query_parts.append(f"moment<={to_dt.isoformat(sep=' ')}")
 
-            if to_date is not None:
-                query_parts.append(f"moment<={to_dt.isoformat(sep=' ')}")
+        if project_id is not None:
+            query_parts.append(f"project={MetaModel.for_entity(project_id, EntityType.PROJECT).to_api_dict()}")
 
-            if project_id is not None:
-                query_parts.append(f"project={MetaModel.for_entity(project_id, EntityType.PROJECT).to_api_dict()}")
+        url = f"{self._base_url}/entity/loss?{'&'.join(query_parts)}"
+        if compact:
+            return self._iter_documents(url, loss_row, expand="positions")
 
-            query_parts.append(f"expand=positions.assortment.product")
-
-            query_parts.append(f"limit={page_size}")
-            query_parts.append(f"offset={offset}")
-
-            query_string = f"?{'&'.join(query_parts)}"
-            url = f"{self._base_url}/entity/loss{query_string}"
-            response = await self._async_get(url)
+        return self._iter_documents_by_strategy(url, LossModel, expand)
 
-            rows: list[Mapping] = response.get("rows", [])
-            all_items.extend(rows)
-
-            if len(rows) < page_size:
-                break
-
-            offset += page_size
-
-        return [LossModel.model_validate(item) for item in all_items]
+    async def get_losses(
+            self,
+            from_date: datetime,
+            to_date: datetime | None,
+            project_id: UUID | None,
+            *,
+            compact: bool = False,
+            expand: ExpandStrategy | str = ExpandStrategy.FULL,
+    ) -> list[LossModel] | list[LossRow]:
+        iterator = self.iter_losses(from_date, to_date, project_id, compact=compact, expand=expand)
+        return [item async for item in iterator]
 
     async def create_loss_from_inventory(
             self,
@@ -757,9 +1088,7 @@ class MoySkladAPIClient:
     ):
         async def get_loss_template() -> dict[str, Any] | None:
             data = {
-                "inventory": {
-                    "meta": MetaModel.for_entity(inventory_id, EntityType.INVENTORY).to_api_dict()
-                }
+                "inventory": ref(EntityType.INVENTORY, inventory_id),
             }
 
             try:
@@ -781,7 +1110,7 @@ class MoySkladAPIClient:
             document_moment = convert_to_project_timezone(document_moment)
             template["moment"] = document_moment.replace(tzinfo=None, microsecond=0).isoformat(sep=" ")
 
-        template["project"] = {"meta": MetaModel.for_entity(project_id, EntityType.PROJECT).to_api_dict()}
+        template["project"] = ref(EntityType.PROJECT, project_id)
         template["description"] = CREATED_AUTOMATICALLY
 
         url = f"{self._base_url}/entity/loss"
@@ -797,9 +1126,7 @@ class MoySkladAPIClient:
     ):
         async def get_enter_template() -> dict[str, Any] | None:
             data = {
-                "inventory": {
-                    "meta": MetaModel.for_entity(inventory_id, EntityType.INVENTORY).to_api_dict()
-                }
+                "inventory": ref(EntityType.INVENTORY, inventory_id),
             }
 
             try:
@@ -821,7 +1148,7 @@ class MoySkladAPIClient:
             document_moment = convert_to_project_timezone(document_moment)
             template["moment"] = document_moment.replace(tzinfo=None, microsecond=0).isoformat(sep=" ")
 
-        template["project"] = {"meta": MetaModel.for_entity(project_id, EntityType.PROJECT).to_api_dict()}
+        template["project"] = ref(EntityType.PROJECT, project_id)
         template["description"] = CREATED_AUTOMATICALLY
 
         url = f"{self._base_url}/entity/enter"
@@ -851,61 +1178,733 @@ class MoySkladAPIClient:
 
         response = await self._async_get(url)
 
-        return [TurnoverReportByStoreRowModel.model_validate(item) for item in response["rows"]]
+        return self._parse_rows(TurnoverReportByStoreRowModel, response["rows"])
+
+    @staticmethod
+    def _demand_payload(
+            *,
+            warehouse_id: UUID,
+            positions: Iterable[DemandPositionDTO],
+            moment: datetime,
+            organization_id: UUID,
+            agent_id: UUID,
+            project_id: UUID,
+            sales_channel_id: UUID,
+    ) -> dict[str, Any]:
+        moment = convert_to_project_timezone(moment)
+
+        return {
+            "moment": moment.replace(tzinfo=None, microsecond=0).isoformat(sep=" "),
+            "organization": ref(EntityType.ORGANIZATION, organization_id),
+            "store": ref(EntityType.STORE, warehouse_id),
+            "agent": ref(EntityType.AGENT, agent_id),
+            "project": ref(EntityType.PROJECT, project_id),
+            "salesChannel": ref(EntityType.SALES_CHANNEL, sales_channel_id),
+            "description": CREATED_AUTOMATICALLY,
+            "positions": position_rows(positions, with_price=True),
+        }
+
+    @staticmethod
+    def _inventory_payload(
+            *,
+            organization_id: UUID,
+            warehouse_id: UUID,
+            positions: Iterable[InventoryPositionDTO],
+            moment: datetime,
+    ) -> dict[str, Any]:
+        moment = convert_to_project_timezone(moment)
+
+        return {
+            "moment": moment.replace(tzinfo=None, microsecond=0).isoformat(sep=" "),
+            "description": CREATED_AUTOMATICALLY,
+            "organization": ref(EntityType.ORGANIZATION, organization_id),
+            "store": ref(EntityType.STORE, warehouse_id),
+            "positions": {
+                "rows": position_rows(positions),
+            },
+        }
+
+    @staticmethod
+    def _move_payload(
+            *,
+            target_store_id: UUID,
+            positions: Iterable[MovePositionDTO],
+            source_store_id: UUID,
+            moment: datetime,
+            organization_id: UUID,
+            project_id: UUID,
+    ) -> dict[str, Any]:
+        moment = convert_to_project_timezone(moment)
+
+        return {
+            "moment": moment.replace(tzinfo=None, microsecond=0).isoformat(sep=" "),
+            "description": CREATED_AUTOMATICALLY,
+            "organization": ref(EntityType.ORGANIZATION, organization_id),
+            "project": ref(EntityType.PROJECT, project_id),
+            "sourceStore": ref(EntityType.STORE, source_store_id),
+            "targetStore": ref(EntityType.STORE, target_store_id),
+            "positions": position_rows(positions),
+        }
+
+    async def _bulk_post(
+            self,
+            entity_type: EntityType | ProductType,
+            payloads: list[dict[str, Any]],
+            *,
+            chunk_size: int = MAX_BULK_SIZE,
+    ) -> list[BulkItemResult]:
+        if not 1 <= chunk_size <= MAX_BULK_SIZE:
+            raise MoySkladValidationError(f"chunk_size должен быть от 1 до {MAX_BULK_SIZE}.")
+
+        url = f"{self._base_url}/entity/{entity_type}"
+        semaphore = asyncio.Semaphore(self._pagination_concurrency)
+
+        async def post_chunk(start: int, chunk: list[dict[str, Any]]) -> list[BulkItemResult]:
+            async with semaphore:
+                try:
+                    response = await self._async_post(url, chunk)
+                except MoySkladAPIException as ex:
+                    return chunk_error(start, len(chunk), ex)
+
+            return chunk_results(start, len(chunk), response)
+
+        chunks = await asyncio.gather(*(post_chunk(start, chunk) for start, chunk in chunked(payloads, chunk_size)))
+
+        return [result for chunk in chunks for result in chunk]
+
+    @classmethod
+    def _page_size_for(cls, expand: str | None) -> int:
+        return cls._MAX_EXPANDED_PAGE_SIZE if expand else cls._MAX_PAGE_SIZE
+
+    @staticmethod
+    def _page_url(url: str, *, limit: int, offset: int, expand: str | None) -> str:
+        query_parts: list[str] = []
+
+        if expand:
+            query_parts.append(f"expand={expand}")
+
+        query_parts.append(f"limit={limit}")
+        query_parts.append(f"offset={offset}")
+
+        separator = "&" if "?" in url else "?"
+        return f"{url}{separator}{'&'.join(query_parts)}"
+
+    async def _iter_pages(self, url: str, *, expand: str | None = None) -> AsyncIterator[list[Mapping]]:
+        """Постранично выгрузить список с offset-пагинацией.
+
+        ``url`` передаётся без ``limit``/``offset``/``expand``. По первой странице
+        читается ``meta.size``, следующие страницы запрашиваются заранее, но не более
+        ``pagination_concurrency`` одновременно. Страницы отдаются в исходном порядке,
+        поэтому в памяти одновременно находится лишь несколько страниц.
+        """
+        page_size = self._page_size_for(expand)
+
+        async def fetch_page(offset: int) -> list[Mapping]:
+            response = await self._async_get(self._page_url(url, limit=page_size, offset=offset, expand=expand))
+            return response.get("rows", [])
+
+        first_page = await self._async_get(self._page_url(url, limit=page_size, offset=0, expand=expand))
+        total = (first_page.get("meta") or {}).get("size")
+        rows: list[Mapping] = first_page.get("rows", [])
+        del first_page
+
+        yield rows
+
+        if not isinstance(total, int):
+            # Ответ без meta.size: читаем страницы по очереди до неполной.
+            offset = page_size
+
+            while len(rows) == page_size:
+                rows = await fetch_page(offset)
+                yield rows
+                offset += page_size
+
+            return
+
+        offsets = iter(range(page_size, total, page_size))
+        pending: deque[asyncio.Task[list[Mapping]]] = deque(
+            asyncio.create_task(fetch_page(offset))
+            for offset in islice(offsets, self._pagination_concurrency)
+        )
+
+        try:
+            while pending:
+                rows = await pending.popleft()
+
+                next_offset = next(offsets, None)
+                if next_offset is not None:
+                    pending.append(asyncio.create_task(fetch_page(next_offset)))
+
+                yield rows
+
+        finally:
+            for task in pending:
+                task.cancel()
+
+    async def _iter_validated(
+            self,
+            url: str,
+            model: type[ModelT],
+            *,
+            expand: str | None = None,
+            resolve: str | None = None,
+    ) -> AsyncIterator[ModelT]:
+        """Провалидированные сущности списка.
+
+        ``resolve`` — имя поля с позициями (``positions``, ``components``), в
+        которых ссылки на assortment заменяются товарами и модификациями, см.
+        ``_resolve_assortment``.
+        """
+        resolved: dict[str, Any] = {}
+
+        async with aclosing(self._iter_pages(url, expand=expand)) as pages:
+            async for rows in pages:
+                items = self._parse_rows(model, rows)
+
+                if resolve is not None:
+                    await self._resolve_assortment(items, resolve, resolved)
+
+                for item in items:
+                    yield item
+
+    async def _iter_validated_chunked(
+            self,
+            url: str,
+            field: str,
+            values: Iterable[Any],
+            model: type[ModelT],
+            *,
+            query: str = "",
+            expand: str | None = None,
+    ) -> AsyncIterator[ModelT]:
+        """Как ``_iter_validated`` для фильтра ``field=v1;field=v2;...`` с любым числом значений.
+
+        Значения делятся на куски, чтобы URL не превышал ``MAX_URL_LENGTH``. Куски
+        выгружаются одновременно (не более ``pagination_concurrency``), каждый со
+        своей пагинацией; сущности отдаются по мере получения страниц без повторов.
+        """
+        budget = MAX_URL_LENGTH - PAGINATION_PARAMS_RESERVE - len(url) - len(query) - len("?filter=&")
+        chunks = chunk_filter_values(field, values, budget=budget)
+        suffix = f"&{query}" if query else ""
+
+        if not chunks:
+            return
+
+        if len(chunks) == 1:
+            chunk_url = f"{url}?filter={filter_expression(field, chunks[0])}{suffix}"
+
+            async with aclosing(self._iter_validated(chunk_url, model, expand=expand)) as items:
+                async for item in items:
+                    yield item
+
+            return
+
+        # Очередь ограничена, чтобы быстрые куски не накапливали страницы в памяти.
+        queue: asyncio.Queue[list[Mapping] | BaseException | None] = asyncio.Queue(self._pagination_concurrency)
+        semaphore = asyncio.Semaphore(self._pagination_concurrency)
+
+        async def produce(chunk: list[str]) -> None:
+            chunk_url = f"{url}?filter={filter_expression(field, chunk)}{suffix}"
+
+            try:
+                async with semaphore, aclosing(self._iter_pages(chunk_url, expand=expand)) as pages:
+                    async for rows in pages:
+                        await queue.put(rows)
+            except Exception as ex:
+                await queue.put(ex)
+            else:
+                await queue.put(None)
+
+        producers = [asyncio.create_task(produce(chunk)) for chunk in chunks]
+        remaining = len(producers)
+        seen_ids: set[Any] = set()
+
+        try:
+            while remaining:
+                rows = await queue.get()
+
+                if rows is None:
+                    remaining -= 1
+                    continue
+
+                if isinstance(rows, BaseException):
+                    raise rows
+
+                for item in self._parse_rows(model, rows):
+                    if item.id not in seen_ids:
+                        seen_ids.add(item.id)
+                        yield item
+
+        finally:
+            for producer in producers:
+                producer.cancel()
+
+    async def _iter_documents(
+            self,
+            url: str,
+            parser: RowParser[RowT],
+            *,
+            expand: str,
+            resolve: str | None = None,
+    ) -> AsyncIterator[RowT]:
+        """Как ``_iter_validated``, но с догрузкой позиций документов.
+
+        Если ``positions.meta.size`` документа больше числа позиций, пришедших
+        в списке, все позиции читаются из подресурса ``/positions``.
+        """
+        resolved: dict[str, Any] = {}
+
+        async with aclosing(self._iter_document_pages(url, expand=expand)) as pages:
+            async for rows in pages:
+                items = self._parse_rows(parser, rows)
+
+                if resolve is not None:
+                    await self._resolve_assortment(items, resolve, resolved)
+
+                for item in items:
+                    yield item
+
+    def _iter_documents_by_strategy(
+            self,
+            url: str,
+            model: type[ModelT],
+            expand: ExpandStrategy | str,
+    ) -> AsyncIterator[ModelT]:
+        strategy = self._expand_strategy(expand)
+        return self._iter_documents(
+            url,
+            model,
+            expand=self._POSITIONS_EXPANDS[strategy],
+            resolve="positions" if strategy is ExpandStrategy.RESOLVE else None,
+        )
+
+    @staticmethod
+    def _expand_strategy(expand: ExpandStrategy | str) -> ExpandStrategy:
+        try:
+            return ExpandStrategy(expand)
+        except ValueError:
+            choices = ", ".join(ExpandStrategy)
+            raise MoySkladValidationError(f"Неизвестная стратегия expand '{expand}', ожидается одно из: {choices}.") from None
+
+    async def _resolve_assortment(self, items: list[Any], field: str, resolved: dict[str, Any]) -> None:
+        """Заменить ``AssortmentRefModel`` в позициях ``field`` товарами и модификациями.
+
+        Уже загруженные сущности берутся из ``resolved`` (общего для всей выгрузки)
+        и кэша клиента, остальные — одним списочным запросом ``filter=id=...`` на
+        тип. Готовые модели подставляются без повторной валидации. Ссылки на
+        другие типы (услуги, комплекты) и на удалённые сущности остаются ссылками.
+        """
+        pending: list[Any] = []
+        missing: dict[EntityType, set[str]] = defaultdict(set)
+
+        for item in items:
+            for position in getattr(item, field):
+                reference = position.assortment
+
+                if not isinstance(reference, AssortmentRefModel):
+                    continue
+
+                entity_id = str(reference.id)
+                entity = resolved.get(entity_id)
+
+                if entity is not None:
+                    position.assortment = entity
+                    continue
+
+                entity_type = _RESOLVABLE_TYPES.get(reference.type)
+
+                if entity_type is not None:
+                    missing[entity_type].add(entity_id)
+                    pending.append(position)
+
+        if not pending:
+            return
+
+        loaded = await asyncio.gather(*(
+            self._get_entities_by_ids(entity_type, entity_ids)
+            for entity_type, entity_ids in missing.items()
+        ))
+
+        for entities in loaded:
+            for entity in entities:
+                resolved[str(entity.id)] = entity
+
+        for position in pending:
+            position.assortment = resolved.get(str(position.assortment.id), position.assortment)
+
+    async def _iter_document_pages(self, url: str, *, expand: str) -> AsyncIterator[list[Mapping]]:
+        async with aclosing(self._iter_pages(url, expand=expand)) as pages:
+            async for rows in pages:
+                await self._complete_positions(rows, expand=expand)
+                yield rows
+
+    def _parse_rows(self, parser: RowParser[RowT], rows: list[Mapping]) -> list[RowT]:
+        """Строки страницы: pydantic-модель валидируется пачкой, фабрика вызывается на строку."""
+        started_at = time.perf_counter()
+
+        if isinstance(parser, type):
+            parsed = validate_rows(parser, rows)
+        else:
+            parsed = [parser(item) for item in rows]
+
+        if self._metrics is not None:
+            self._metrics.on_validation(ValidationMetrics(
+                model=getattr(parser, "__name__", repr(parser)),
+                rows=len(parsed),
+                seconds=time.perf_counter() - started_at,
+            ))
+
+        return parsed
+
+    async def _complete_positions(self, documents: list[Mapping], *, expand: str | None) -> None:
+        positions_expand = None
+
+        if expand and expand.startswith("positions."):
+            positions_expand = expand.removeprefix("positions.")
+
+        truncated: list[dict[str, Any]] = []
+
+        for document in documents:
+            positions = document.get("positions")
+
+            if not isinstance(positions, dict):
+                continue
+
+            size = (positions.get("meta") or {}).get("size")
+            rows = positions.get("rows") or []
+
+            if isinstance(size, int) and size > len(rows):
+                truncated.append(positions)
+
+        if not truncated:
+            return
+
+        # Каждый документ сам листает позиции страницами параллельно, поэтому
+        # одновременно догружаются не больше pagination_concurrency документов.
+        semaphore = asyncio.Semaphore(self._pagination_concurrency)
+
+        async def fetch_positions(positions: dict[str, Any]) -> None:
+            href = positions["meta"]["href"].split("?")[0]
+
+            async with semaphore, aclosing(self._iter_pages(href, expand=positions_expand)) as pages:
+                positions["rows"] = [row async for page in pages for row in page]
+
+        await asyncio.gather(*(fetch_positions(positions) for positions in truncated))
 
     async def _async_request(
             self,
             method: Literal["GET", "POST", "PUT"],
             url: str,
-            data: dict[str, Any] | None = None,
+            data: dict[str, Any] | list[dict[str, Any]] | None = None,
             *,
             extra_headers: Mapping[str, str] | None = None,
     ) -> Any:
+        attempts = count(1)
+
+        if method != "GET" or not self._coalesce_requests:
+            return await self._retry_policy.call(
+                method,
+                lambda: self._send_request(method, url, data, extra_headers=extra_headers, attempt=next(attempts)),
+            )
+
+        # Одинаковые GET, выполняющиеся одновременно, делят один запрос (вместе с
+        # повторами): результат или ошибка достаются всем ожидающим.
+        key = (url, tuple(sorted(extra_headers.items())) if extra_headers else ())
+        request = self._inflight.get(key)
+
+        if request is None:
+            task = asyncio.ensure_future(self._retry_policy.call(
+                method,
+                lambda: self._send_request(method, url, extra_headers=extra_headers, attempt=next(attempts)),
+            ))
+            request = self._inflight[key] = _InflightGet(task)
+            task.add_done_callback(lambda done: self._finish_inflight(key, request))
+
+        request.waiters += 1
+
+        try:
+            # shield: отмена одного ожидающего не отменяет запрос для остальных.
+            result = await asyncio.shield(request.task)
+        finally:
+            request.waiters -= 1
+
+        # Вызывающие меняют разобранный ответ (_complete_positions дописывает rows),
+        # поэтому общий объект получает только последний проснувшийся ожидающий,
+        # остальные — копии, снятые до того, как кто-то успел его изменить.
+        return result if request.waiters == 0 else deepcopy(result)
+
+    def _finish_inflight(self, key: tuple[str, tuple[tuple[str, str], ...]], request: _InflightGet) -> None:
+        task = request.task
+
+        if self._inflight.get(key) is request:
+            del self._inflight[key]
+
+        # Ошибка считается полученной, даже если все ожидающие были отменены.
+        if not task.cancelled():
+            task.exception()
+
+    async def _send_request(
+            self,
+            method: Literal["GET", "POST", "PUT"],
+            url: str,
+            data: dict[str, Any] | list[dict[str, Any]] | None = None,
+            *,
+            extra_headers: Mapping[str, str] | None = None,
+            attempt: int = 1,
+    ) -> Any:
+        import aiohttp
+
+        queued_at = time.perf_counter()
+        timer: RequestTimer | None = None
+        status: int | None = None
+        response_headers: Mapping[str, str] = {}
+        raw_body = b""
+        body_time = decode_time = 0.0
 
         try:
             headers = {**self._headers, **dict(extra_headers or {})}
             kwargs: dict[str, Any] = {"headers": headers}
 
             if data is not None:
-                kwargs["json"] = data
+                headers["Content-Type"] = "application/json"
+                kwargs["data"] = self._codec.dumps(data)
 
-            async with self._session.request(method, url, **kwargs) as response:
-                raw_body = await response.read()
+            rate_limiter = self._get_rate_limiter()
 
-                if response.status >= 400:
-                    if raw_body.strip():
-                        try:
-                            err_raw = json.loads(raw_body.decode())
-                            err_payload = (
-                                err_raw
-                                if isinstance(err_raw, dict)
-                                else {"error": err_raw}
-                            )
-                        except json.JSONDecodeError:
-                            err_payload = {"error": raw_body.decode(errors="replace")}
-                    else:
-                        err_payload = {"error": f"HTTP {response.status}"}
-                    if _is_moysklad_errors_body(err_payload):
-                        raise MoySkladRequestError(response.status, err_payload)
-                    raise MoySkladAPIException(
-                        f"Ошибка HTTP {response.status}: {err_payload}"
-                    )
-
-                if not raw_body.strip():
-                    return {}
+            async with rate_limiter.acquire():
+                if self._metrics is not None:
+                    timer = kwargs["trace_request_ctx"] = RequestTimer()
+
+                async with self._get_session().request(method, url, **kwargs) as response:
+                    status, response_headers = response.status, response.headers
+                    rate_limiter.update_from_headers(response_headers)
+
+                    body_started_at = time.perf_counter()
+                    raw_body = await response.read()
+                    body_time = time.perf_counter() - body_started_at
+
+                    if response.status >= 400:
+                        raise self._http_error(response, raw_body)
+
+                    if not raw_body or raw_body.isspace():
+                        return {}
+
+                    decode_started_at = time.perf_counter()
+
+                    try:
+                        return self._codec.loads(raw_body)
+                    except ValueError as e:
+                        raise MoySkladAPIException(f"API вернул невалидный JSON: {e}")
+                    finally:
+                        decode_time = time.perf_counter() - decode_started_at
+
+        except aiohttp.ClientError as e:
+            raise MoySkladConnectionError(f"Ошибка при выполнении запроса: {e}")
+
+        finally:
+            if timer is not None:
+                self._report_request(
+                    method, url, attempt, timer,
+                    queued_at=queued_at,
+                    status=status,
+                    headers=response_headers,
+                    body=body_time,
+                    decode=decode_time,
+                    response_bytes=len(raw_body),
+                )
+
+    def _report_request(
+            self,
+            method: str,
+            url: str,
+            attempt: int,
+            timer: RequestTimer,
+            *,
+            queued_at: float,
+            status: int | None,
+            headers: Mapping[str, str],
+            body: float,
+            decode: float,
+            response_bytes: int,
+    ) -> None:
+        ttfb = None
+
+        if timer.headers_at is not None:
+            ttfb = timer.headers_at - timer.started_at - (timer.connect or 0.0)
+
+        self._metrics.on_request(RequestMetrics(
+            endpoint=endpoint_template(url),
+            method=method,
+            status=status,
+            attempt=attempt,
+            queued=timer.started_at - queued_at,
+            connect=timer.connect,
+            ttfb=ttfb,
+            body=body,
+            decode=decode,
+            total=time.perf_counter() - timer.started_at,
+            response_bytes=response_bytes,
+            rate_limit_remaining=_int_header(headers, RATE_LIMIT_REMAINING_HEADER),
+        ))
+
+    async def _iter_json_stream(self, url: str, *, key: str | None = None) -> AsyncIterator[Any]:
+        """GET-запрос с потоковым разбором JSON-массива из тела ответа.
+
+        Элементы отдаются по мере чтения ответа; повторы выполняются только до
+        начала чтения тела.
+        """
+        import aiohttp
+
+        queued_at = time.perf_counter()
+        timers: list[RequestTimer | None] = []
+
+        async def open_stream() -> aiohttp.ClientResponse:
+            timer = RequestTimer() if self._metrics is not None else None
+            timers.append(timer)
+
+            # Слот ограничителя берётся на каждую попытку и отпускается, как только
+            # пришли заголовки: паузы между повторами и чтение тела его не занимают.
+            async with self._get_rate_limiter().acquire():
+                return await self._open_stream(url, timer=timer)
+
+        response = await self._retry_policy.call("GET", open_stream)
+        body_started_at = time.perf_counter()
+        response_bytes = 0
+
+        def count_bytes(chunk: bytes) -> bytes:
+            nonlocal response_bytes
+            response_bytes += len(chunk)
+            return chunk
+
+        try:
+            chunks = response.content.iter_chunked(self._STREAM_CHUNK_SIZE)
+
+            if self._metrics is not None:
+                chunks = (count_bytes(chunk) async for chunk in chunks)
+
+            async for item in iter_json_array(chunks, self._codec, key=key):
+                yield item
 
+        except aiohttp.ClientError as e:
+            raise MoySkladConnectionError(f"Ошибка при чтении ответа: {e}")
+
+        except ValueError as e:
+            raise MoySkladAPIException(f"API вернул невалидный JSON: {e}")
+
+        finally:
+            response.release()
+
+            if timers[-1] is not None:
+                # Тело читается и разбирается одновременно: разбор входит в body.
+                self._report_request(
+                    "GET", url, len(timers), timers[-1],
+                    queued_at=queued_at,
+                    status=response.status,
+                    headers=response.headers,
+                    body=time.perf_counter() - body_started_at,
+                    decode=0.0,
+                    response_bytes=response_bytes,
+                )
+
+    async def _iter_stream_validated(
+            self,
+            url: str,
+            parser: RowParser[RowT],
+            *,
+            key: str | None = None,
+    ) -> AsyncIterator[RowT]:
+        parse = parser.model_validate if isinstance(parser, type) else parser
+
+        if self._metrics is None:
+            async with aclosing(self._iter_json_stream(url, key=key)) as items:
+                async for item in items:
+                    yield parse(item)
+
+            return
+
+        # Строки разбираются по одной: время суммируется и сообщается в конце.
+        rows = 0
+        seconds = 0.0
+
+        try:
+            async with aclosing(self._iter_json_stream(url, key=key)) as items:
+                async for item in items:
+                    started_at = time.perf_counter()
+                    parsed = parse(item)
+                    seconds += time.perf_counter() - started_at
+                    rows += 1
+                    yield parsed
+        finally:
+            self._metrics.on_validation(ValidationMetrics(
+                model=getattr(parser, "__name__", repr(parser)),
+                rows=rows,
+                seconds=seconds,
+            ))
+
+    async def _open_stream(self, url: str, *, timer: RequestTimer | None = None) -> aiohttp.ClientResponse:
+        import aiohttp
+
+        try:
+            response = await self._get_session().get(url, headers=self._headers, trace_request_ctx=timer)
+
+            self._get_rate_limiter().update_from_headers(response.headers)
+
+            if response.status >= 400:
                 try:
-                    return json.loads(raw_body.decode())
-                except json.JSONDecodeError as e:
-                    raise MoySkladAPIException(f"API вернул невалидный JSON: {e}")
+                    raw_body = await response.read()
+                finally:
+                    response.release()
+
+                raise self._http_error(response, raw_body)
+
+            return response
 
         except aiohttp.ClientError as e:
             raise MoySkladConnectionError(f"Ошибка при выполнении запроса: {e}")
 
+    def _http_error(self, response: aiohttp.ClientResponse, raw_body: bytes) -> MoySkladHTTPError:
+        if response.status == 429:
+            self._get_rate_limiter().pause_from_headers(response.headers)
+
+        if raw_body.strip():
+            try:
+                err_raw = self._codec.loads(raw_body)
+                err_payload = (
+                    err_raw
+                    if isinstance(err_raw, dict)
+                    else {"error": err_raw}
+                )
+            except ValueError:
+                err_payload = {"error": raw_body.decode(errors="replace")}
+        else:
+            err_payload = {"error": f"HTTP {response.status}"}
+
+        retry_after = parse_retry_after(response.headers)
+
+        if _is_moysklad_errors_body(err_payload):
+            return MoySkladRequestError(response.status, err_payload, retry_after=retry_after)
+
+        return MoySkladHTTPError(response.status, err_payload, retry_after=retry_after)
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            if self._own_session:
+                self._session = self._transport.create_session()
+            else:
+                return get_shared_session(self._transport)
+
+        return self._session
+
+    def _get_rate_limiter(self) -> RateLimiter:
+        if self._rate_limiter is None:
+            self._rate_limiter = get_shared_rate_limiter(self._access_token)
+
+        return self._rate_limiter
+
     async def _async_get(self, url: str) -> Any:
         return await self._async_request("GET", url)
 
-    async def _async_post(self, url: str, data: dict[str, Any]) -> Any:
+    async def _async_post(self, url: str, data: dict[str, Any] | list[dict[str, Any]]) -> Any:
         return await self._async_request("POST", url, data)
 
     async def _async_put(self, url: str, data: dict[str, Any]) -> Any:
@@ -916,7 +1915,14 @@ class MoySkladAPIClient:
             await self._session.close()
             self._session = None
 
+    async def preconnect(self, connections: int = 1) -> None:
+        """Заранее открыть соединения с API, чтобы первые запросы не ждали TLS."""
+        await preconnect_session(self._get_session(), self._base_url, connections)
+
     async def __aenter__(self):
+        if self._transport.preconnect:
+            await self.preconnect(self._transport.preconnect)
+
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
@@ -0,0 +1,107 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Literal, Protocol
+from uuid import UUID
+
+from moy_sklad_api.exceptions import MoySkladValidationError
+
+CodecName = Literal["auto", "orjson", "msgspec", "stdlib"]
+
+
+class JSONCodec(Protocol):
+    """Кодек JSON для тел запросов и ответов.
+
+    ``loads`` принимает байты ответа как есть (без промежуточного ``str``) и при
+    невалидном JSON бросает ``ValueError``; ``dumps`` сразу возвращает байты.
+    """
+
+    name: str
+
+    def loads(self, data: bytes) -> Any: ...
+
+    def dumps(self, obj: Any) -> bytes: ...
+
+
+def _default(obj: Any) -> Any:
+    if isinstance(obj, UUID):
+        return str(obj)
+
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class StdlibJSONCodec:
+    name = "stdlib"
+
+    def loads(self, data: bytes) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return json.dumps(obj, ensure_ascii=False, separators=(",", ":"), default=_default).encode()
+
+
+class OrjsonCodec:
+    name = "orjson"
+
+    def __init__(self) -> None:
+        import orjson
+
+        self._orjson = orjson
+
+    def loads(self, data: bytes) -> Any:
+        return self._orjson.loads(data)
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._orjson.dumps(obj)
+
+
+class MsgspecCodec:
+    name = "msgspec"
+
+    def __init__(self) -> None:
+        import msgspec
+
+        self._decode_error = msgspec.DecodeError
+        self._decoder = msgspec.json.Decoder()
+        self._encoder = msgspec.json.Encoder()
+
+    def loads(self, data: bytes) -> Any:
+        try:
+            return self._decoder.decode(data)
+        except self._decode_error as ex:
+            raise ValueError(str(ex)) from ex
+
+    def dumps(self, obj: Any) -> bytes:
+        return self._encoder.encode(obj)
+
+
+_CODECS: dict[str, type[JSONCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecCodec,
+    "stdlib": StdlibJSONCodec,
+}
+
+
+def get_codec(name: CodecName = "auto") -> JSONCodec:
+    """Вернуть кодек по имени.
+
+    ``auto`` выбирает первый установленный из orjson, msgspec и stdlib ``json``.
+    """
+    if name == "auto":
+        for candidate in ("orjson", "msgspec"):
+            try:
+                return _CODECS[candidate]()
+            except ImportError:
+                continue
+
+        return StdlibJSONCodec()
+
+    codec_cls = _CODECS.get(name)
+
+    if codec_cls is None:
+        raise MoySkladValidationError(f"Неизвестный JSON-кодек: '{name}'.")
+
+    try:
+        return codec_cls()
+    except ImportError as ex:
+        raise MoySkladValidationError(f"JSON-кодек '{name}' не установлен.") from ex
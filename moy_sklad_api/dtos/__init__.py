@@ -2,10 +2,16 @@ from .inventory_position import InventoryPositionDTO
 from .move_position import MovePositionDTO
 from .demand_position import DemandPositionDTO
 from .bundle_position import BundlePositionDTO
+from .demand import DemandDTO
+from .move import MoveDTO
+from .inventory import InventoryDTO
 
 __all__ = [
     'InventoryPositionDTO',
     'MovePositionDTO',
     'DemandPositionDTO',
     'BundlePositionDTO',
+    'DemandDTO',
+    'MoveDTO',
+    'InventoryDTO',
 ]
@@ -0,0 +1,18 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from moy_sklad_api.dtos.demand_position import DemandPositionDTO
+from moy_sklad_api.validation import runtime_checked
+
+
+@runtime_checked
+@dataclass(frozen=True, slots=True, kw_only=True)
+class DemandDTO:
+    warehouse_id: UUID
+    positions: list[DemandPositionDTO]
+    moment: datetime
+    organization_id: UUID
+    agent_id: UUID
+    project_id: UUID
+    sales_channel_id: UUID
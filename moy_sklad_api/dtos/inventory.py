@@ -0,0 +1,15 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from moy_sklad_api.dtos.inventory_position import InventoryPositionDTO
+from moy_sklad_api.validation import runtime_checked
+
+
+@runtime_checked
+@dataclass(frozen=True, slots=True, kw_only=True)
+class InventoryDTO:
+    organization_id: UUID
+    warehouse_id: UUID
+    positions: list[InventoryPositionDTO]
+    moment: datetime
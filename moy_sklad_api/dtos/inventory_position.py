@@ -1,11 +1,11 @@
 from dataclasses import dataclass
 from uuid import UUID
 
-from beartype import beartype
+from moy_sklad_api.validation import runtime_checked
 from moy_sklad_api.enums import ProductType
 
 
-@beartype
+@runtime_checked
 @dataclass(frozen=True, slots=True, kw_only=True)
 class InventoryPositionDTO:
     product_id: UUID
@@ -0,0 +1,17 @@
+from dataclasses import dataclass
+from datetime import datetime
+from uuid import UUID
+
+from moy_sklad_api.dtos.move_position import MovePositionDTO
+from moy_sklad_api.validation import runtime_checked
+
+
+@runtime_checked
+@dataclass(frozen=True, slots=True, kw_only=True)
+class MoveDTO:
+    target_store_id: UUID
+    positions: list[MovePositionDTO]
+    source_store_id: UUID
+    moment: datetime
+    organization_id: UUID
+    project_id: UUID
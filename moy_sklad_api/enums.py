@@ -13,11 +13,23 @@ class EntityType(enum.StrEnum):
     MOVE = 'move'
     DEMAND = 'demand'
     INVENTORY = 'inventory'
+    LOSS = 'loss'
     SALES_CHANNEL = 'saleschannel'
     ATTRIBUTE = 'attributemetadata'
     MODIFICATION = 'variant'
 
 
+class ExpandStrategy(enum.StrEnum):
+    """Как загружать assortment позиций документов и компонентов комплектов."""
+
+    # expand=positions.assortment.product: полный товар в каждой позиции, страницы по 100.
+    FULL = 'full'
+    # Позиции со ссылками на assortment (AssortmentRefModel) без данных товара.
+    REFERENCES = 'references'
+    # Ссылки, затем товары и модификации одним списочным запросом (или из кэша).
+    RESOLVE = 'resolve'
+
+
 class ProductType(enum.StrEnum):
     SINGLE_PRODUCT = 'product'
     COMPOSITE_PRODUCT = 'bundle'
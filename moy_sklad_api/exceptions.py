@@ -11,7 +11,27 @@ class MoySkladAPIException(Exception):
     pass
 
 
-class MoySkladRequestError(MoySkladAPIException):
+class MoySkladHTTPError(MoySkladAPIException):
+    """Ответ API с HTTP-статусом ошибки.
+
+    ``retry_after`` — пауза в секундах, которую сервер просит выдержать перед
+    повтором (``X-Lognex-Retry-After`` / ``Retry-After``), если она была указана.
+    """
+
+    def __init__(
+            self,
+            status: int,
+            payload: dict[str, Any],
+            *,
+            retry_after: float | None = None,
+    ) -> None:
+        self.status = status
+        self.payload = payload
+        self.retry_after = retry_after
+        super().__init__(f"Ошибка HTTP {status}: {payload}")
+
+
+class MoySkladRequestError(MoySkladHTTPError):
     """Ответ API со структурой ошибок МойСклад (ключ ``errors``).
 
     Наследует ``MoySkladAPIException``, чтобы существующие ``except MoySkladAPIException``
@@ -19,11 +39,15 @@ class MoySkladRequestError(MoySkladAPIException):
     ``except MoySkladRequestError`` или атрибуты ``codes`` / ``code``.
     """
 
-    def __init__(self, status: int, payload: dict[str, Any]) -> None:
-        self.status = status
-        self.payload = payload
+    def __init__(
+            self,
+            status: int,
+            payload: dict[str, Any],
+            *,
+            retry_after: float | None = None,
+    ) -> None:
+        super().__init__(status, payload, retry_after=retry_after)
         self.codes = _extract_error_codes(payload)
-        super().__init__(f"Ошибка HTTP {status}: {payload}")
 
     @property
     def code(self) -> int | None:
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class LoopLocal(Generic[K, V]):
+    """Значения, общие для клиентов одного event loop, с очисткой при его остановке.
+
+    При первом обращении из loop в нём запускается фоновая задача, которая ждёт
+    отмены. ``asyncio.run`` отменяет оставшиеся задачи перед закрытием loop, и
+    задача удаляет значения этого loop из реестра и закрывает их через ``close``.
+    Если loop закрыт без отмены задач (``run_until_complete`` и ``close``
+    вручную), значения закрыть уже нельзя: ссылки на такой loop отбрасываются
+    при следующем обращении к реестру.
+    """
+
+    def __init__(self, close: Callable[[V], Awaitable[None]] | None = None) -> None:
+        self._close = close
+        self._entries: dict[asyncio.AbstractEventLoop, dict[K, V]] = {}
+        self._watchers: dict[asyncio.AbstractEventLoop, asyncio.Task[None]] = {}
+
+    def get(self, key: K, factory: Callable[[], V], *, stale: Callable[[V], bool] | None = None) -> V:
+        loop = asyncio.get_running_loop()
+        entries = self._entries_for(loop)
+        value = entries.get(key)
+
+        if value is None or stale is not None and stale(value):
+            value = entries[key] = factory()
+
+        return value
+
+    def pop(self, loop: asyncio.AbstractEventLoop) -> dict[K, V]:
+        """Забрать значения ``loop`` из реестра; закрыть их должен вызывающий."""
+        watcher = self._watchers.pop(loop, None)
+
+        if watcher is not None and not watcher.done():
+            watcher.cancel()
+
+        return self._entries.pop(loop, {})
+
+    def __len__(self) -> int:
+        return sum(len(entries) for entries in self._entries.values())
+
+    def _entries_for(self, loop: asyncio.AbstractEventLoop) -> dict[K, V]:
+        entries = self._entries.get(loop)
+
+        if entries is not None:
+            return entries
+
+        for closed_loop in [known for known in self._entries if known.is_closed()]:
+            self._entries.pop(closed_loop, None)
+            self._watchers.pop(closed_loop, None)
+
+        entries = self._entries[loop] = {}
+        self._watchers[loop] = loop.create_task(self._evict_on_shutdown(loop), name="moy_sklad_api.loop_local")
+        return entries
+
+    async def _evict_on_shutdown(self, loop: asyncio.AbstractEventLoop) -> None:
+        try:
+            await loop.create_future()
+        except asyncio.CancelledError:
+            # Отмена из pop() уже убрала значения; здесь — остановка loop.
+            if self._watchers.get(loop) is asyncio.current_task():
+                self._watchers.pop(loop, None)
+                entries = self._entries.pop(loop, {})
+
+                if self._close is not None:
+                    for value in entries.values():
+                        await self._close(value)
+
+            raise
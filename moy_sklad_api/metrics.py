@@ -0,0 +1,279 @@
+"""Метрики запросов к API.
+
+Клиент сообщает наблюдателю (``MetricsObserver``) о каждой попытке запроса
+(``RequestMetrics``) и о каждой пачке валидированных строк (``ValidationMetrics``).
+Готовые наблюдатели: ``CallbackObserver``, ``LoggingObserver`` и
+``HistogramObserver`` с выводом в текстовом формате Prometheus.
+"""
+
+from __future__ import annotations
+
+import bisect
+import logging
+import re
+import time
+from dataclasses import dataclass, field
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Protocol, Sequence
+
+if TYPE_CHECKING:
+    import aiohttp
+
+_ID_SEGMENT = re.compile(r"/[0-9a-fA-F]{8}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{4}-[0-9a-fA-F]{12}(?=/|$)")
+_API_PREFIX = re.compile(r"^https?://[^/]+(?:/api/remap/1\.2)?")
+
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def endpoint_template(url: str) -> str:
+    """Шаблон эндпоинта без хоста, query и id: ``/entity/move/{id}/positions``."""
+    path = _API_PREFIX.sub("", url.split("?", 1)[0])
+    return _ID_SEGMENT.sub("/{id}", path)
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RequestMetrics:
+    """Одна попытка HTTP-запроса. Длительности — в секундах.
+
+    ``connect`` равен нулю, если соединение взято из пула, и ``None``, если
+    сессия создана без трассировки (передана в клиент извне). ``status`` равен
+    ``None`` при сетевой ошибке. ``attempt`` начинается с 1: ``attempt - 1`` —
+    число повторов перед этой попыткой.
+    """
+
+    endpoint: str
+    method: str
+    status: int | None
+    attempt: int
+    queued: float
+    connect: float | None
+    ttfb: float | None
+    body: float
+    decode: float
+    total: float
+    response_bytes: int
+    rate_limit_remaining: int | None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class ValidationMetrics:
+    """Разбор строк ответа в модели (или компактные строки)."""
+
+    model: str
+    rows: int
+    seconds: float
+
+
+class MetricsObserver(Protocol):
+    def on_request(self, metrics: RequestMetrics) -> None: ...
+
+    def on_validation(self, metrics: ValidationMetrics) -> None: ...
+
+
+class CallbackObserver:
+    """Передаёт все события в одну функцию."""
+
+    def __init__(self, callback: Callable[[RequestMetrics | ValidationMetrics], None]) -> None:
+        self._callback = callback
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        self._callback(metrics)
+
+    def on_validation(self, metrics: ValidationMetrics) -> None:
+        self._callback(metrics)
+
+
+class LoggingObserver:
+    def __init__(self, logger: logging.Logger | None = None, *, level: int = logging.DEBUG) -> None:
+        self._logger = logger or logging.getLogger(__name__)
+        self._level = level
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        if not self._logger.isEnabledFor(self._level):
+            return
+
+        self._logger.log(
+            self._level,
+            "%s %s -> %s (попытка %s): всего %.3f с, очередь %.3f, соединение %s, "
+            "TTFB %s, тело %.3f, JSON %.3f; %s байт, осталось лимита: %s",
+            metrics.method,
+            metrics.endpoint,
+            metrics.status,
+            metrics.attempt,
+            metrics.total,
+            metrics.queued,
+            _format_seconds(metrics.connect),
+            _format_seconds(metrics.ttfb),
+            metrics.body,
+            metrics.decode,
+            metrics.response_bytes,
+            metrics.rate_limit_remaining,
+        )
+
+    def on_validation(self, metrics: ValidationMetrics) -> None:
+        if self._logger.isEnabledFor(self._level):
+            self._logger.log(self._level, "%s: %s строк за %.3f с", metrics.model, metrics.rows, metrics.seconds)
+
+
+def _format_seconds(value: float | None) -> str:
+    return "-" if value is None else f"{value:.3f}"
+
+
+@dataclass(slots=True)
+class _Histogram:
+    buckets: Sequence[float]
+    counts: list[int] = field(default_factory=list)
+    total: float = 0.0
+    count: int = 0
+
+    def __post_init__(self) -> None:
+        self.counts = [0] * len(self.buckets)
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.buckets, value)
+
+        if index < len(self.counts):
+            self.counts[index] += 1
+
+        self.total += value
+        self.count += 1
+
+
+class HistogramObserver:
+    """Гистограммы длительностей по фазам в духе Prometheus.
+
+    Метка ``phase`` принимает значения ``total``, ``queued``, ``connect``,
+    ``ttfb``, ``body``, ``decode`` для запросов и ``validate`` для разбора.
+    ``render()`` возвращает текст в формате экспозиции Prometheus.
+    """
+
+    def __init__(self, *, buckets: Iterable[float] = DEFAULT_BUCKETS, prefix: str = "moysklad") -> None:
+        self._buckets = tuple(sorted(buckets))
+        self._prefix = prefix
+        self._durations: dict[tuple[tuple[str, str], ...], _Histogram] = {}
+        self._bytes: dict[tuple[tuple[str, str], ...], int] = {}
+        self._retries: dict[tuple[tuple[str, str], ...], int] = {}
+        self.rate_limit_remaining: int | None = None
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        labels = (
+            ("endpoint", metrics.endpoint),
+            ("method", metrics.method),
+            ("status", str(metrics.status) if metrics.status is not None else "error"),
+        )
+        phases = {
+            "total": metrics.total,
+            "queued": metrics.queued,
+            "connect": metrics.connect,
+            "ttfb": metrics.ttfb,
+            "body": metrics.body,
+            "decode": metrics.decode,
+        }
+
+        for phase, seconds in phases.items():
+            if seconds is not None:
+                self._observe((*labels, ("phase", phase)), seconds)
+
+        self._bytes[labels] = self._bytes.get(labels, 0) + metrics.response_bytes
+
+        if metrics.attempt > 1:
+            self._retries[labels] = self._retries.get(labels, 0) + 1
+
+        if metrics.rate_limit_remaining is not None:
+            self.rate_limit_remaining = metrics.rate_limit_remaining
+
+    def on_validation(self, metrics: ValidationMetrics) -> None:
+        self._observe((("model", metrics.model), ("phase", "validate")), metrics.seconds)
+
+    def _observe(self, labels: tuple[tuple[str, str], ...], seconds: float) -> None:
+        histogram = self._durations.get(labels)
+
+        if histogram is None:
+            histogram = self._durations[labels] = _Histogram(self._buckets)
+
+        histogram.observe(seconds)
+
+    def render(self) -> str:
+        name = f"{self._prefix}_request_duration_seconds"
+        lines = [f"# TYPE {name} histogram"]
+
+        for labels, histogram in self._durations.items():
+            cumulative = 0
+
+            for bound, count in zip(histogram.buckets, histogram.counts):
+                cumulative += count
+                lines.append(f"{name}_bucket{_labels(labels, le=str(bound))} {cumulative}")
+
+            lines.append(f"{name}_bucket{_labels(labels, le='+Inf')} {histogram.count}")
+            lines.append(f"{name}_sum{_labels(labels)} {histogram.total}")
+            lines.append(f"{name}_count{_labels(labels)} {histogram.count}")
+
+        lines.append(f"# TYPE {self._prefix}_response_bytes_total counter")
+        lines += [f"{self._prefix}_response_bytes_total{_labels(labels)} {value}" for labels, value in self._bytes.items()]
+
+        lines.append(f"# TYPE {self._prefix}_retries_total counter")
+        lines += [f"{self._prefix}_retries_total{_labels(labels)} {value}" for labels, value in self._retries.items()]
+
+        if self.rate_limit_remaining is not None:
+            lines.append(f"# TYPE {self._prefix}_rate_limit_remaining gauge")
+            lines.append(f"{self._prefix}_rate_limit_remaining {self.rate_limit_remaining}")
+
+        return "\n".join(lines) + "\n"
+
+
+def _labels(labels: tuple[tuple[str, str], ...], **extra: str) -> str:
+    pairs = [*labels, *extra.items()]
+    return "{" + ",".join(f'{key}="{_escape(value)}"' for key, value in pairs) + "}"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+class RequestTimer:
+    """Отметки времени одной попытки; передаётся в aiohttp как ``trace_request_ctx``."""
+
+    __slots__ = ("started_at", "connect", "headers_at")
+
+    def __init__(self) -> None:
+        self.started_at = time.perf_counter()
+        self.connect: float | None = None
+        self.headers_at: float | None = None
+
+
+async def _on_connection_create_start(session: Any, context: SimpleNamespace, params: Any) -> None:
+    context.connect_started_at = time.perf_counter()
+
+
+async def _on_connection_create_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    timer = context.trace_request_ctx
+
+    if isinstance(timer, RequestTimer):
+        timer.connect = time.perf_counter() - context.connect_started_at
+
+
+async def _on_connection_reuseconn(session: Any, context: SimpleNamespace, params: Any) -> None:
+    timer = context.trace_request_ctx
+
+    if isinstance(timer, RequestTimer):
+        timer.connect = 0.0
+
+
+async def _on_request_end(session: Any, context: SimpleNamespace, params: Any) -> None:
+    # Сигнал приходит после получения заголовков ответа, до чтения тела.
+    timer = context.trace_request_ctx
+
+    if isinstance(timer, RequestTimer):
+        timer.headers_at = time.perf_counter()
+
+
+def create_trace_config() -> aiohttp.TraceConfig:
+    """Трассировка aiohttp, заполняющая ``RequestTimer`` запроса."""
+    import aiohttp
+
+    trace_config = aiohttp.TraceConfig()
+    trace_config.on_connection_create_start.append(_on_connection_create_start)
+    trace_config.on_connection_create_end.append(_on_connection_create_end)
+    trace_config.on_connection_reuseconn.append(_on_connection_reuseconn)
+    trace_config.on_request_end.append(_on_request_end)
+    return trace_config
@@ -1,42 +1,96 @@
-from moy_sklad_api.models.bundle import PositionModel, BundleModel
-from moy_sklad_api.models.demand import DemandModel
-from moy_sklad_api.models.inventory import InventoryModel, InventoryPosition
-from moy_sklad_api.models.loss import LossModel, LossPosition
-from moy_sklad_api.models.metadata import MetaModel
-from moy_sklad_api.models.move import MoveModel
-from moy_sklad_api.models.product import ProductModel
-from moy_sklad_api.models.product_expand_stocks import ProductExpandStocksModel
-from moy_sklad_api.models.product_stocks import ProductStocksModel
-from moy_sklad_api.models.variant import VariantModel
-from moy_sklad_api.models.turnover_report import (
-    TurnoverReportAssortmentModel,
-    TurnoverReportByStoreRowModel,
-    TurnoverReportMetricsModel,
-    TurnoverReportStockByStoreLineModel,
-    TurnoverReportStoreRefModel,
-    parse_turnover_report_by_store_rows,
-)
-from moy_sklad_api.models.warehouses import WarehouseModel
-
-__all__ = [
-    "PositionModel",
-    "BundleModel",
-    "DemandModel",
-    "InventoryModel",
-    "InventoryPosition",
-    "LossModel",
-    "LossPosition",
-    "MoveModel",
-    "MetaModel",
-    "ProductExpandStocksModel",
-    "ProductModel",
-    "ProductStocksModel",
-    "TurnoverReportAssortmentModel",
-    "TurnoverReportByStoreRowModel",
-    "TurnoverReportMetricsModel",
-    "TurnoverReportStockByStoreLineModel",
-    "TurnoverReportStoreRefModel",
-    "VariantModel",
-    "WarehouseModel",
-    "parse_turnover_report_by_store_rows",
-]
+"""Pydantic-модели ответов API и компактные строки.
+
+Модули загружаются при первом обращении к имени: схемы pydantic строятся
+при первой валидации (``defer_build``), а не при импорте.
+"""
+
+from __future__ import annotations
+
+from importlib import import_module
+from pkgutil import iter_modules
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from moy_sklad_api.models.bundle import PositionModel, BundleModel
+    from moy_sklad_api.models.position import AssortmentRefModel
+    from moy_sklad_api.models.compact import (
+        InventoryPositionRow,
+        InventoryRow,
+        LossPositionRow,
+        LossRow,
+        MoveRow,
+        PositionRow,
+        StockRow,
+    )
+    from moy_sklad_api.models.demand import DemandModel
+    from moy_sklad_api.models.inventory import InventoryModel, InventoryPosition
+    from moy_sklad_api.models.loss import LossModel, LossPosition
+    from moy_sklad_api.models.metadata import MetaModel
+    from moy_sklad_api.models.move import MoveModel
+    from moy_sklad_api.models.product import ProductModel
+    from moy_sklad_api.models.product_expand_stocks import ProductExpandStocksModel
+    from moy_sklad_api.models.product_stocks import ProductStocksModel
+    from moy_sklad_api.models.variant import VariantModel
+    from moy_sklad_api.models.turnover_report import (
+        TurnoverReportAssortmentModel,
+        TurnoverReportByStoreRowModel,
+        TurnoverReportMetricsModel,
+        TurnoverReportStockByStoreLineModel,
+        TurnoverReportStoreRefModel,
+        parse_turnover_report_by_store_rows,
+    )
+    from moy_sklad_api.models.warehouses import WarehouseModel
+
+_EXPORTS: dict[str, str] = {
+    "AssortmentRefModel": "moy_sklad_api.models.position",
+    "PositionModel": "moy_sklad_api.models.bundle",
+    "BundleModel": "moy_sklad_api.models.bundle",
+    "DemandModel": "moy_sklad_api.models.demand",
+    "InventoryModel": "moy_sklad_api.models.inventory",
+    "InventoryPosition": "moy_sklad_api.models.inventory",
+    "InventoryPositionRow": "moy_sklad_api.models.compact",
+    "InventoryRow": "moy_sklad_api.models.compact",
+    "LossModel": "moy_sklad_api.models.loss",
+    "LossPosition": "moy_sklad_api.models.loss",
+    "LossPositionRow": "moy_sklad_api.models.compact",
+    "LossRow": "moy_sklad_api.models.compact",
+    "MoveModel": "moy_sklad_api.models.move",
+    "MoveRow": "moy_sklad_api.models.compact",
+    "MetaModel": "moy_sklad_api.models.metadata",
+    "ProductExpandStocksModel": "moy_sklad_api.models.product_expand_stocks",
+    "ProductModel": "moy_sklad_api.models.product",
+    "ProductStocksModel": "moy_sklad_api.models.product_stocks",
+    "PositionRow": "moy_sklad_api.models.compact",
+    "StockRow": "moy_sklad_api.models.compact",
+    "TurnoverReportAssortmentModel": "moy_sklad_api.models.turnover_report",
+    "TurnoverReportByStoreRowModel": "moy_sklad_api.models.turnover_report",
+    "TurnoverReportMetricsModel": "moy_sklad_api.models.turnover_report",
+    "TurnoverReportStockByStoreLineModel": "moy_sklad_api.models.turnover_report",
+    "TurnoverReportStoreRefModel": "moy_sklad_api.models.turnover_report",
+    "VariantModel": "moy_sklad_api.models.variant",
+    "WarehouseModel": "moy_sklad_api.models.warehouses",
+    "parse_turnover_report_by_store_rows": "moy_sklad_api.models.turnover_report",
+}
+
+__all__ = list(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module_name = _EXPORTS.get(name)
+
+    if module_name is not None:
+        value = globals()[name] = getattr(import_module(module_name), name)
+        return value
+
+    # Модули моделей (moy_sklad_api.models.move и т.п.) доступны как атрибуты, как при eager-импорте.
+    try:
+        return import_module(f"{__name__}.{name}")
+    except ModuleNotFoundError as error:
+        if error.name != f"{__name__}.{name}":
+            raise
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_EXPORTS, *(module.name for module in iter_modules(__path__))})
@@ -5,7 +5,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, BeforeValidator
 
-from moy_sklad_api.models.position import PositionModel, parse_positions
+from moy_sklad_api.models.position import PositionModel
+from moy_sklad_api.utils import extract_rows
 
 
 class BundleModel(BaseModel):
@@ -15,7 +16,7 @@ class BundleModel(BaseModel):
     volume: int
     components: Annotated[
         list[PositionModel],
-        BeforeValidator(parse_positions),
+        BeforeValidator(extract_rows),
     ] = Field(default_factory=list)
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
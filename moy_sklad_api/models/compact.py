@@ -0,0 +1,164 @@
+"""Компактные строки для больших выгрузок.
+
+Неизменяемые ``NamedTuple`` без ``__dict__``, вложенных ``MetaModel`` и полных
+``ProductModel``: только идентификаторы и числовые поля. Строятся напрямую из
+JSON ответа, минуя pydantic.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Mapping, NamedTuple
+from uuid import UUID
+
+from moy_sklad_api.utils import extract_id, parse_api_datetime
+
+
+class StockRow(NamedTuple):
+    product_id: UUID
+    quantity: float
+
+
+class PositionRow(NamedTuple):
+    id: UUID
+    assortment_id: UUID
+    assortment_type: str
+    quantity: float
+
+
+class InventoryPositionRow(NamedTuple):
+    assortment_id: UUID
+    assortment_type: str
+    quantity: float
+    calculated_quantity: float
+    correction_amount: float
+    price: int
+    correction_sum: float
+
+
+class LossPositionRow(NamedTuple):
+    id: UUID
+    assortment_id: UUID
+    assortment_type: str
+    quantity: float
+    price: int
+
+
+class MoveRow(NamedTuple):
+    id: UUID
+    source_warehouse_id: UUID
+    target_warehouse_id: UUID
+    timestamp: datetime
+    positions: tuple[PositionRow, ...]
+
+
+class InventoryRow(NamedTuple):
+    id: UUID
+    warehouse_id: UUID
+    total_sum: int
+    timestamp: datetime
+    positions: tuple[InventoryPositionRow, ...]
+
+
+class LossRow(NamedTuple):
+    id: UUID
+    warehouse_id: UUID
+    total_sum: int
+    timestamp: datetime
+    positions: tuple[LossPositionRow, ...]
+
+
+def _ref_id(value: Mapping[str, Any]) -> UUID:
+    return UUID(extract_id(value["meta"]))
+
+
+def _assortment(value: Mapping[str, Any]) -> tuple[UUID, str]:
+    meta = value["meta"]
+    entity_id = value.get("id")
+    return UUID(entity_id if entity_id is not None else extract_id(meta)), meta["type"]
+
+
+def _integral(value: Any, field: str) -> int:
+    """Целое поле как в pydantic-моделях: ``100.0`` допускается, дробная часть — ошибка."""
+    if isinstance(value, int):
+        return value
+
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+
+    raise ValueError(f"Поле '{field}' должно быть целым числом, получено {value!r}.")
+
+
+def _rows(value: Any) -> list[Mapping[str, Any]]:
+    if isinstance(value, dict):
+        return value.get("rows") or []
+    return []
+
+
+def stock_row_from_report(item: Mapping[str, Any]) -> StockRow:
+    """Строка ``/report/stock/all`` (id товара в ``meta.href``)."""
+    return StockRow(UUID(extract_id(item["meta"])), float(item["stock"]))
+
+
+def stock_row_from_current(item: Mapping[str, Any]) -> StockRow:
+    """Строка ``/report/stock/bystore/current``."""
+    return StockRow(UUID(item["assortmentId"]), float(item["stock"]))
+
+
+def position_row(item: Mapping[str, Any]) -> PositionRow:
+    assortment_id, assortment_type = _assortment(item["assortment"])
+    return PositionRow(UUID(item["id"]), assortment_id, assortment_type, float(item["quantity"]))
+
+
+def inventory_position_row(item: Mapping[str, Any]) -> InventoryPositionRow:
+    assortment_id, assortment_type = _assortment(item["assortment"])
+    return InventoryPositionRow(
+        assortment_id,
+        assortment_type,
+        float(item["quantity"]),
+        float(item["calculatedQuantity"]),
+        float(item["correctionAmount"]),
+        _integral(item["price"], "price"),
+        float(item["correctionSum"]),
+    )
+
+
+def loss_position_row(item: Mapping[str, Any]) -> LossPositionRow:
+    assortment_id, assortment_type = _assortment(item["assortment"])
+    return LossPositionRow(
+        UUID(item["id"]),
+        assortment_id,
+        assortment_type,
+        float(item["quantity"]),
+        _integral(item["price"], "price"),
+    )
+
+
+def move_row(item: Mapping[str, Any]) -> MoveRow:
+    return MoveRow(
+        UUID(item["id"]),
+        _ref_id(item["sourceStore"]),
+        _ref_id(item["targetStore"]),
+        parse_api_datetime(item["moment"]),
+        tuple(position_row(position) for position in _rows(item.get("positions"))),
+    )
+
+
+def inventory_row(item: Mapping[str, Any]) -> InventoryRow:
+    return InventoryRow(
+        UUID(item["id"]),
+        _ref_id(item["store"]),
+        _integral(item["sum"], "sum"),
+        parse_api_datetime(item["moment"]),
+        tuple(inventory_position_row(position) for position in _rows(item.get("positions"))),
+    )
+
+
+def loss_row(item: Mapping[str, Any]) -> LossRow:
+    return LossRow(
+        UUID(item["id"]),
+        _ref_id(item["store"]),
+        _integral(item["sum"], "sum"),
+        parse_api_datetime(item["moment"]),
+        tuple(loss_position_row(position) for position in _rows(item.get("positions"))),
+    )
@@ -8,5 +8,7 @@ from moy_sklad_api.utils import parse_api_datetime
 
 
 class DemandModel(BaseModel):
+    model_config = {"defer_build": True}
+
     id: UUID
     timestamp: Annotated[datetime, Field(validation_alias="moment"), BeforeValidator(parse_api_datetime)]
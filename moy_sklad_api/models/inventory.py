@@ -1,23 +1,19 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Annotated, Any, Callable
+from typing import Annotated
 from uuid import UUID
 
 from pydantic import BaseModel, Field, BeforeValidator
 
-from moy_sklad_api.models.position import parse_assortment
-from moy_sklad_api.models.variant import VariantModel
-from moy_sklad_api.models.product import ProductModel
-from moy_sklad_api.utils import parse_api_datetime, parse_rows_as, _parse_meta_entity_id
+from moy_sklad_api.models.position import AssortmentModel
+from moy_sklad_api.utils import parse_api_datetime, extract_rows, _parse_meta_entity_id
 
 
 class InventoryPosition(BaseModel):
-    assortment: Annotated[
-        ProductModel | VariantModel,
-        Field(validation_alias="assortment"),
-        BeforeValidator(parse_assortment),
-    ]
+    model_config = {"defer_build": True}
+
+    assortment: Annotated[AssortmentModel, Field(validation_alias="assortment")]
 
     quantity: float
     calculated_quantity: Annotated[float, Field(validation_alias="calculatedQuantity")]
@@ -26,18 +22,15 @@ class InventoryPosition(BaseModel):
     correction_sum: Annotated[float, Field(validation_alias="correctionSum")]
 
 
-parse_inventory_positions: Callable[[Any], list[InventoryPosition]] = parse_rows_as(InventoryPosition)
-
-
 class InventoryModel(BaseModel):
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
 
     id: UUID
     name: str
     external_code: Annotated[str, Field(validation_alias="externalCode")]
     total_sum: Annotated[int, Field(validation_alias="sum")]
     timestamp: Annotated[datetime, Field(validation_alias="moment"), BeforeValidator(parse_api_datetime)]
-    positions: Annotated[list[InventoryPosition], BeforeValidator(parse_inventory_positions)]
+    positions: Annotated[list[InventoryPosition], BeforeValidator(extract_rows)]
 
     warehouse_id: Annotated[
         UUID,
@@ -6,7 +6,7 @@ from moy_sklad_api.enums import EntityType, ProductType
 
 
 class MetaModel(BaseModel):
-    model_config = ConfigDict(populate_by_name=True)
+    model_config = ConfigDict(populate_by_name=True, defer_build=True)
 
     href: str
     type: str
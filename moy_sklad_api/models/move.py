@@ -4,8 +4,8 @@ from uuid import UUID
 
 from pydantic import BaseModel, Field, BeforeValidator
 
-from moy_sklad_api.models.position import PositionModel, parse_positions
-from moy_sklad_api.utils import extract_id, parse_api_datetime
+from moy_sklad_api.models.position import PositionModel
+from moy_sklad_api.utils import extract_id, extract_rows, parse_api_datetime
 
 
 def _parse_store_id(value: Any) -> str:
@@ -21,7 +21,7 @@ def _parse_store_id(value: Any) -> str:
 
 
 class MoveModel(BaseModel):
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
 
     id: UUID
 
@@ -40,5 +40,5 @@ class MoveModel(BaseModel):
 
     positions: Annotated[
         list[PositionModel],
-        BeforeValidator(parse_positions),
+        BeforeValidator(extract_rows),
     ] = Field(default_factory=list)
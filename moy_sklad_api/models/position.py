@@ -1,37 +1,59 @@
-from typing import Any, Annotated, Callable
+from typing import Any, Annotated, Union
 from uuid import UUID
 
-from pydantic import BaseModel, Field, BeforeValidator
+from pydantic import BaseModel, BeforeValidator, Discriminator, Field, Tag
 
+from moy_sklad_api.models.metadata import MetaModel
 from moy_sklad_api.models.variant import VariantModel
 from moy_sklad_api.models.product import ProductModel
-from moy_sklad_api.utils import parse_rows_as
+from moy_sklad_api.utils import extract_id
 
 
-def parse_assortment(data: dict[str, Any]) -> ProductModel | VariantModel:
-    meta = data.get("meta") or {}
-    entity_type = meta.get("type", "") if isinstance(meta, dict) else ""
+class AssortmentRefModel(BaseModel):
+    """Товар или модификация без expand: в ответе есть только ``meta``."""
 
-    if entity_type == "product":
-        return ProductModel.model_validate(data)
-    if entity_type == "variant":
-        return VariantModel.model_validate(data)
+    model_config = {"extra": "ignore", "defer_build": True}
 
-    raise ValueError(
-        f"Неизвестный тип assortment: '{entity_type}'. Ожидается 'product' или 'variant'."
-    )
+    id: Annotated[UUID, Field(validation_alias="meta"), BeforeValidator(extract_id)]
+    meta: MetaModel
+
+    @property
+    def type(self) -> str:
+        return self.meta.type
+
+
+def _assortment_type(value: Any) -> str | None:
+    # Без expand у assortment нет полей сущности, только meta.
+    if isinstance(value, AssortmentRefModel) or isinstance(value, dict) and "name" not in value:
+        return "reference"
+
+    meta = value.get("meta") if isinstance(value, dict) else getattr(value, "meta", None)
+
+    if isinstance(meta, dict):
+        return meta.get("type")
+
+    return getattr(meta, "type", None)
+
+
+# Выбор модели по meta.type выполняет pydantic, без отдельного model_validate на позицию.
+# Позиции, запрошенные без expand assortment, становятся AssortmentRefModel.
+AssortmentModel = Annotated[
+    Union[
+        Annotated[ProductModel, Tag("product")],
+        Annotated[VariantModel, Tag("variant")],
+        Annotated[AssortmentRefModel, Tag("reference")],
+    ],
+    Discriminator(
+        _assortment_type,
+        custom_error_type="invalid_assortment",
+        custom_error_message="Неизвестный тип assortment. Ожидается 'product', 'variant' или ссылка без expand.",
+    ),
+]
 
 
 class PositionModel(BaseModel):
     id: UUID
     quantity: float
-    assortment: Annotated[
-        ProductModel | VariantModel,
-        Field(validation_alias="assortment"),
-        BeforeValidator(parse_assortment),
-    ]
-
-    model_config = {"populate_by_name": True}
-
+    assortment: Annotated[AssortmentModel, Field(validation_alias="assortment")]
 
-parse_positions: Callable[[Any], list[PositionModel]] = parse_rows_as(PositionModel)
+    model_config = {"populate_by_name": True, "defer_build": True}
@@ -14,4 +14,4 @@ class ProductModel(BaseModel):
     path_name: str | None = Field(default=None, validation_alias="pathName")
     meta: MetaModel
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
@@ -7,5 +7,7 @@ from moy_sklad_api.utils import extract_id
 
 
 class ProductExpandStocksModel(BaseModel):
+    model_config = {"defer_build": True}
+
     product_id: Annotated[UUID, Field(validation_alias="meta"), BeforeValidator(extract_id)]
     quantity: Annotated[float, Field(validation_alias="stock")]
@@ -5,5 +5,7 @@ from pydantic import BaseModel, Field
 
 
 class ProductStocksModel(BaseModel):
+    model_config = {"defer_build": True}
+
     product_id: Annotated[UUID, Field(validation_alias="assortmentId")]
     quantity: Annotated[float, Field(validation_alias="stock")]
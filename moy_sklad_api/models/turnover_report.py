@@ -6,13 +6,13 @@ from uuid import UUID
 from pydantic import BaseModel, Field, BeforeValidator
 
 from moy_sklad_api.models.metadata import MetaModel
-from moy_sklad_api.utils import parse_rows_as, extract_id
+from moy_sklad_api.utils import parse_rows_as, extract_id, validate_rows
 
 
 class TurnoverReportMetricsModel(BaseModel):
     """Показатели onPeriodStart / onPeriodEnd / income / outcome (сумма в копейках, количество)."""
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
 
     cost_sum: Annotated[float, Field(validation_alias="sum", serialization_alias="sum")]
     quantity: float
@@ -21,7 +21,7 @@ class TurnoverReportMetricsModel(BaseModel):
 class TurnoverReportAssortmentModel(BaseModel):
     """Краткое представление товара или модификации в отчёте обороты (с детализацией по складам)."""
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
 
     id: Annotated[UUID, Field(validation_alias="meta"), BeforeValidator(extract_id)]
     meta: MetaModel
@@ -33,7 +33,7 @@ class TurnoverReportAssortmentModel(BaseModel):
 class TurnoverReportStoreRefModel(BaseModel):
     """Ссылка на склад в строке детализации."""
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
 
     id: Annotated[UUID, Field(validation_alias="meta"), BeforeValidator(extract_id)]
     meta: MetaModel
@@ -43,7 +43,7 @@ class TurnoverReportStoreRefModel(BaseModel):
 class TurnoverReportStockByStoreLineModel(BaseModel):
     """Одна строка детализации оборотов по складу."""
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
 
     store: TurnoverReportStoreRefModel
     on_period_start: Annotated[
@@ -62,7 +62,7 @@ def _parse_stock_by_store(value: Any) -> list[TurnoverReportStockByStoreLineMode
     if value is None:
         return []
     if isinstance(value, list):
-        return [TurnoverReportStockByStoreLineModel.model_validate(item) for item in value]
+        return validate_rows(TurnoverReportStockByStoreLineModel, value)
     if isinstance(value, dict):
         return [TurnoverReportStockByStoreLineModel.model_validate(value)]
     msg = f"stockByStore ожидается list или dict, получено {type(value).__name__}"
@@ -72,7 +72,7 @@ def _parse_stock_by_store(value: Any) -> list[TurnoverReportStockByStoreLineMode
 class TurnoverReportByStoreRowModel(BaseModel):
     """Строка отчёта «Обороты по товару с детализацией по складам» (/report/turnover/bystore)."""
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
 
     assortment: TurnoverReportAssortmentModel
     stock_by_store: Annotated[
@@ -15,4 +15,4 @@ class VariantModel(BaseModel):
     product: ProductModel
     meta: MetaModel
 
-    model_config = {"populate_by_name": True, "extra": "ignore"}
+    model_config = {"populate_by_name": True, "extra": "ignore", "defer_build": True}
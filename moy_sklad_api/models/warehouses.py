@@ -6,6 +6,8 @@ from pydantic import BaseModel, Field
 
 class WarehouseModel(BaseModel):
     """Модель склада из МойСклад"""
+    model_config = {"defer_build": True}
+
     id: UUID
     name: str
     code: str | None = None
@@ -0,0 +1,63 @@
+from __future__ import annotations
+
+from functools import lru_cache
+from typing import Any, Iterable, Protocol
+from uuid import UUID
+
+from moy_sklad_api.enums import EntityType, ProductType
+
+ENTITY_BASE_URL = "https://api.moysklad.ru/api/remap/1.2/entity"
+MEDIA_TYPE = "application/json"
+
+
+class _PositionLike(Protocol):
+    product_id: UUID
+    product_type: ProductType
+    quantity: float | int
+
+
+@lru_cache(maxsize=None)
+def _href_templates(entity_type: str) -> tuple[str, str]:
+    return f"{ENTITY_BASE_URL}/{entity_type}/", f"{ENTITY_BASE_URL}/{entity_type}/metadata"
+
+
+@lru_cache(maxsize=65536)
+def meta_ref(entity_type: EntityType | ProductType | str, entity_id: UUID | str) -> dict[str, str]:
+    """``meta`` сущности в формате API, как ``MetaModel.for_entity(...).to_api_dict()``.
+
+    Результат кэшируется и переиспользуется между вызовами — не изменяйте его.
+    """
+    href_prefix, metadata_href = _href_templates(str(entity_type))
+
+    return {
+        "href": f"{href_prefix}{entity_id}",
+        "type": str(entity_type),
+        "mediaType": MEDIA_TYPE,
+        "metadataHref": metadata_href,
+    }
+
+
+def ref(entity_type: EntityType | ProductType | str, entity_id: UUID | str) -> dict[str, Any]:
+    """Ссылка на сущность для тела запроса: ``{"meta": ...}``."""
+    return {"meta": meta_ref(entity_type, entity_id)}
+
+
+def position_rows(positions: Iterable[_PositionLike], *, with_price: bool = False) -> list[dict[str, Any]]:
+    """Строки позиций документа (``quantity``, ``assortment`` и при необходимости ``price``)."""
+    if with_price:
+        return [
+            {
+                "quantity": position.quantity,
+                "price": position.price,  # type: ignore[attr-defined]
+                "assortment": {"meta": meta_ref(position.product_type, position.product_id)},
+            }
+            for position in positions
+        ]
+
+    return [
+        {
+            "quantity": position.quantity,
+            "assortment": {"meta": meta_ref(position.product_type, position.product_id)},
+        }
+        for position in positions
+    ]
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from contextlib import asynccontextmanager
+from hashlib import sha256
+from typing import AsyncIterator, Mapping
+
+from moy_sklad_api.exceptions import MoySkladValidationError
+from moy_sklad_api.loop_local import LoopLocal
+
+# Лимиты МойСклад по умолчанию: 45 запросов за 3 секунды и 5 параллельных запросов
+# от одного пользователя. Фактические значения уточняются по заголовкам ответа.
+DEFAULT_REQUESTS_LIMIT = 45
+DEFAULT_INTERVAL_SECONDS = 3.0
+DEFAULT_MAX_PARALLEL = 5
+
+RATE_LIMIT_HEADER = "X-RateLimit-Limit"
+RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
+RETRY_TIME_INTERVAL_HEADER = "X-Lognex-Retry-TimeInterval"
+RETRY_AFTER_HEADER = "X-Lognex-Retry-After"
+
+
+def _int_header(headers: Mapping[str, str], name: str) -> int | None:
+    value = headers.get(name)
+
+    if value is None:
+        return None
+
+    try:
+        return int(value)
+    except ValueError:
+        return None
+
+
+class RateLimiter:
+    """Token bucket с ограничением числа параллельных запросов.
+
+    Бакет ёмкостью ``limit`` пополняется со скоростью ``limit / interval`` токенов
+    в секунду; каждый запрос забирает один токен. Параметры подстраиваются под
+    заголовки ``X-RateLimit-*`` и ``X-Lognex-Retry-*`` из ответов API.
+    """
+
+    def __init__(
+            self,
+            *,
+            limit: int = DEFAULT_REQUESTS_LIMIT,
+            interval: float = DEFAULT_INTERVAL_SECONDS,
+            max_parallel: int = DEFAULT_MAX_PARALLEL,
+    ) -> None:
+        if limit < 1 or interval <= 0 or max_parallel < 1:
+            raise MoySkladValidationError("Параметры ограничителя запросов должны быть положительными.")
+
+        self._capacity = float(limit)
+        self._rate = limit / interval
+        self._tokens = float(limit)
+        self._updated_at = time.monotonic()
+        self._blocked_until = 0.0
+
+        self._parallel = asyncio.Semaphore(max_parallel)
+        self._lock = asyncio.Lock()
+
+    @property
+    def tokens(self) -> float:
+        self._refill(time.monotonic())
+        return self._tokens
+
+    @asynccontextmanager
+    async def acquire(self) -> AsyncIterator[None]:
+        """Занять слот параллельного запроса и токен на время выполнения запроса."""
+        async with self._parallel:
+            await self._take_token()
+            yield
+
+    def update_from_headers(self, headers: Mapping[str, str]) -> None:
+        limit = _int_header(headers, RATE_LIMIT_HEADER)
+        interval_ms = _int_header(headers, RETRY_TIME_INTERVAL_HEADER)
+        remaining = _int_header(headers, RATE_LIMIT_REMAINING_HEADER)
+
+        now = time.monotonic()
+        self._refill(now)
+
+        if limit is not None and limit > 0:
+            self._capacity = float(limit)
+
+            if interval_ms is not None and interval_ms > 0:
+                self._rate = limit / (interval_ms / 1000)
+
+        if remaining is not None:
+            # Остаток на сервере учитывает запросы всех клиентов с этим токеном.
+            self._tokens = min(self._tokens, float(max(remaining, 0)))
+
+    def pause(self, seconds: float) -> None:
+        """Приостановить выдачу токенов, например после ответа 429."""
+        if seconds <= 0:
+            return
+
+        self._blocked_until = max(self._blocked_until, time.monotonic() + seconds)
+        self._tokens = 0.0
+
+    def pause_from_headers(self, headers: Mapping[str, str]) -> float:
+        """Приостановить выдачу токенов по ``X-Lognex-Retry-After`` и вернуть паузу в секундах."""
+        retry_after_ms = _int_header(headers, RETRY_AFTER_HEADER)
+
+        if retry_after_ms is None:
+            retry_after_ms = _int_header(headers, RETRY_TIME_INTERVAL_HEADER)
+
+        if retry_after_ms is None:
+            return 0.0
+
+        seconds = retry_after_ms / 1000
+        self.pause(seconds)
+        return seconds
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        self._updated_at = now
+
+        if elapsed > 0:
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+
+    async def _take_token(self) -> None:
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self._refill(now)
+
+                wait = self._blocked_until - now
+
+                if wait <= 0:
+                    if self._tokens >= 1:
+                        self._tokens -= 1
+                        return
+
+                    wait = (1 - self._tokens) / self._rate
+
+                await asyncio.sleep(wait)
+
+
+_shared_limiters: LoopLocal[str, RateLimiter] = LoopLocal()
+
+
+def get_shared_rate_limiter(access_token: str) -> RateLimiter:
+    """Общий ограничитель для всех клиентов с одним токеном в текущем event loop.
+
+    Ограничители удаляются из реестра при остановке loop через ``asyncio.run``.
+    """
+    return _shared_limiters.get(sha256(access_token.encode()).hexdigest(), RateLimiter)
@@ -0,0 +1,129 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Mapping
+
+from moy_sklad_api.exceptions import (
+    MoySkladAPIException,
+    MoySkladConnectionError,
+    MoySkladHTTPError,
+    MoySkladValidationError,
+)
+
+logger = logging.getLogger(__name__)
+
+TOO_MANY_REQUESTS = 429
+
+
+def parse_retry_after(headers: Mapping[str, str]) -> float | None:
+    """Пауза перед повтором в секундах из ``X-Lognex-Retry-After`` (мс) или ``Retry-After`` (с)."""
+    lognex_value = headers.get("X-Lognex-Retry-After")
+
+    if lognex_value is not None:
+        try:
+            return max(int(lognex_value), 0) / 1000
+        except ValueError:
+            pass
+
+    value = headers.get("Retry-After")
+
+    if value is not None:
+        try:
+            return max(float(value), 0.0)
+        except ValueError:
+            pass
+
+    return None
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class RetryPolicy:
+    """Политика повторов запросов к API.
+
+    Пауза между попытками — экспоненциальная с полным jitter:
+    ``uniform(0, min(max_delay, base_delay * 2 ** (attempt - 1)))``; если сервер
+    прислал подсказку (``retry_after``), ждём не меньше неё. Повторы прекращаются
+    после ``attempts`` попыток или когда суммарное время превысит ``max_elapsed``.
+
+    Сетевые сбои и статусы ``retry_statuses`` повторяются только для методов из
+    ``retry_methods`` (по умолчанию идемпотентный GET). Ответ 429 повторяется для
+    любого метода: сервер отклоняет такой запрос, не выполняя его.
+    """
+
+    attempts: int = 3
+    base_delay: float = 1.0
+    max_delay: float = 30.0
+    max_elapsed: float | None = 120.0
+    retry_statuses: frozenset[int] = frozenset({TOO_MANY_REQUESTS, 502, 503, 504})
+    retry_methods: frozenset[str] = frozenset({"GET"})
+
+    def __post_init__(self) -> None:
+        if self.attempts < 1:
+            raise MoySkladValidationError("attempts должен быть не меньше 1.")
+
+        if self.base_delay < 0 or self.max_delay < 0:
+            raise MoySkladValidationError("Паузы между повторами не могут быть отрицательными.")
+
+    def backoff(self, attempt: int) -> float:
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+    def is_retryable(self, method: str, error: Exception) -> bool:
+        if isinstance(error, MoySkladHTTPError):
+            if error.status == TOO_MANY_REQUESTS:
+                return error.status in self.retry_statuses
+
+            return error.status in self.retry_statuses and method in self.retry_methods
+
+        if isinstance(error, MoySkladConnectionError):
+            return method in self.retry_methods
+
+        return False
+
+    def delay_for(self, attempt: int, error: Exception) -> float:
+        delay = self.backoff(attempt)
+        retry_after = getattr(error, "retry_after", None)
+
+        if retry_after is not None:
+            delay = max(delay, retry_after)
+
+        return delay
+
+    async def call(self, method: str, func: Callable[[], Awaitable[Any]]) -> Any:
+        started_at = time.monotonic()
+
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return await func()
+
+            except (MoySkladHTTPError, MoySkladConnectionError) as ex:
+                delay = self.delay_for(attempt, ex)
+                elapsed = time.monotonic() - started_at
+
+                give_up = (
+                        not self.is_retryable(method, ex)
+                        or attempt == self.attempts
+                        or (self.max_elapsed is not None and elapsed + delay > self.max_elapsed)
+                )
+
+                if give_up:
+                    if isinstance(ex, MoySkladConnectionError):
+                        raise MoySkladAPIException(str(ex)) from ex
+                    raise
+
+                logger.warning(
+                    "Неуспешная попытка обращения к API. "
+                    "Номер попытки: %s. "
+                    "Таймаут: %.2f секунд. "
+                    "Причина: %s",
+                    attempt,
+                    delay,
+                    ex,
+                )
+
+                await asyncio.sleep(delay)
+
+        raise RuntimeError("unreachable")  # for type checkers
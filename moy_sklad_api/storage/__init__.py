@@ -0,0 +1,10 @@
+from moy_sklad_api.storage.catalog import CATALOG_ENTITIES, CatalogMirror
+from moy_sklad_api.storage.documents import DOCUMENT_ENTITIES, DocumentStore, SyncedRange
+
+__all__ = [
+    "CATALOG_ENTITIES",
+    "CatalogMirror",
+    "DOCUMENT_ENTITIES",
+    "DocumentStore",
+    "SyncedRange",
+]
@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+import asyncio
+import sqlite3
+import threading
+from pathlib import Path
+from typing import Any, Callable, Sequence, TypeVar
+
+from moy_sklad_api.codec import CodecName, JSONCodec, get_codec
+
+T = TypeVar("T")
+
+
+class SQLiteStore:
+    """Общая основа локальных хранилищ на SQLite.
+
+    Запись идёт в отдельном потоке (``asyncio.to_thread``), чтобы загрузка больших
+    страниц не блокировала event loop; чтение локальное и быстрое, поэтому
+    выполняется синхронно. Соединение общее, поэтому чтение и транзакции записи
+    разделены замком: чтение не попадает внутрь незавершённой записи и ждёт не
+    дольше одной транзакции. Строки хранятся в исходном JSON ответа API.
+    """
+
+    _SCHEMA: str = ""
+
+    def __init__(self, path: str | Path = ":memory:", *, codec: JSONCodec | CodecName = "auto") -> None:
+        self._codec = get_codec(codec) if isinstance(codec, str) else codec
+        self._lock = asyncio.Lock()
+        self._connection_lock = threading.Lock()
+        self._connection = sqlite3.connect(str(path), check_same_thread=False, isolation_level=None)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(self._SCHEMA)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def close(self) -> None:
+        with self._connection_lock:
+            self._connection.close()
+
+    def _read(self, query: str, params: Sequence[Any] = ()) -> list[tuple[Any, ...]]:
+        """Выполнить запрос на чтение и вернуть все строки."""
+        with self._connection_lock:
+            return self._connection.execute(query, params).fetchall()
+
+    async def _write(self, fn: Callable[..., T], *args: Any) -> T:
+        """Выполнить ``fn(connection, *args)`` в транзакции в отдельном потоке."""
+        async with self._lock:
+            return await asyncio.to_thread(self._transaction, fn, *args)
+
+    def _transaction(self, fn: Callable[..., T], *args: Any) -> T:
+        connection = self._connection
+
+        with self._connection_lock:
+            connection.execute("BEGIN")
+
+            try:
+                result = fn(connection, *args)
+            except BaseException:
+                connection.execute("ROLLBACK")
+                raise
+
+            connection.execute("COMMIT")
+            return result
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import aclosing
+from datetime import datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Iterable, Mapping
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from moy_sklad_api.cache import entity_key
+from moy_sklad_api.codec import CodecName, JSONCodec
+from moy_sklad_api.enums import EntityType
+from moy_sklad_api.exceptions import MoySkladValidationError
+from moy_sklad_api.models import ProductModel, VariantModel
+from moy_sklad_api.models.bundle import BundleModel
+from moy_sklad_api.storage.base import SQLiteStore
+from moy_sklad_api.utils import parse_api_datetime
+
+if TYPE_CHECKING:
+    from moy_sklad_api.client import MoySkladAPIClient
+
+CatalogModel = ProductModel | VariantModel | BundleModel
+
+CATALOG_ENTITIES: tuple[EntityType, ...] = (EntityType.PRODUCT, EntityType.MODIFICATION, EntityType.BUNDLE)
+
+_MODELS: dict[EntityType, type[BaseModel]] = {
+    EntityType.PRODUCT: ProductModel,
+    EntityType.MODIFICATION: VariantModel,
+    EntityType.BUNDLE: BundleModel,
+}
+
+# Те же expand, что у iter_products / iter_variants / iter_bundles: модели ждут вложенные сущности.
+_EXPANDS: dict[EntityType, str | None] = {
+    EntityType.PRODUCT: None,
+    EntityType.MODIFICATION: "product",
+    EntityType.BUNDLE: "components.assortment.product",
+}
+
+
+def _path_name(entity_type: EntityType, row: Mapping[str, Any]) -> str | None:
+    # У модификации нет своей группы — берётся группа товара.
+    if entity_type == EntityType.MODIFICATION:
+        product = row.get("product")
+        return product.get("pathName") if isinstance(product, Mapping) else None
+
+    return row.get("pathName")
+
+
+class CatalogMirror(SQLiteStore):
+    """Локальная копия каталога: товары, модификации и комплекты.
+
+    Первая синхронизация загружает все сущности, включая архивные; следующие —
+    только изменённые с последнего ``updated`` (high-water mark). Поиск по id,
+    коду и группе выполняется по локальной базе без запросов к API.
+
+    Удаления через ``updated`` не видны: для их учёта периодически вызывайте
+    ``sync(full=True)``.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS catalog_entities (
+            entity_type TEXT NOT NULL,
+            id TEXT NOT NULL,
+            code TEXT,
+            path_name TEXT,
+            archived INTEGER NOT NULL,
+            updated TEXT NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (entity_type, id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS catalog_entities_code ON catalog_entities (entity_type, code);
+        CREATE INDEX IF NOT EXISTS catalog_entities_path ON catalog_entities (entity_type, path_name);
+        CREATE TABLE IF NOT EXISTS catalog_sync_state (
+            entity_type TEXT PRIMARY KEY,
+            high_water TEXT NOT NULL
+        );
+    """
+
+    def __init__(
+            self,
+            client: MoySkladAPIClient,
+            path: str | Path = ":memory:",
+            *,
+            codec: JSONCodec | CodecName = "auto",
+    ) -> None:
+        super().__init__(path, codec=codec)
+        self._client = client
+
+    def high_water(self, entity_type: EntityType) -> datetime | None:
+        """Наибольший ``updated`` среди загруженных сущностей типа."""
+        rows = self._read(
+            "SELECT high_water FROM catalog_sync_state WHERE entity_type = ?",
+            (str(entity_type),),
+        )
+
+        return parse_api_datetime(rows[0][0]) if rows else None
+
+    async def sync(
+            self,
+            entity_types: Iterable[EntityType] = CATALOG_ENTITIES,
+            *,
+            full: bool = False,
+    ) -> dict[EntityType, int]:
+        """Догрузить изменения и вернуть число обновлённых записей по типам.
+
+        ``full=True`` заново загружает тип целиком и удаляет из копии сущности,
+        которых больше нет в МойСклад.
+        """
+        counts: dict[EntityType, int] = {}
+
+        for entity_type in entity_types:
+            counts[entity_type] = await self._sync_entity(self._check_type(entity_type), full=full)
+
+        return counts
+
+    async def _sync_entity(self, entity_type: EntityType, *, full: bool) -> int:
+        # Фильтр updated секундный и включительный: граничные сущности придут
+        # повторно и просто перезапишутся.
+        since = None if full else self.high_water(entity_type)
+        seen_ids: set[str] = set()
+        high_water: str | None = None
+        count = 0
+
+        pages = self._client.iter_changed_pages(entity_type, updated_since=since, expand=_EXPANDS[entity_type])
+
+        async with aclosing(pages) as pages:
+            async for rows in pages:
+                records = [self._record(entity_type, row) for row in rows]
+
+                if not records:
+                    continue
+
+                page_high_water = max(record[5] for record in records)
+                high_water = page_high_water if high_water is None else max(high_water, page_high_water)
+
+                if full:
+                    seen_ids.update(record[1] for record in records)
+
+                await self._write(self._upsert, records)
+                count += len(records)
+
+        if full:
+            await self._write(self._delete_missing, str(entity_type), seen_ids)
+
+        if high_water is not None:
+            await self._write(self._store_high_water, str(entity_type), high_water)
+
+        return count
+
+    def _record(self, entity_type: EntityType, row: Mapping[str, Any]) -> tuple[Any, ...]:
+        return (
+            str(entity_type),
+            row["id"],
+            row.get("code"),
+            _path_name(entity_type, row),
+            int(bool(row.get("archived", False))),
+            row["updated"],
+            self._codec.dumps(row),
+        )
+
+    @staticmethod
+    def _upsert(connection: sqlite3.Connection, records: list[tuple[Any, ...]]) -> None:
+        connection.executemany(
+            "INSERT OR REPLACE INTO catalog_entities "
+            "(entity_type, id, code, path_name, archived, updated, data) VALUES (?, ?, ?, ?, ?, ?, ?)",
+            records,
+        )
+
+    @staticmethod
+    def _delete_missing(connection: sqlite3.Connection, entity_type: str, seen_ids: set[str]) -> None:
+        stored = connection.execute("SELECT id FROM catalog_entities WHERE entity_type = ?", (entity_type,))
+        missing = [(entity_type, entity_id) for (entity_id,) in stored.fetchall() if entity_id not in seen_ids]
+
+        connection.executemany("DELETE FROM catalog_entities WHERE entity_type = ? AND id = ?", missing)
+
+    @staticmethod
+    def _store_high_water(connection: sqlite3.Connection, entity_type: str, high_water: str) -> None:
+        connection.execute(
+            "INSERT INTO catalog_sync_state (entity_type, high_water) VALUES (?, ?) "
+            "ON CONFLICT (entity_type) DO UPDATE SET high_water = max(high_water, excluded.high_water)",
+            (entity_type, high_water),
+        )
+
+    def get_by_id(self, entity_type: EntityType, entity_id: UUID | str) -> CatalogModel | None:
+        # id хранится как в ответе API; entity_key приводит к тому же виду, что и кэш клиента.
+        rows = self._read(
+            "SELECT data FROM catalog_entities WHERE entity_type = ? AND id = ?",
+            (str(self._check_type(entity_type)), entity_key(entity_id)),
+        )
+
+        return _MODELS[entity_type].model_validate_json(rows[0][0]) if rows else None
+
+    def get_by_code(self, entity_type: EntityType, code: str) -> CatalogModel | None:
+        rows = self._read(
+            "SELECT data FROM catalog_entities WHERE entity_type = ? AND code = ? LIMIT 1",
+            (str(self._check_type(entity_type)), code),
+        )
+
+        return _MODELS[entity_type].model_validate_json(rows[0][0]) if rows else None
+
+    def get_by_path(
+            self,
+            entity_type: EntityType,
+            path_name: str,
+            *,
+            recursive: bool = False,
+            include_archived: bool = False,
+    ) -> list[CatalogModel]:
+        """Сущности группы ``path_name``; ``recursive`` добавляет вложенные группы."""
+        model = _MODELS[self._check_type(entity_type)]
+        query = "SELECT data FROM catalog_entities WHERE entity_type = ? AND (path_name = ?"
+        params: list[Any] = [str(entity_type), path_name]
+
+        if recursive:
+            query += " OR substr(path_name, 1, ?) = ?"
+            prefix = f"{path_name}/"
+            params += [len(prefix), prefix]
+
+        query += ")"
+
+        if not include_archived:
+            query += " AND archived = 0"
+
+        return [model.model_validate_json(data) for (data,) in self._read(query, params)]
+
+    @staticmethod
+    def _check_type(entity_type: EntityType) -> EntityType:
+        if entity_type not in _MODELS:
+            raise MoySkladValidationError(f"Тип '{entity_type}' не входит в каталог.")
+
+        return entity_type
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import sqlite3
+from contextlib import aclosing
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Mapping
+from uuid import UUID
+
+from pydantic import BaseModel
+
+from moy_sklad_api.cache import entity_key
+from moy_sklad_api.codec import CodecName, JSONCodec
+from moy_sklad_api.enums import EntityType
+from moy_sklad_api.exceptions import MoySkladValidationError
+from moy_sklad_api.filter import Filter
+from moy_sklad_api.models import LossModel, MoveModel
+from moy_sklad_api.models.compact import inventory_row, loss_row, move_row
+from moy_sklad_api.models.inventory import InventoryModel
+from moy_sklad_api.storage.base import SQLiteStore
+from moy_sklad_api.utils import convert_to_project_timezone, extract_id, parse_api_datetime
+
+if TYPE_CHECKING:
+    from moy_sklad_api.client import MoySkladAPIClient
+
+DOCUMENT_ENTITIES: tuple[EntityType, ...] = (EntityType.MOVE, EntityType.INVENTORY, EntityType.LOSS)
+
+_MODELS: dict[EntityType, type[BaseModel]] = {
+    EntityType.MOVE: MoveModel,
+    EntityType.INVENTORY: InventoryModel,
+    EntityType.LOSS: LossModel,
+}
+
+_COMPACT_ROWS: dict[EntityType, Callable[[Mapping], Any]] = {
+    EntityType.MOVE: move_row,
+    EntityType.INVENTORY: inventory_row,
+    EntityType.LOSS: loss_row,
+}
+
+# Поля документа со ссылкой на склад: у перемещения их два.
+_WAREHOUSE_FIELDS: dict[EntityType, tuple[str, ...]] = {
+    EntityType.MOVE: ("sourceStore", "targetStore"),
+    EntityType.INVENTORY: ("store",),
+    EntityType.LOSS: ("store",),
+}
+
+# Запас на расхождение часов и задержку индексации updated на стороне API.
+_UPDATED_SAFETY_MARGIN = timedelta(minutes=1)
+_SECOND = timedelta(seconds=1)
+
+
+@dataclass(frozen=True, slots=True)
+class SyncedRange:
+    """Период по ``moment`` (границы включительно), выгруженный в момент ``synced_at``."""
+
+    start: datetime
+    end: datetime
+    synced_at: datetime
+
+
+def _moment_key(value: datetime) -> str:
+    # Формат фильтров API; ``moment`` документа хранится в нём же, без миллисекунд.
+    return Filter.format_value(value)
+
+
+def _warehouse_ids(entity_type: EntityType, row: Mapping[str, Any]) -> set[str]:
+    warehouse_ids: set[str] = set()
+
+    for field in _WAREHOUSE_FIELDS[entity_type]:
+        value = row.get(field)
+
+        if isinstance(value, Mapping) and isinstance(value.get("meta"), Mapping):
+            warehouse_ids.add(extract_id(value["meta"]))
+
+    return warehouse_ids
+
+
+class DocumentStore(SQLiteStore):
+    """Локальное хранилище перемещений, инвентаризаций и списаний.
+
+    Хранилище помнит, какие периоды по ``moment`` уже выгружены и когда. При
+    ``sync`` непокрытые части периода загружаются целиком, а покрытые — только
+    документами, изменёнными после прошлой выгрузки. ``query`` отвечает по
+    локальной базе с индексами по ``moment`` и складу.
+
+    Удаления документов через ``updated`` не видны: для их учёта выгрузите
+    период заново с ``full=True``.
+    """
+
+    _SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            entity_type TEXT NOT NULL,
+            id TEXT NOT NULL,
+            moment TEXT NOT NULL,
+            updated TEXT NOT NULL,
+            data BLOB NOT NULL,
+            PRIMARY KEY (entity_type, id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS documents_moment ON documents (entity_type, moment);
+        CREATE TABLE IF NOT EXISTS document_warehouses (
+            entity_type TEXT NOT NULL,
+            warehouse_id TEXT NOT NULL,
+            moment TEXT NOT NULL,
+            document_id TEXT NOT NULL,
+            PRIMARY KEY (entity_type, warehouse_id, moment, document_id)
+        ) WITHOUT ROWID;
+        CREATE INDEX IF NOT EXISTS document_warehouses_document
+            ON document_warehouses (entity_type, document_id);
+        CREATE TABLE IF NOT EXISTS synced_ranges (
+            entity_type TEXT NOT NULL,
+            range_start TEXT NOT NULL,
+            range_end TEXT NOT NULL,
+            synced_at TEXT NOT NULL,
+            PRIMARY KEY (entity_type, range_start)
+        ) WITHOUT ROWID;
+    """
+
+    def __init__(
+            self,
+            client: MoySkladAPIClient,
+            path: str | Path = ":memory:",
+            *,
+            codec: JSONCodec | CodecName = "auto",
+    ) -> None:
+        super().__init__(path, codec=codec)
+        self._client = client
+
+    def synced_ranges(self, entity_type: EntityType) -> list[SyncedRange]:
+        rows = self._read(
+            "SELECT range_start, range_end, synced_at FROM synced_ranges WHERE entity_type = ? ORDER BY range_start",
+            (str(self._check_type(entity_type)),),
+        )
+
+        return [
+            SyncedRange(parse_api_datetime(start), parse_api_datetime(end), parse_api_datetime(synced_at))
+            for start, end, synced_at in rows
+        ]
+
+    async def sync(
+            self,
+            entity_type: EntityType,
+            from_date: datetime,
+            to_date: datetime,
+            *,
+            full: bool = False,
+    ) -> int:
+        """Догрузить документы за период и вернуть число записанных документов."""
+        self._check_type(entity_type)
+        from_date = convert_to_project_timezone(from_date).replace(microsecond=0)
+        to_date = convert_to_project_timezone(to_date).replace(microsecond=0)
+
+        if from_date > to_date:
+            raise MoySkladValidationError("Начало периода позже конца.")
+
+        started_at = convert_to_project_timezone(datetime.now().astimezone()).replace(microsecond=0)
+        overlapping = [] if full else [
+            synced for synced in self.synced_ranges(entity_type)
+            if synced.start <= to_date and synced.end >= from_date
+        ]
+        seen_ids: set[str] | None = set() if full else None
+        count = 0
+        cursor = from_date
+
+        for synced in overlapping:
+            if synced.start > cursor:
+                count += await self._load(entity_type, cursor, synced.start - _SECOND)
+
+            count += await self._load(
+                entity_type,
+                max(synced.start, from_date),
+                min(synced.end, to_date),
+                updated_since=synced.synced_at - _UPDATED_SAFETY_MARGIN,
+            )
+            cursor = max(cursor, synced.end + _SECOND)
+
+        if cursor <= to_date:
+            count += await self._load(entity_type, cursor, to_date, seen_ids=seen_ids)
+
+        if seen_ids is not None:
+            await self._write(
+                self._delete_missing,
+                str(entity_type),
+                _moment_key(from_date),
+                _moment_key(to_date),
+                seen_ids,
+            )
+
+        await self._write(self._record_range, str(entity_type), from_date, to_date, started_at)
+
+        return count
+
+    async def _load(
+            self,
+            entity_type: EntityType,
+            from_date: datetime,
+            to_date: datetime,
+            *,
+            updated_since: datetime | None = None,
+            seen_ids: set[str] | None = None,
+    ) -> int:
+        count = 0
+        pages = self._client.iter_changed_documents(
+            entity_type,
+            from_date=from_date,
+            to_date=to_date,
+            updated_since=updated_since,
+        )
+
+        async with aclosing(pages) as pages:
+            async for rows in pages:
+                if not rows:
+                    continue
+
+                await self._write(self._upsert, entity_type, [self._record(row) for row in rows])
+                count += len(rows)
+
+                if seen_ids is not None:
+                    seen_ids.update(row["id"] for row in rows)
+
+        return count
+
+    def _record(self, row: Mapping[str, Any]) -> tuple[Any, ...]:
+        return row["id"], row["moment"][:19], row["updated"], row, self._codec.dumps(row)
+
+    @staticmethod
+    def _upsert(connection: sqlite3.Connection, entity_type: EntityType, records: list[tuple[Any, ...]]) -> None:
+        connection.executemany(
+            "INSERT OR REPLACE INTO documents (entity_type, id, moment, updated, data) VALUES (?, ?, ?, ?, ?)",
+            [(str(entity_type), document_id, moment, updated, data) for document_id, moment, updated, _, data in records],
+        )
+        # Склад и moment документа могли измениться — индекс складов пересобирается.
+        connection.executemany(
+            "DELETE FROM document_warehouses WHERE entity_type = ? AND document_id = ?",
+            [(str(entity_type), record[0]) for record in records],
+        )
+        connection.executemany(
+            "INSERT OR IGNORE INTO document_warehouses (entity_type, warehouse_id, moment, document_id) "
+            "VALUES (?, ?, ?, ?)",
+            [
+                (str(entity_type), warehouse_id, moment, document_id)
+                for document_id, moment, _, row, _ in records
+                for warehouse_id in _warehouse_ids(entity_type, row)
+            ],
+        )
+
+    @staticmethod
+    def _delete_missing(
+            connection: sqlite3.Connection,
+            entity_type: str,
+            start: str,
+            end: str,
+            seen_ids: set[str],
+    ) -> None:
+        # Документы периода, которых не было в полной выгрузке, удалены в МойСклад.
+        stored = connection.execute(
+            "SELECT id FROM documents WHERE entity_type = ? AND moment BETWEEN ? AND ?",
+            (entity_type, start, end),
+        )
+        missing = [(entity_type, document_id) for (document_id,) in stored.fetchall() if document_id not in seen_ids]
+
+        connection.executemany("DELETE FROM documents WHERE entity_type = ? AND id = ?", missing)
+        connection.executemany("DELETE FROM document_warehouses WHERE entity_type = ? AND document_id = ?", missing)
+
+    @staticmethod
+    def _record_range(
+            connection: sqlite3.Connection,
+            entity_type: str,
+            start: datetime,
+            end: datetime,
+            synced_at: datetime,
+    ) -> None:
+        """Записать период ``[start, end]``, обрезав пересекающиеся с ним старые периоды."""
+        overlapping = connection.execute(
+            "SELECT range_start, range_end, synced_at FROM synced_ranges "
+            "WHERE entity_type = ? AND range_start <= ? AND range_end >= ?",
+            (entity_type, _moment_key(end), _moment_key(start)),
+        ).fetchall()
+
+        connection.execute(
+            "DELETE FROM synced_ranges WHERE entity_type = ? AND range_start <= ? AND range_end >= ?",
+            (entity_type, _moment_key(end), _moment_key(start)),
+        )
+
+        ranges = [(_moment_key(start), _moment_key(end), _moment_key(synced_at))]
+
+        for old_start, old_end, old_synced_at in overlapping:
+            if old_start < _moment_key(start):
+                ranges.append((old_start, _moment_key(start - _SECOND), old_synced_at))
+
+            if old_end > _moment_key(end):
+                ranges.append((_moment_key(end + _SECOND), old_end, old_synced_at))
+
+        connection.executemany(
+            "INSERT INTO synced_ranges (entity_type, range_start, range_end, synced_at) VALUES (?, ?, ?, ?)",
+            [(entity_type, *synced) for synced in ranges],
+        )
+
+    def query(
+            self,
+            entity_type: EntityType,
+            from_date: datetime,
+            to_date: datetime,
+            *,
+            warehouse_id: UUID | str | None = None,
+            compact: bool = False,
+    ) -> list[Any]:
+        """Документы из локальной базы с ``moment`` в периоде, по возрастанию ``moment``.
+
+        ``warehouse_id`` оставляет документы склада (для перемещений — склада
+        отправителя или получателя); ``compact`` возвращает компактные строки.
+        """
+        self._check_type(entity_type)
+        params: list[Any] = [str(entity_type)]
+
+        if warehouse_id is None:
+            query = "SELECT data FROM documents WHERE entity_type = ? AND moment BETWEEN ? AND ? ORDER BY moment"
+        else:
+            query = (
+                "SELECT d.data FROM document_warehouses AS w "
+                "JOIN documents AS d ON d.entity_type = w.entity_type AND d.id = w.document_id "
+                "WHERE w.entity_type = ? AND w.warehouse_id = ? AND w.moment BETWEEN ? AND ? ORDER BY w.moment"
+            )
+            params.append(entity_key(warehouse_id))
+
+        params += [_moment_key(from_date), _moment_key(to_date)]
+        rows = self._read(query, params)
+
+        if compact:
+            row_factory = _COMPACT_ROWS[entity_type]
+            return [row_factory(self._codec.loads(data)) for (data,) in rows]
+
+        model = _MODELS[entity_type]
+        return [model.model_validate_json(data) for (data,) in rows]
+
+    @staticmethod
+    def _check_type(entity_type: EntityType) -> EntityType:
+        if entity_type not in _MODELS:
+            raise MoySkladValidationError(f"Тип '{entity_type}' не поддерживается хранилищем документов.")
+
+        return entity_type
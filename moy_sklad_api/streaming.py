@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import re
+from typing import Any, AsyncIterable, AsyncIterator
+
+from moy_sklad_api.codec import JSONCodec
+from moy_sklad_api.exceptions import MoySkladAPIException
+
+# Внутри строки значимы только кавычка и обратный слеш, вне строки — структура JSON.
+_STRUCTURAL = re.compile(rb'["\\\[\]{},]')
+_WHITESPACE = b" \t\r\n"
+
+
+class _ArrayScanner:
+    """Инкрементальный поиск элементов JSON-массива в потоке байт.
+
+    Массив — либо корень документа (``key=None``), либо значение ключа ``key``
+    корневого объекта (например ``rows``). В буфере хранится только текущий
+    незавершённый элемент, поэтому память не зависит от размера ответа.
+    """
+
+    def __init__(self, key: str | None) -> None:
+        self._key = key.encode() if key is not None else None
+        self._buffer = bytearray()
+        self._scan_pos = 0
+        self._depth = 0
+        self._in_string = False
+        self._skip_until = 0
+        self._string_start = -1
+        self._expect_key = False
+        self._last_key: bytes | None = None
+        self._array_depth: int | None = None
+        self._item_start = -1
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def feed(self, chunk: bytes) -> list[bytearray]:
+        self._buffer += chunk
+        items: list[bytearray] = []
+        buffer = self._buffer
+
+        for match in _STRUCTURAL.finditer(buffer, self._scan_pos):
+            pos = match.start()
+
+            if pos < self._skip_until:
+                continue
+
+            char = buffer[pos]
+
+            if self._in_string:
+                if char == 0x5C:  # \
+                    self._skip_until = pos + 2
+                elif char == 0x22:  # "
+                    self._in_string = False
+                    if self._depth == 1 and self._expect_key:
+                        self._last_key = bytes(buffer[self._string_start + 1:pos])
+                        self._expect_key = False
+                    self._string_start = -1
+                continue
+
+            if self._done:
+                break
+
+            if char == 0x22:
+                self._in_string = True
+                self._string_start = pos
+                self._mark_item_start(pos)
+
+            elif char in (0x7B, 0x5B):  # { [
+                self._mark_item_start(pos)
+                self._depth += 1
+
+                if self._depth == 1:
+                    if char == 0x7B:
+                        self._expect_key = True
+                    elif self._key is None:
+                        self._array_depth = 1
+
+                elif self._depth == 2 and char == 0x5B and self._key is not None and self._last_key == self._key:
+                    self._array_depth = 2
+
+            elif char in (0x7D, 0x5D):  # } ]
+                if char == 0x5D and self._depth == self._array_depth:
+                    self._finish_item(pos, items)
+                    self._array_depth = None
+                    self._done = True
+
+                self._depth -= 1
+
+            elif char == 0x2C:  # ,
+                if self._depth == self._array_depth:
+                    self._finish_item(pos, items)
+                elif self._depth == 1:
+                    self._expect_key = True
+
+        self._scan_pos = len(buffer)
+        self._compact()
+        return items
+
+    def _mark_item_start(self, pos: int) -> None:
+        if self._item_start < 0 and self._array_depth is not None and self._depth == self._array_depth:
+            self._item_start = pos
+
+    def _finish_item(self, pos: int, items: list[bytearray]) -> None:
+        start = self._item_start
+
+        if start < 0:
+            # Скаляр без кавычек и скобок (число, true/false/null).
+            start = self._last_boundary(pos)
+
+        item = self._buffer[start:pos].strip(_WHITESPACE)
+
+        if item:
+            items.append(item)
+
+        self._item_start = -1
+
+    def _last_boundary(self, pos: int) -> int:
+        buffer = self._buffer
+        start = pos
+
+        while start > 0 and buffer[start - 1] not in b"[,":
+            start -= 1
+
+        return start
+
+    def _compact(self) -> None:
+        if self._item_start >= 0:
+            keep_from = self._item_start
+        elif self._string_start >= 0:
+            keep_from = self._string_start
+        elif self._array_depth is not None:
+            # Возможен незавершённый скаляр после последней запятой.
+            keep_from = max(self._buffer.rfind(b",", 0, self._scan_pos), self._buffer.rfind(b"[", 0, self._scan_pos))
+            keep_from = keep_from + 1 if keep_from >= 0 else 0
+        else:
+            keep_from = self._scan_pos
+
+        if keep_from <= 0:
+            return
+
+        del self._buffer[:keep_from]
+        self._scan_pos -= keep_from
+        self._skip_until = max(self._skip_until - keep_from, 0)
+
+        if self._item_start >= 0:
+            self._item_start -= keep_from
+
+        if self._string_start >= 0:
+            self._string_start -= keep_from
+
+
+async def iter_json_array(
+        chunks: AsyncIterable[bytes],
+        codec: JSONCodec,
+        *,
+        key: str | None = None,
+) -> AsyncIterator[Any]:
+    """Разобрать элементы JSON-массива по мере поступления байт из ``chunks``.
+
+    ``key=None`` — массив в корне документа, иначе массив в ключе ``key`` корневого
+    объекта. Каждый элемент декодируется ``codec`` отдельно.
+    """
+    scanner = _ArrayScanner(key)
+
+    async for chunk in chunks:
+        for item in scanner.feed(chunk):
+            yield codec.loads(item)
+
+        if scanner.done:
+            return
+
+    if not scanner.done:
+        raise MoySkladAPIException("Ответ API оборвался до конца JSON-массива.")
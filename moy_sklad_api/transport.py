@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from moy_sklad_api.exceptions import MoySkladValidationError
+from moy_sklad_api.loop_local import LoopLocal
+from moy_sklad_api.metrics import create_trace_config
+
+if TYPE_CHECKING:
+    import aiohttp
+
+
+@dataclass(frozen=True, slots=True, kw_only=True)
+class TransportConfig:
+    """Настройки пула соединений ``aiohttp.TCPConnector``.
+
+    ``preconnect`` — сколько соединений открыть заранее при входе в ``async with``
+    клиента, чтобы первые запросы не ждали DNS и TLS-рукопожатия.
+    """
+
+    limit: int = 100
+    limit_per_host: int = 20
+    keepalive_timeout: float = 60.0
+    ttl_dns_cache: int | None = 300
+    request_timeout: float | None = 300.0
+    preconnect: int = 0
+
+    def __post_init__(self) -> None:
+        if self.limit < 0 or self.limit_per_host < 0 or self.preconnect < 0:
+            raise MoySkladValidationError("Лимиты соединений не могут быть отрицательными.")
+
+    def create_session(self) -> aiohttp.ClientSession:
+        # aiohttp импортируется при создании первой сессии: импорт клиента его не тянет.
+        import aiohttp
+
+        connector = aiohttp.TCPConnector(
+            limit=self.limit,
+            limit_per_host=self.limit_per_host,
+            keepalive_timeout=self.keepalive_timeout,
+            ttl_dns_cache=self.ttl_dns_cache,
+            use_dns_cache=self.ttl_dns_cache is not None,
+        )
+
+        # Трассировка заполняет время соединения и TTFB только для запросов с
+        # RequestTimer, то есть когда у клиента включены метрики.
+        return aiohttp.ClientSession(
+            connector=connector,
+            timeout=aiohttp.ClientTimeout(total=self.request_timeout),
+            trace_configs=[create_trace_config()],
+        )
+
+
+DEFAULT_TRANSPORT = TransportConfig()
+
+async def _close_session(session: aiohttp.ClientSession) -> None:
+    if not session.closed:
+        await session.close()
+
+
+_shared_sessions: LoopLocal[TransportConfig, aiohttp.ClientSession] = LoopLocal(_close_session)
+
+
+def get_shared_session(config: TransportConfig = DEFAULT_TRANSPORT) -> aiohttp.ClientSession:
+    """Общая сессия для всех клиентов с одинаковыми настройками в текущем event loop.
+
+    Соединения (и кэш DNS) переиспользуются между экземплярами клиента, поэтому
+    короткоживущие клиенты не платят за повторное TLS-рукопожатие. Сессии
+    закрываются при остановке loop через ``asyncio.run`` или явно через
+    ``close_shared_sessions``.
+    """
+    return _shared_sessions.get(config, config.create_session, stale=lambda session: session.closed)
+
+
+async def close_shared_sessions() -> None:
+    """Закрыть общие сессии текущего event loop (например, при остановке приложения)."""
+    sessions = _shared_sessions.pop(asyncio.get_running_loop())
+
+    for session in sessions.values():
+        if not session.closed:
+            await session.close()
+
+
+async def preconnect_session(session: aiohttp.ClientSession, url: str, connections: int = 1) -> None:
+    """Открыть ``connections`` соединений с хостом ``url`` и вернуть их в пул.
+
+    Статус ответа не важен: нужны только установленные keep-alive соединения.
+    """
+
+    import aiohttp
+
+    async def warm_up() -> None:
+        try:
+            async with session.head(url) as response:
+                await response.release()
+        except aiohttp.ClientError:
+            pass
+
+    await asyncio.gather(*(warm_up() for _ in range(connections)))
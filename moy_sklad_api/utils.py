@@ -1,24 +1,26 @@
 from __future__ import annotations
 
-import asyncio
-import inspect
-import logging
 import os
 from datetime import datetime, timezone, timedelta
-from functools import wraps
-from typing import Any, Callable, TypeVar
+from functools import cache
+from typing import Any, Callable, Iterable, TypeVar
 from uuid import UUID
 
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
-from moy_sklad_api.exceptions import MoySkladValidationError, MoySkladConnectionError, MoySkladAPIException
+from moy_sklad_api.exceptions import MoySkladValidationError, MoySkladAPIException
 
 PROJECT_TIMEZONE = timezone(timedelta(hours=3))
 
 T = TypeVar("T", bound=BaseModel)
-ClsT = TypeVar("ClsT", bound=type)
 
-logger = logging.getLogger(__name__)
+
+@cache
+def load_env() -> None:
+    """Подхватить ``.env`` один раз за процесс (уже заданные переменные не перезаписываются)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
 
 
 def get_required_env(var_name: str) -> str:
@@ -69,6 +71,31 @@ def extract_id(data: dict):
     return entity_without_filter
 
 
+@cache
+def list_adapter(model: type[T]) -> TypeAdapter[list[T]]:
+    """Закэшированный ``TypeAdapter(list[model])`` для валидации списка одним вызовом."""
+    return TypeAdapter(list[model])
+
+
+def validate_rows(model: type[T], rows: Iterable[Any]) -> list[T]:
+    """Провалидировать строки ответа пачкой, без Python-вызова на каждую строку."""
+    if not isinstance(rows, list):
+        rows = list(rows)
+
+    return list_adapter(model).validate_python(rows)
+
+
+def extract_rows(value: Any) -> list[Any]:
+    """Достать ``rows`` из вложенной коллекции API; валидацию строк выполняет pydantic."""
+    if isinstance(value, dict):
+        rows = value.get("rows", [])
+        if isinstance(rows, list):
+            return rows
+    if isinstance(value, list):
+        return value
+    return []
+
+
 def parse_rows_as(model: type[T]) -> Callable[[Any], list[T]]:
     def _parse(value: Any) -> list[T]:
         if value is None:
@@ -76,56 +103,7 @@ def parse_rows_as(model: type[T]) -> Callable[[Any], list[T]]:
         if isinstance(value, dict):
             rows = value.get("rows", [])
             if isinstance(rows, list):
-                return [model.model_validate(item) for item in rows]
+                return validate_rows(model, rows)
         return []
 
     return _parse
-
-
-def tries(times: int, timeout: int) -> Callable[[ClsT], ClsT]:
-    """Повтор запросов при сетевых сбоях для всех вызовов HTTP через класс клиента."""
-
-    def _retry_async_method(func: Callable[..., Any]) -> Callable[..., Any]:
-        @wraps(func)
-        async def wrapper(*args: Any, **kwargs: Any) -> Any:
-            for attempt in range(1, times + 1):
-                try:
-                    return await func(*args, **kwargs)
-
-                except MoySkladConnectionError as ex:
-                    logger.warning(
-                        "Неуспешная попытка обращения к API. "
-                        "Номер попытки: %s. "
-                        "Таймаут: %s секунд",
-                        attempt,
-                        timeout,
-                    )
-
-                    if attempt == times:
-                        raise MoySkladAPIException() from ex
-
-                    await asyncio.sleep(timeout)
-
-            raise RuntimeError("unreachable")  # for type checkers
-
-        return wrapper
-
-    def class_decorator(cls: type) -> type:
-        body = cls.__dict__
-        target = body.get("_async_request")
-        if target is not None and inspect.iscoroutinefunction(target):
-            setattr(cls, "_async_request", _retry_async_method(target))
-            return cls
-
-        skip = frozenset({"close"})
-        for name, attr in body.items():
-            if name.startswith("__") or name in skip:
-                continue
-            if isinstance(attr, (staticmethod, classmethod, property)):
-                continue
-            if inspect.iscoroutinefunction(attr):
-                setattr(cls, name, _retry_async_method(attr))
-
-        return cls
-
-    return class_decorator
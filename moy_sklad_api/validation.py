@@ -0,0 +1,259 @@
+"""Уровень проверки типов во время выполнения.
+
+* ``strict`` — как раньше: beartype проверяет каждый вызов публичных методов
+  клиента и каждое создание DTO.
+* ``boundary`` — DTO создаются без проверок; методы клиента проверяют аргументы,
+  а документы и позиции пачки проверяются целиком одним проходом на входе в
+  ``create_*`` (``check_batch``).
+* ``off`` — проверок нет.
+
+Уровень общий для процесса. Он задаётся ``set_validation_level`` или
+переменной ``MOY_SKLAD_VALIDATION``, которая читается при создании первого
+клиента (или при первом ``get_validation_level``). До этого действует ``strict``.
+Переключение подменяет методы классов, поэтому выключенная проверка не стоит
+ничего: вызывается исходная функция без обёртки.
+"""
+
+from __future__ import annotations
+
+import collections.abc
+import dataclasses
+import enum
+import os
+import types
+import typing
+from functools import cache
+from typing import Any, Callable, Iterable, Iterator, TypeVar
+
+from beartype import beartype
+from beartype.door import is_bearable
+
+from moy_sklad_api.exceptions import MoySkladValidationError
+
+T = TypeVar("T")
+
+VALIDATION_ENV = "MOY_SKLAD_VALIDATION"
+
+# Коллекции, элементы которых check_batch проверяет по одному.
+_COLLECTIONS = (list, collections.abc.Iterable, collections.abc.Sequence)
+
+
+class ValidationLevel(enum.StrEnum):
+    STRICT = "strict"
+    BOUNDARY = "boundary"
+    OFF = "off"
+
+
+@dataclasses.dataclass(frozen=True, slots=True)
+class _Checked:
+    owner: type
+    name: str
+    unchecked: Any
+    checked: Any
+    per_object: bool
+
+    def install(self, level: ValidationLevel) -> None:
+        enabled = level is ValidationLevel.STRICT or (level is ValidationLevel.BOUNDARY and not self.per_object)
+        setattr(self.owner, self.name, self.checked if enabled else self.unchecked)
+
+
+_registry: list[_Checked] = []
+_level: ValidationLevel | None = None
+
+
+class _CheckedMethod:
+    """Метка метода до создания класса; в ``__set_name__`` заменяется активной версией."""
+
+    def __init__(self, function: Any) -> None:
+        self._unchecked = function
+        self._checked = beartype(function)
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        entry = _Checked(owner, name, self._unchecked, self._checked, per_object=False)
+        _registry.append(entry)
+        entry.install(_current_level())
+
+
+def runtime_checked(obj: T) -> T:
+    """Замена ``@beartype``, управляемая уровнем проверки.
+
+    Для класса (DTO) проверяется ``__init__`` — это проверка на каждый объект,
+    она работает только в ``strict``. Для метода (в том числе поверх
+    ``@staticmethod``) — проверка вызова, она работает в ``strict`` и ``boundary``.
+    """
+    if isinstance(obj, type):
+        unchecked_init = obj.__init__
+        checked_init = beartype(obj).__init__
+        entry = _Checked(obj, "__init__", unchecked_init, checked_init, per_object=True)
+        _registry.append(entry)
+        entry.install(_current_level())
+        return obj
+
+    return _CheckedMethod(obj)  # type: ignore[return-value]
+
+
+def _current_level() -> ValidationLevel:
+    return ValidationLevel.STRICT if _level is None else _level
+
+
+def get_validation_level() -> ValidationLevel:
+    """Текущий уровень; при первом вызове учитывает ``MOY_SKLAD_VALIDATION``."""
+    if _level is None:
+        # utils тянет pydantic; DTO импортируют этот модуль и без него.
+        from moy_sklad_api.utils import load_env
+
+        load_env()
+        set_validation_level(os.getenv(VALIDATION_ENV, "").strip().lower() or ValidationLevel.STRICT)
+
+    return _level
+
+
+def set_validation_level(level: ValidationLevel | str) -> None:
+    global _level
+
+    try:
+        level = ValidationLevel(level)
+    except ValueError:
+        choices = ", ".join(ValidationLevel)
+        raise MoySkladValidationError(f"Неизвестный уровень проверки '{level}', ожидается одно из: {choices}.") from None
+
+    _level = level
+
+    for entry in _registry:
+        entry.install(level)
+
+
+def check_batch(values: Iterable[Any], hint: Any, *, name: str = "values") -> None:
+    """Проверить пачку DTO целиком (вложенные позиции — тоже) на уровне ``boundary``.
+
+    На других уровнях ничего не делает: в ``strict`` объекты уже проверены при
+    создании, в ``off`` проверки выключены. Ошибка указывает путь к полю,
+    например ``documents[3].positions[12].quantity``. Генераторы и другие
+    одноразовые итераторы не проверяются.
+    """
+    # Одноразовый итератор не перебираем: его содержимое нужно вызывающему.
+    if _level is not ValidationLevel.BOUNDARY or isinstance(values, Iterator):
+        return
+
+    check = _checker(hint)
+
+    for index, value in enumerate(values):
+        try:
+            check(value)
+        except _Mismatch as error:
+            expected = getattr(error.hint, "__name__", None) or repr(error.hint)
+            raise MoySkladValidationError(
+                f"{name}[{index}]{error.path}: ожидается {expected}, "
+                f"получено {type(error.value).__name__} ({error.value!r:.80})."
+            ) from None
+
+
+class _Mismatch(Exception):
+    """Несовпадение типа; путь к полю собирается при раскрутке стека."""
+
+    def __init__(self, value: Any, hint: Any) -> None:
+        super().__init__()
+        self.value = value
+        self.hint = hint
+        self.path = ""
+
+
+@cache
+def _checker(hint: Any) -> Callable[[Any], None]:
+    """Проверка значения по подсказке, собранная один раз на тип."""
+    origin = typing.get_origin(hint)
+
+    if origin in _COLLECTIONS:
+        return _collection_checker(hint, origin)
+
+    if dataclasses.is_dataclass(hint):
+        return _dataclass_checker(hint)
+
+    classes = _plain_classes(hint)
+
+    if classes is not None:
+        def check_instance(value: Any) -> None:
+            if not isinstance(value, classes):
+                raise _Mismatch(value, hint)
+
+        return check_instance
+
+    def check_bearable(value: Any) -> None:
+        if not is_bearable(value, hint):
+            raise _Mismatch(value, hint)
+
+    return check_bearable
+
+
+def _collection_checker(hint: Any, origin: type) -> Callable[[Any], None]:
+    check_item = _checker(typing.get_args(hint)[0])
+
+    def check_collection(value: Any) -> None:
+        if not isinstance(value, origin):
+            raise _Mismatch(value, hint)
+
+        if isinstance(value, Iterator):
+            return
+
+        for index, item in enumerate(value):
+            try:
+                check_item(item)
+            except _Mismatch as error:
+                error.path = f"[{index}]{error.path}"
+                raise
+
+    return check_collection
+
+
+def _dataclass_checker(cls: type) -> Callable[[Any], None]:
+    hints = typing.get_type_hints(cls)
+    # Поля-классы проверяются прямо в цикле, без вызова вложенной проверки.
+    plain: list[tuple[str, tuple[type, ...]]] = []
+    nested: list[tuple[str, Callable[[Any], None]]] = []
+
+    for field in dataclasses.fields(cls):
+        classes = _plain_classes(hints[field.name])
+
+        if classes is not None:
+            plain.append((field.name, classes))
+        else:
+            nested.append((field.name, _checker(hints[field.name])))
+
+    def check_dataclass(value: Any) -> None:
+        if not isinstance(value, cls):
+            raise _Mismatch(value, cls)
+
+        for field_name, classes in plain:
+            field_value = getattr(value, field_name)
+
+            if not isinstance(field_value, classes):
+                error = _Mismatch(field_value, hints[field_name])
+                error.path = f".{field_name}"
+                raise error
+
+        for field_name, check in nested:
+            try:
+                check(getattr(value, field_name))
+            except _Mismatch as error:
+                error.path = f".{field_name}{error.path}"
+                raise
+
+    return check_dataclass
+
+
+@cache
+def _plain_classes(hint: Any) -> tuple[type, ...] | None:
+    """Классы для ``isinstance``, если подсказка — класс или объединение классов."""
+    if hint is Any:
+        return (object,)
+
+    if isinstance(hint, type) and typing.get_origin(hint) is None and not dataclasses.is_dataclass(hint):
+        return (hint,)
+
+    if isinstance(hint, types.UnionType) or typing.get_origin(hint) is typing.Union:
+        args = typing.get_args(hint)
+
+        if all(isinstance(arg, type) and typing.get_origin(arg) is None for arg in args):
+            return args
+
+    return None